@@ -8,6 +8,7 @@ from flask_sqlalchemy import SQLAlchemy
 from flask_migrate import Migrate
 from flask_cors import CORS
 from flask_restx import Api, Resource, fields, Namespace
+from sqlalchemy.engine import make_url
 import os
 from datetime import datetime
 from dotenv import load_dotenv
@@ -25,6 +26,19 @@ app.config['SQLALCHEMY_DATABASE_URI'] = os.getenv('DATABASE_URL', 'mysql+pymysql
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 app.config['SQLALCHEMY_ECHO'] = False  # Set to True to see SQL queries
 
+# Connection pool - endpoints like /api/members/with-tasks issue several queries per request,
+# so size the pool for concurrent requests and keep recently used connections warm (LIFO).
+# SQLite (e.g. the test suite) gets its own pool class that takes no sizing options
+engine_options = {'pool_pre_ping': True}  # Drop stale connections before use
+if make_url(app.config['SQLALCHEMY_DATABASE_URI']).get_backend_name() != 'sqlite':
+    engine_options.update({
+        'pool_size': int(os.getenv('DB_POOL_SIZE', '20')),
+        'max_overflow': int(os.getenv('DB_MAX_OVERFLOW', '40')),
+        'pool_recycle': int(os.getenv('DB_POOL_RECYCLE', '1800')),  # Below MySQL wait_timeout
+        'pool_use_lifo': True
+    })
+app.config['SQLALCHEMY_ENGINE_OPTIONS'] = engine_options
+
 # Initialize extensions
 db.init_app(app)
 migrate = Migrate(app, db)
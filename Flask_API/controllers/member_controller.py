@@ -5,7 +5,8 @@ HTTP request handling for member operations
 
 from flask import Blueprint, request, jsonify
 from services.member_service import MemberService
-from mappers.member_mapper import MemberMapper, TaskMapper
+from mappers.member_mapper import MemberMapper, TaskMapper, parse_columns, to_partial_dict
+from models.member_model import Member
 
 member_bp = Blueprint('members', __name__)
 
@@ -16,16 +17,29 @@ def get_members():
         # Optional filter for active members only
         active_only = request.args.get('active_only', 'false').lower() == 'true'
         
+        # Optional column selection, e.g. ?columns=id,username
+        only = parse_columns(request.args.get('columns'), Member)
+        
         if active_only:
-            members = MemberService.get_active_members()
+            members = MemberService.get_active_members(only=only)
+        else:
+            members = MemberService.get_all_members(only=only)
+        
+        if only:
+            data = [to_partial_dict(member, only) for member in members]
         else:
-            members = MemberService.get_all_members()
+            data = MemberMapper.to_list_dict(members)
         
         return jsonify({
             'success': True,
-            'data': MemberMapper.to_list_dict(members),
+            'data': data,
             'count': len(members)
         }), 200
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'message': str(e)
+        }), 400
     except Exception as e:
         return jsonify({
             'success': False,
@@ -6,6 +6,8 @@ HTTP request handling for task operations
 from flask import Blueprint, request, jsonify
 from services.task_service import TaskService
 from services.member_service import MemberService
+from mappers.member_mapper import parse_columns, to_partial_dict
+from models.task_model import Task
 from datetime import datetime
 
 task_bp = Blueprint('tasks', __name__)
@@ -20,20 +22,33 @@ def get_tasks():
         member_id = request.args.get('member_id', type=int)
         include_items = request.args.get('include_items', 'false').lower() == 'true'
         
+        # Optional column selection, e.g. ?columns=id,title,status (ignores include_items)
+        only = parse_columns(request.args.get('columns'), Task)
+        
         if member_id:
-            tasks = TaskService.get_tasks_by_member(member_id)
+            tasks = TaskService.get_tasks_by_member(member_id, only=only)
         elif status:
-            tasks = TaskService.get_tasks_by_status(status)
+            tasks = TaskService.get_tasks_by_status(status, only=only)
         elif priority:
-            tasks = TaskService.get_tasks_by_priority(priority)
+            tasks = TaskService.get_tasks_by_priority(priority, only=only)
+        else:
+            tasks = TaskService.get_all_tasks(only=only)
+        
+        if only:
+            data = [to_partial_dict(task, only) for task in tasks]
         else:
-            tasks = TaskService.get_all_tasks()
+            data = [task.to_dict(include_items=include_items) for task in tasks]
         
         return jsonify({
             'success': True,
-            'data': [task.to_dict(include_items=include_items) for task in tasks],
+            'data': data,
             'count': len(tasks)
         }), 200
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'message': str(e)
+        }), 400
     except Exception as e:
         return jsonify({
             'success': False,
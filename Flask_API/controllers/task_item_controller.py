@@ -6,6 +6,8 @@ HTTP request handling for task item operations
 from flask import Blueprint, request, jsonify
 from services.task_item_service import TaskItemService
 from services.task_service import TaskService
+from mappers.member_mapper import TaskItemMapper, parse_columns, to_partial_dict
+from models.task_item_model import TaskItem
 
 task_item_bp = Blueprint('task_items', __name__)
 
@@ -16,25 +18,62 @@ def get_task_items():
         task_id = request.args.get('task_id', type=int)
         completed = request.args.get('completed')
         
+        # Optional column selection, e.g. ?columns=id,title,is_completed
+        only = parse_columns(request.args.get('columns'), TaskItem)
+        
         if task_id and completed is not None:
             if completed.lower() == 'true':
-                items = TaskItemService.get_completed_items(task_id)
+                items = TaskItemService.get_completed_items(task_id, only=only)
             else:
-                items = TaskItemService.get_pending_items(task_id)
+                items = TaskItemService.get_pending_items(task_id, only=only)
         elif task_id:
-            items = TaskItemService.get_items_by_task(task_id)
+            items = TaskItemService.get_items_by_task(task_id, only=only)
         elif completed is not None:
             if completed.lower() == 'true':
-                items = TaskItemService.get_completed_items()
+                items = TaskItemService.get_completed_items(only=only)
             else:
-                items = TaskItemService.get_pending_items()
+                items = TaskItemService.get_pending_items(only=only)
         else:
-            items = TaskItemService.get_all_task_items()
+            # Unfiltered list: stream plain rows instead of building ORM objects
+            items = None
+            data = TaskItemMapper.rows_to_list_dict(TaskItemService.stream_all_task_items(only=only))
+        
+        if items is not None:
+            if only:
+                data = [to_partial_dict(item, only) for item in items]
+            else:
+                data = [item.to_dict() for item in items]
+        
+        return jsonify({
+            'success': True,
+            'data': data,
+            'count': len(data)
+        }), 200
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'message': str(e)
+        }), 400
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'message': str(e)
+        }), 500
+
+@task_item_bp.route('/grouped', methods=['GET'])
+def get_task_items_grouped():
+    """Get completed and pending task items in one call"""
+    try:
+        task_id = request.args.get('task_id', type=int)
+        grouped = TaskItemService.get_items_grouped_by_status(task_id)
         
         return jsonify({
             'success': True,
-            'data': [item.to_dict() for item in items],
-            'count': len(items)
+            'data': {
+                'completed': TaskItemMapper.to_list_dict(grouped['completed']),
+                'pending': TaskItemMapper.to_list_dict(grouped['pending'])
+            },
+            'count': len(grouped['completed']) + len(grouped['pending'])
         }), 200
     except Exception as e:
         return jsonify({
@@ -103,6 +142,36 @@ def create_task_item():
             'message': str(e)
         }), 500
 
+@task_item_bp.route('/bulk', methods=['POST'])
+def bulk_create_task_items():
+    """Create many task items in a single batch"""
+    try:
+        data = request.get_json()
+        items = data.get('items') if isinstance(data, dict) else None
+        
+        # Validate shape and required fields (a non-list or non-object item is a client error)
+        if (not items or not isinstance(items, list)
+                or not all(isinstance(item, dict) and item.get('title') and item.get('task_id')
+                           for item in items)):
+            return jsonify({
+                'success': False,
+                'message': 'items with title and task_id are required'
+            }), 400
+        
+        created = TaskItemService.bulk_create_task_items(items)
+        
+        return jsonify({
+            'success': True,
+            'count': created,
+            'message': 'Task items created successfully'
+        }), 201
+        
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'message': str(e)
+        }), 500
+
 @task_item_bp.route('/<int:item_id>', methods=['PUT'])
 def update_task_item(item_id):
     """Update task item by ID"""
@@ -3,11 +3,46 @@ Member Mapper for Flask API
 Converts SQLAlchemy models to JSON-serializable dictionaries
 """
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable, Optional, Tuple
+from datetime import datetime
+from sqlalchemy.engine import Row
 from models.member_model import Member
 from models.task_model import Task
 from models.task_item_model import TaskItem
 
+# Columns a client may select with ?columns=, i.e. the keys each mapper's to_dict exposes
+# (never internal columns such as Member.password_hash)
+SELECTABLE_COLUMNS = {
+    Member: ('id', 'username', 'email', 'first_name', 'last_name', 'is_active',
+             'created_at', 'updated_at'),
+    Task: ('id', 'title', 'description', 'priority', 'status', 'due_date',
+           'created_at', 'updated_at', 'member_id'),
+    TaskItem: ('id', 'title', 'description', 'is_completed', 'order',
+               'created_at', 'updated_at', 'completed_at', 'task_id'),
+}
+
+def parse_columns(columns: Optional[str], model) -> Optional[Tuple[str, ...]]:
+    """
+    Parse a comma-separated ?columns= value into selectable column names of the given model
+    Raises ValueError for unknown or non-selectable column names
+    """
+    if not columns:
+        return None
+    only = tuple(c.strip() for c in columns.split(',') if c.strip())
+    allowed = SELECTABLE_COLUMNS[model]
+    unknown = [c for c in only if c not in allowed]
+    if unknown:
+        raise ValueError(f"Unknown columns: {', '.join(unknown)}")
+    return only or None
+
+def to_partial_dict(obj, columns: Tuple[str, ...]) -> Dict[str, Any]:
+    """Convert only the given (load_only) columns of a model to a dictionary"""
+    data = {}
+    for column in columns:
+        value = getattr(obj, column)
+        data[column] = value.isoformat() if isinstance(value, datetime) else value
+    return data
+
 class MemberMapper:
     
     @staticmethod
@@ -165,3 +200,12 @@ class TaskItemMapper:
     def to_list_dict(items: List[TaskItem]) -> List[Dict[str, Any]]:
         """Convert list of TaskItem models to list of dictionaries"""
         return [TaskItemMapper.to_dict(item) for item in items]
+    
+    @staticmethod
+    def rows_to_list_dict(rows: Iterable[Row]) -> List[Dict[str, Any]]:
+        """Convert column rows (e.g. from TaskItemService.stream_all_task_items) to list of dictionaries"""
+        return [
+            {key: value.isoformat() if isinstance(value, datetime) else value
+             for key, value in row._mapping.items()}
+            for row in rows
+        ]
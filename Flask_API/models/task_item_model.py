@@ -8,6 +8,10 @@ from datetime import datetime
 
 class TaskItem(db.Model):
     __tablename__ = 'task_items'
+    __table_args__ = (
+        # Supports get_items_by_task: filter by task_id, ordered by 'order'
+        db.Index('ix_task_items_task_order', 'task_id', 'order'),
+    )
     
     id = db.Column(db.Integer, primary_key=True, autoincrement=True)
     title = db.Column(db.String(200), nullable=True)
@@ -7,15 +7,26 @@ from models.member_model import Member
 from models.task_model import Task
 from models.task_item_model import TaskItem
 from database import db 
-from typing import List, Optional
-from sqlalchemy.orm import joinedload
+from typing import List, Optional, Tuple
+from sqlalchemy.orm import joinedload, load_only
+
+# Columns that update_* may set (computed once instead of hasattr() per kwarg)
+_UPDATABLE_FIELDS = frozenset(Member.__table__.columns.keys()) - {'id'}
 
 class MemberService:
     
     @staticmethod
-    def get_all_members() -> List[Member]:
+    def _list_query(only: Optional[Tuple[str, ...]] = None):
+        """Base query for list endpoints, loading only the given columns if provided"""
+        query = Member.query
+        if only:
+            query = query.options(load_only(*[getattr(Member, c) for c in only]))
+        return query
+    
+    @staticmethod
+    def get_all_members(only: Optional[Tuple[str, ...]] = None) -> List[Member]:
         """Get all members"""
-        return Member.query.all()
+        return MemberService._list_query(only).all()
     
     @staticmethod
     def get_all_members_with_tasks_and_items() -> List[Member]:
@@ -40,9 +51,9 @@ class MemberService:
         return Member.query.filter_by(username=username).first()
     
     @staticmethod
-    def get_active_members() -> List[Member]:
+    def get_active_members(only: Optional[Tuple[str, ...]] = None) -> List[Member]:
         """Get all active members"""
-        return Member.query.filter_by(is_active=True).all()
+        return MemberService._list_query(only).filter_by(is_active=True).all()
     
     @staticmethod
     def create_member(username: str, email: str, first_name: str = None, 
@@ -65,7 +76,7 @@ class MemberService:
         member = Member.query.get(member_id)
         if member:
             for key, value in kwargs.items():
-                if hasattr(member, key) and key != 'id':
+                if key in _UPDATABLE_FIELDS:
                     setattr(member, key, value)
             db.session.commit()
         return member
@@ -6,42 +6,75 @@ Business logic for task item operations
 from models.task_item_model import TaskItem
 from models.task_model import Task
 from database import db 
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
+from sqlalchemy import insert, select
+from sqlalchemy.engine import Result
+from sqlalchemy.orm import load_only
+
+# Columns that update_* may set (computed once instead of hasattr() per kwarg)
+_UPDATABLE_FIELDS = frozenset(TaskItem.__table__.columns.keys()) - {'id'}
 
 class TaskItemService:
     
     @staticmethod
-    def get_all_task_items() -> List[TaskItem]:
-        """Get all task items"""
-        return TaskItem.query.all()
+    def _list_query(only: Optional[Tuple[str, ...]] = None):
+        """Base query for list endpoints, loading only the given columns if provided"""
+        query = TaskItem.query
+        if only:
+            query = query.options(load_only(*[getattr(TaskItem, c) for c in only]))
+        return query
+    
+    @staticmethod
+    def stream_all_task_items(only: Optional[Tuple[str, ...]] = None) -> Result:
+        """
+        Stream all task items as plain column rows (no ORM objects) in batches
+        Use TaskItemMapper.rows_to_list_dict() to serialize the result
+        """
+        columns = [getattr(TaskItem, c) for c in only] if only else list(TaskItem.__table__.columns)
+        stmt = select(*columns).execution_options(yield_per=1000)
+        return db.session.execute(stmt)
     
     @staticmethod
     def get_task_item_by_id(item_id: int) -> Optional[TaskItem]:
         """Get task item by ID"""
         return TaskItem.query.get(item_id)
     
-    @staticmethod
-    def get_items_by_task(task_id: int) -> List[TaskItem]:
+    @classmethod
+    def get_items_by_task(cls, task_id: int, only: Optional[Tuple[str, ...]] = None) -> List[TaskItem]:
         """Get all items for a specific task, ordered by 'order' field"""
-        return TaskItem.query.filter_by(task_id=task_id).order_by(TaskItem.order).all()
+        return cls._list_query(only).filter_by(task_id=task_id).order_by(TaskItem.order).all()
     
-    @staticmethod
-    def get_completed_items(task_id: int = None) -> List[TaskItem]:
+    @classmethod
+    def get_completed_items(cls, task_id: int = None, only: Optional[Tuple[str, ...]] = None) -> List[TaskItem]:
         """Get completed items, optionally filtered by task"""
-        query = TaskItem.query.filter_by(is_completed=True)
+        query = cls._list_query(only).filter_by(is_completed=True)
         if task_id:
             query = query.filter_by(task_id=task_id)
         return query.all()
     
-    @staticmethod
-    def get_pending_items(task_id: int = None) -> List[TaskItem]:
+    @classmethod
+    def get_pending_items(cls, task_id: int = None, only: Optional[Tuple[str, ...]] = None) -> List[TaskItem]:
         """Get pending (not completed) items, optionally filtered by task"""
-        query = TaskItem.query.filter_by(is_completed=False)
+        query = cls._list_query(only).filter_by(is_completed=False)
         if task_id:
             query = query.filter_by(task_id=task_id)
         return query.all()
     
+    @staticmethod
+    def get_items_grouped_by_status(task_id: int = None) -> Dict[str, List[TaskItem]]:
+        """
+        Get completed and pending items in a single query, optionally filtered by task
+        Returns: {'completed': [...], 'pending': [...]}
+        """
+        query = TaskItem.query
+        if task_id:
+            query = query.filter_by(task_id=task_id)
+        grouped = {'completed': [], 'pending': []}
+        for item in query.all():
+            grouped['completed' if item.is_completed else 'pending'].append(item)
+        return grouped
+    
     @staticmethod
     def create_task_item(title: str, task_id: int, description: str = None, 
                         order: int = 0) -> TaskItem:
@@ -56,13 +89,36 @@ class TaskItemService:
         db.session.commit()
         return item
     
+    @staticmethod
+    def bulk_create_task_items(items: List[Dict]) -> int:
+        """
+        Create many task items in one executemany round-trip
+        items: list of dicts with 'title', 'task_id' and optional 'description', 'order'
+        Returns the number of inserted rows
+        """
+        if not items:
+            return 0
+        rows = [
+            {
+                'title': item['title'],
+                'description': item.get('description'),
+                'task_id': item['task_id'],
+                'order': item.get('order', 0)
+            }
+            for item in items
+        ]
+        # Core insert with a parameter list -> DBAPI executemany (PyMySQL batches it into multi-row INSERTs)
+        result = db.session.execute(insert(TaskItem.__table__), rows)
+        db.session.commit()
+        return result.rowcount
+    
     @staticmethod
     def update_task_item(item_id: int, **kwargs) -> Optional[TaskItem]:
         """Update task item by ID"""
         item = TaskItem.query.get(item_id)
         if item:
             for key, value in kwargs.items():
-                if hasattr(item, key) and key != 'id':
+                if key in _UPDATABLE_FIELDS:
                     setattr(item, key, value)
             db.session.commit()
         return item
@@ -6,15 +6,27 @@ Business logic for task operations
 from models.task_model import Task
 from models.member_model import Member
 from database import db 
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from datetime import datetime
+from sqlalchemy.orm import load_only
+
+# Columns that update_* may set (computed once instead of hasattr() per kwarg)
+_UPDATABLE_FIELDS = frozenset(Task.__table__.columns.keys()) - {'id'}
 
 class TaskService:
     
     @staticmethod
-    def get_all_tasks(include_items: bool = False) -> List[Task]:
+    def _list_query(only: Optional[Tuple[str, ...]] = None):
+        """Base query for list endpoints, loading only the given columns if provided"""
+        query = Task.query
+        if only:
+            query = query.options(load_only(*[getattr(Task, c) for c in only]))
+        return query
+    
+    @classmethod
+    def get_all_tasks(cls, include_items: bool = False, only: Optional[Tuple[str, ...]] = None) -> List[Task]:
         """Get all tasks"""
-        tasks = Task.query.all()
+        tasks = cls._list_query(only).all()
         return tasks
     
     @staticmethod
@@ -22,20 +34,20 @@ class TaskService:
         """Get task by ID"""
         return Task.query.get(task_id)
     
-    @staticmethod
-    def get_tasks_by_member(member_id: int) -> List[Task]:
+    @classmethod
+    def get_tasks_by_member(cls, member_id: int, only: Optional[Tuple[str, ...]] = None) -> List[Task]:
         """Get tasks by member ID"""
-        return Task.query.filter_by(member_id=member_id).all()
+        return cls._list_query(only).filter_by(member_id=member_id).all()
     
-    @staticmethod
-    def get_tasks_by_status(status: str) -> List[Task]:
+    @classmethod
+    def get_tasks_by_status(cls, status: str, only: Optional[Tuple[str, ...]] = None) -> List[Task]:
         """Get tasks by status"""
-        return Task.query.filter_by(status=status).all()
+        return cls._list_query(only).filter_by(status=status).all()
     
-    @staticmethod
-    def get_tasks_by_priority(priority: str) -> List[Task]:
+    @classmethod
+    def get_tasks_by_priority(cls, priority: str, only: Optional[Tuple[str, ...]] = None) -> List[Task]:
         """Get tasks by priority"""
-        return Task.query.filter_by(priority=priority).all()
+        return cls._list_query(only).filter_by(priority=priority).all()
     
     @staticmethod
     def create_task(title: str, member_id: int, description: str = None, 
@@ -60,7 +72,7 @@ class TaskService:
         task = Task.query.get(task_id)
         if task:
             for key, value in kwargs.items():
-                if hasattr(task, key) and key != 'id':
+                if key in _UPDATABLE_FIELDS:
                     setattr(task, key, value)
             db.session.commit()
         return task
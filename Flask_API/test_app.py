@@ -2,27 +2,56 @@
 Simple tests for Flask API
 """
 
+import os
 import unittest
 import json
+
+# app builds its engine at import time (db.init_app), so point it at SQLite first
+os.environ['DATABASE_URL'] = 'sqlite:///:memory:'
+
 from app import app, db
-from models.user_model import User
+from models.member_model import Member
 from models.task_model import Task
 
 class FlaskAPITestCase(unittest.TestCase):
     
-    def setUp(self):
-        """Set up test client and database"""
+    @classmethod
+    def setUpClass(cls):
+        """Create the schema once for the whole test case"""
         app.config['TESTING'] = True
-        app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
-        self.app = app.test_client()
         with app.app_context():
             db.create_all()
     
-    def tearDown(self):
-        """Clean up after tests"""
+    @classmethod
+    def tearDownClass(cls):
+        """Drop the schema after all tests have run"""
         with app.app_context():
             db.drop_all()
     
+    def setUp(self):
+        """Set up test client and run each test inside a transaction"""
+        self.app = app.test_client()
+        self.app_context = app.app_context()
+        self.app_context.push()
+        
+        # Bind the session to one connection with an outer transaction; commits made
+        # by the code under test only release SAVEPOINTs inside it
+        self.connection = db.engine.connect()
+        self.transaction = self.connection.begin()
+        self._original_session = db.session
+        db.session = db._make_scoped_session({
+            'bind': self.connection,
+            'join_transaction_mode': 'create_savepoint'
+        })
+    
+    def tearDown(self):
+        """Roll back everything the test wrote instead of dropping the schema"""
+        db.session.remove()
+        db.session = self._original_session
+        self.transaction.rollback()
+        self.connection.close()
+        self.app_context.pop()
+    
     def test_hello_world(self):
         """Test hello world endpoint"""
         response = self.app.get('/')
@@ -37,24 +66,24 @@ class FlaskAPITestCase(unittest.TestCase):
         data = json.loads(response.data)
         self.assertEqual(data['status'], 'healthy')
     
-    def test_create_user(self):
-        """Test user creation"""
-        user_data = {
-            'name': 'Test User',
+    def test_create_member(self):
+        """Test member creation"""
+        member_data = {
+            'username': 'testuser',
             'email': 'test@example.com',
-            'nickname': 'testuser'
+            'first_name': 'Test'
         }
-        response = self.app.post('/api/users/', 
-                               data=json.dumps(user_data),
+        response = self.app.post('/api/members/', 
+                               data=json.dumps(member_data),
                                content_type='application/json')
         self.assertEqual(response.status_code, 201)
         data = json.loads(response.data)
         self.assertTrue(data['success'])
-        self.assertEqual(data['data']['name'], 'Test User')
+        self.assertEqual(data['data']['username'], 'testuser')
     
-    def test_get_users(self):
-        """Test getting all users"""
-        response = self.app.get('/api/users/')
+    def test_get_members(self):
+        """Test getting all members"""
+        response = self.app.get('/api/members/')
         self.assertEqual(response.status_code, 200)
         data = json.loads(response.data)
         self.assertTrue(data['success'])
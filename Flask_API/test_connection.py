@@ -6,6 +6,7 @@ Run this to verify your Flask app can connect to the database
 from dotenv import load_dotenv
 load_dotenv()  # Load .env file before importing app
 
+from sqlalchemy import text
 from app import app, db
 from models.member_model import Member
 from models.task_model import Task
@@ -24,35 +25,42 @@ def test_connection():
             print("✓ Database connection successful!")
             print(f"  Database URI: {app.config['SQLALCHEMY_DATABASE_URI']}")
             
+            # Count all three tables in a single round-trip
+            member_count, task_count, item_count = db.session.execute(text(
+                "SELECT (SELECT COUNT(*) FROM members), "
+                "(SELECT COUNT(*) FROM tasks), "
+                "(SELECT COUNT(*) FROM task_items)"
+            )).one()
+            
             # Test querying members
             print("\n--- Testing Members Table ---")
-            members = Member.query.limit(5).all()
-            print(f"✓ Found {Member.query.count()} members in database")
-            if members:
-                print(f"  Sample member: {members[0].username} ({members[0].email})")
+            print(f"✓ Found {member_count} members in database")
+            if member_count:
+                member = Member.query.first()
+                print(f"  Sample member: {member.username} ({member.email})")
             
             # Test querying tasks
             print("\n--- Testing Tasks Table ---")
-            tasks = Task.query.limit(5).all()
-            print(f"✓ Found {Task.query.count()} tasks in database")
-            if tasks:
-                print(f"  Sample task: {tasks[0].title} (Priority: {tasks[0].priority})")
+            print(f"✓ Found {task_count} tasks in database")
+            if task_count:
+                task = Task.query.first()
+                print(f"  Sample task: {task.title} (Priority: {task.priority})")
             
             # Test querying task items
             print("\n--- Testing Task Items Table ---")
-            items = TaskItem.query.limit(5).all()
-            print(f"✓ Found {TaskItem.query.count()} task items in database")
-            if items:
-                print(f"  Sample item: {items[0].title} (Completed: {items[0].is_completed})")
+            print(f"✓ Found {item_count} task items in database")
+            if item_count:
+                item = TaskItem.query.first()
+                print(f"  Sample item: {item.title} (Completed: {item.is_completed})")
             
             # Test relationships
             print("\n--- Testing Relationships ---")
-            if members and tasks:
+            if member_count and task_count:
                 member_with_tasks = Member.query.filter(Member.tasks.any()).first()
                 if member_with_tasks:
                     print(f"✓ Member '{member_with_tasks.username}' has {len(member_with_tasks.tasks)} tasks")
             
-            if tasks and items:
+            if task_count and item_count:
                 task_with_items = Task.query.filter(Task.task_items.any()).first()
                 if task_with_items:
                     print(f"✓ Task '{task_with_items.title}' has {len(task_with_items.task_items)} items")
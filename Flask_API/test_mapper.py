@@ -5,6 +5,11 @@ Demonstrates how mappers convert SQLAlchemy objects to JSON-serializable diction
 
 import requests
 import json
+from requests.adapters import HTTPAdapter
+
+# Shared session so every request reuses keep-alive connections to the local server
+SESSION = requests.Session()
+SESSION.mount('http://', HTTPAdapter(pool_connections=10, pool_maxsize=20))
 
 def test_mapper_endpoints():
     """Test all endpoints that use the mapper system"""
@@ -26,7 +31,7 @@ def test_mapper_endpoints():
             print(f"🔍 Testing: {name}")
             print(f"   URL: {url}")
             
-            response = requests.get(url)
+            response = SESSION.get(url)
             
             if response.status_code == 200:
                 data = response.json()
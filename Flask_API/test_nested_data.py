@@ -5,6 +5,11 @@ Demonstrates how to get all members with their tasks and task details
 
 import requests
 import json
+from requests.adapters import HTTPAdapter
+
+# Shared session so every request reuses keep-alive connections to the local server
+SESSION = requests.Session()
+SESSION.mount('http://', HTTPAdapter(pool_connections=10, pool_maxsize=20))
 
 def test_members_with_tasks():
     """Test the new endpoint that returns members with tasks and task details"""
@@ -16,7 +21,7 @@ def test_members_with_tasks():
     try:
         # Test the new endpoint
         url = "http://localhost:5000/api/members/with-tasks"
-        response = requests.get(url)
+        response = SESSION.get(url)
         
         if response.status_code == 200:
             data = response.json()
@@ -96,7 +101,7 @@ def test_alternative_endpoints():
     
     for name, url in endpoints:
         try:
-            response = requests.get(url)
+            response = SESSION.get(url)
             status = "✅" if response.status_code == 200 else "❌"
             print(f"{status} {name}: {url} ({response.status_code})")
         except:
@@ -5,6 +5,11 @@ Tests the Swagger-enabled endpoints directly in app.py
 
 import requests
 import json
+from requests.adapters import HTTPAdapter
+
+# Shared session so every request reuses keep-alive connections to the local server
+SESSION = requests.Session()
+SESSION.mount('http://', HTTPAdapter(pool_connections=10, pool_maxsize=20))
 
 def test_swagger_endpoints():
     """Test the Swagger-enabled API endpoints"""
@@ -30,7 +35,7 @@ def test_swagger_endpoints():
             print(f"🔍 Testing: {name}")
             print(f"   URL: {url}")
             
-            response = requests.get(url)
+            response = SESSION.get(url)
             
             if response.status_code == 200:
                 data = response.json()
@@ -9,12 +9,16 @@ from dotenv import load_dotenv
 load_dotenv()
 
 from fastapi import FastAPI, Depends
-from typing import Protocol, Optional, List, Dict, Any
+from typing import Protocol, Optional, List, Dict, Any, Callable, Tuple
 from dataclasses import dataclass
 from abc import ABC, abstractmethod
 from contextlib import asynccontextmanager
 import asyncio
 import logging
+import os
+import pickle
+import threading
+import time
 from enum import Enum
 
 # ============================================================================
@@ -26,7 +30,7 @@ class UserRole(Enum):
     USER = "user"
     GUEST = "guest"
 
-@dataclass
+@dataclass(slots=True)
 class User:
     """Type-safe user model with validation"""
     id: int
@@ -47,11 +51,62 @@ class DatabaseProtocol(Protocol):
     """Interface for database operations"""
     async def get_user(self, user_id: int) -> Optional[User]: ...
     async def save_user(self, user: User) -> bool: ...
+    async def get_users(self, user_ids: List[int]) -> List[User]: ...
 
 class CacheProtocol(Protocol):
     """Interface for caching operations"""
     async def get(self, key: str) -> Optional[Any]: ...
     async def set(self, key: str, value: Any, ttl: int = 300) -> None: ...
+    async def get_many(self, keys: List[str]) -> List[Optional[Any]]: ...
+    async def set_many(self, items: Dict[str, Any], ttl: int = 300) -> None: ...
+
+class RedisCache:
+    """Cache on redis.asyncio, so lookups never block the event loop"""
+    
+    def __init__(self, url: str, max_connections: int = 100):
+        from redis.asyncio import Redis  # Optional dependency, only needed when REDIS_URL is set
+        self._redis = Redis.from_url(url, max_connections=max_connections)
+    
+    async def get(self, key: str) -> Optional[Any]:
+        data = await self._redis.get(key)
+        return pickle.loads(data) if data is not None else None
+    
+    async def set(self, key: str, value: Any, ttl: int = 300) -> None:
+        await self._redis.set(key, pickle.dumps(value), ex=ttl)
+    
+    async def get_many(self, keys: List[str]) -> List[Optional[Any]]:
+        if not keys:
+            return []
+        values = await self._redis.mget(keys)  # One round-trip for all keys
+        return [pickle.loads(data) if data is not None else None for data in values]
+    
+    async def set_many(self, items: Dict[str, Any], ttl: int = 300) -> None:
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for key, value in items.items():
+                pipe.set(key, pickle.dumps(value), ex=ttl)
+            await pipe.execute()
+
+class MemoryCache:
+    """In-process cache; operations never await, so they are atomic on the event loop"""
+    
+    def __init__(self):
+        self._entries: Dict[str, Tuple[Any, float]] = {}
+    
+    async def get(self, key: str) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None or entry[1] < time.monotonic():
+            return None
+        return entry[0]
+    
+    async def set(self, key: str, value: Any, ttl: int = 300) -> None:
+        self._entries[key] = (value, time.monotonic() + ttl)
+    
+    async def get_many(self, keys: List[str]) -> List[Optional[Any]]:
+        return [await self.get(key) for key in keys]
+    
+    async def set_many(self, items: Dict[str, Any], ttl: int = 300) -> None:
+        expires_at = time.monotonic() + ttl
+        self._entries.update((key, (value, expires_at)) for key, value in items.items())
 
 # ============================================================================
 # 3. CLEAN ARCHITECTURE LAYERS
@@ -78,6 +133,31 @@ class UserRepository:
             await self.cache.set(cache_key, user)
         
         return user
+    
+    async def get_many(self, user_ids: List[int]) -> Dict[int, User]:
+        """Fetch many users with one cache round-trip and one database query for the misses"""
+        cached_users = await self.cache.get_many([f"user:{uid}" for uid in user_ids])
+        users = {uid: user for uid, user in zip(user_ids, cached_users) if user}
+        
+        misses = [uid for uid in user_ids if uid not in users]
+        if misses:
+            loaded = await self.db.get_users(misses)
+            if loaded:
+                await self.cache.set_many({f"user:{user.id}": user for user in loaded})
+            users.update((user.id, user) for user in loaded)
+        
+        return users
+
+# Role-based authorization levels (built once, not per authentication)
+ROLE_HIERARCHY: Dict[UserRole, int] = {
+    UserRole.GUEST: 0,
+    UserRole.USER: 1,
+    UserRole.ADMIN: 2
+}
+
+def is_authorized(user_role: UserRole, required_role: UserRole) -> bool:
+    """Pure role check: two dict lookups and a comparison"""
+    return ROLE_HIERARCHY[user_role] >= ROLE_HIERARCHY[required_role]
 
 class UserService:
     """Business logic layer"""
@@ -90,27 +170,34 @@ class UserService:
         """Complex business logic with proper error handling"""
         try:
             user = await self.repository.get_user_with_cache(user_id)
-            
-            if not user:
-                self.logger.warning(f"User {user_id} not found")
-                return False
-            
-            if not user.is_active:
-                self.logger.warning(f"User {user_id} is inactive")
-                return False
-            
-            # Role-based authorization
-            role_hierarchy = {
-                UserRole.GUEST: 0,
-                UserRole.USER: 1,
-                UserRole.ADMIN: 2
-            }
-            
-            return role_hierarchy[user.role] >= role_hierarchy[required_role]
+            return self._check_user_role(user_id, user, required_role)
             
         except Exception as e:
             self.logger.error(f"Authentication error for user {user_id}: {e}")
             return False
+    
+    async def authenticate_users(self, user_ids: List[int], required_role: UserRole) -> Dict[int, bool]:
+        """Authenticate many users with a single bulk fetch"""
+        try:
+            users = await self.repository.get_many(user_ids)
+            check, get_user = self._check_user_role, users.get
+            return {uid: check(uid, get_user(uid), required_role) for uid in user_ids}
+            
+        except Exception as e:
+            self.logger.error(f"Batch authentication error: {e}")
+            return {uid: False for uid in user_ids}
+    
+    def _check_user_role(self, user_id: int, user: Optional[User], required_role: UserRole) -> bool:
+        if not user:
+            self.logger.warning(f"User {user_id} not found")
+            return False
+        
+        if not user.is_active:
+            self.logger.warning(f"User {user_id} is inactive")
+            return False
+        
+        # Role-based authorization
+        return is_authorized(user.role, required_role)
 
 # ============================================================================
 # 4. ASYNC/CONCURRENT PROCESSING
@@ -119,41 +206,21 @@ class UserService:
 class BatchProcessor:
     """Handle high-throughput operations"""
     
-    def __init__(self, user_service: UserService, max_concurrent: int = 10):
+    # Role required for batch authentication
+    REQUIRED_ROLE = UserRole.USER
+    
+    def __init__(self, user_service: UserService):
         self.user_service = user_service
-        self.semaphore = asyncio.Semaphore(max_concurrent)
     
     async def process_user_batch(self, user_ids: List[int]) -> Dict[int, bool]:
-        """Process multiple users concurrently"""
-        
-        async def process_single_user(user_id: int) -> tuple[int, bool]:
-            async with self.semaphore:  # Limit concurrency
-                result = await self.user_service.authenticate_user(
-                    user_id, UserRole.USER
-                )
-                return user_id, result
-        
-        # Process all users concurrently
-        tasks = [process_single_user(uid) for uid in user_ids]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        # Handle results and exceptions
-        processed_results = {}
-        for result in results:
-            if isinstance(result, Exception):
-                logging.error(f"Batch processing error: {result}")
-                continue
-            
-            user_id, auth_result = result
-            processed_results[user_id] = auth_result
-        
-        return processed_results
+        """Process multiple users with one bulk fetch"""
+        return await self.user_service.authenticate_users(user_ids, self.REQUIRED_ROLE)
 
 # ============================================================================
 # 5. CONFIGURATION & ENVIRONMENT MANAGEMENT
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True, frozen=True, kw_only=True)
 class AppConfig:
     """Type-safe configuration"""
     database_url: str
@@ -163,18 +230,36 @@ class AppConfig:
     
     @classmethod
     def from_env(cls) -> 'AppConfig':
-        import os
+        env = os.environ
         return cls(
-            database_url=os.getenv('DATABASE_URL', 'sqlite:///app.db'),
-            redis_url=os.getenv('REDIS_URL', 'redis://localhost:6379'),
-            log_level=os.getenv('LOG_LEVEL', 'INFO'),
-            max_connections=int(os.getenv('MAX_CONNECTIONS', '100'))
+            database_url=env.get('DATABASE_URL', 'sqlite:///app.db'),
+            redis_url=env.get('REDIS_URL', 'redis://localhost:6379'),
+            log_level=env.get('LOG_LEVEL', 'INFO'),
+            max_connections=int(env.get('MAX_CONNECTIONS', '100'))
         )
 
 # ============================================================================
 # 6. APPLICATION FACTORY PATTERN
 # ============================================================================
 
+class CachedClients:
+    """Process-wide registry of connection-pooled clients keyed by URL"""
+    
+    _clients: Dict[Tuple[str, str], Any] = {}
+    _lock = threading.Lock()
+    
+    @classmethod
+    def get_or_create(cls, kind: str, url: str, factory: Callable[[], Any]) -> Any:
+        """Return the shared client for (kind, url), creating it on first use"""
+        key = (kind, url)
+        client = cls._clients.get(key)
+        if client is None:
+            with cls._lock:
+                client = cls._clients.get(key)
+                if client is None:
+                    client = cls._clients[key] = factory()
+        return client
+
 class Application:
     """Main application with dependency injection"""
     
@@ -196,20 +281,27 @@ class Application:
         )
     
     def _create_database(self) -> DatabaseProtocol:
-        # Factory pattern for database creation
-        if self.config.database_url.startswith('postgresql'):
+        # Factory pattern for database creation; network clients are pooled per URL per
+        # process, while in-process SQLite stays per Application
+        url = self.config.database_url
+        max_connections = self.config.max_connections
+        if url.startswith('postgresql'):
             from .adapters.postgres import PostgresDatabase
-            return PostgresDatabase(self.config.database_url)
+            return CachedClients.get_or_create(
+                'database', url, lambda: PostgresDatabase(url, max_connections=max_connections)
+            )
         else:
             from .adapters.sqlite import SQLiteDatabase
-            return SQLiteDatabase(self.config.database_url)
+            return SQLiteDatabase(url)
     
     def _create_cache(self) -> CacheProtocol:
-        if self.config.redis_url:
-            from .adapters.redis import RedisCache
-            return RedisCache(self.config.redis_url)
+        url = self.config.redis_url
+        if url:
+            return CachedClients.get_or_create(
+                'cache', url, lambda: RedisCache(url, max_connections=self.config.max_connections)
+            )
         else:
-            from .adapters.memory import MemoryCache
+            # In-process cache: each Application (and each test) gets its own
             return MemoryCache()
 
 # ============================================================================
@@ -223,11 +315,17 @@ class MockDatabase:
         self.users: Dict[int, User] = {}
     
     async def get_user(self, user_id: int) -> Optional[User]:
-        return self.users.get(user_id)
+        try:
+            return self.users[user_id]  # Hits are the common case in load tests
+        except KeyError:
+            return None
     
     async def save_user(self, user: User) -> bool:
         self.users[user.id] = user
         return True
+    
+    async def get_users(self, user_ids: List[int]) -> List[User]:
+        return [self.users[uid] for uid in user_ids if uid in self.users]
 
 # ============================================================================
 # 8. MAIN APPLICATION ENTRY POINT
@@ -255,9 +353,15 @@ async def main():
     print(f"Authentication success rate: {sum(results.values()) / len(results) * 100:.1f}%")
 
 if __name__ == "__main__":
-    # Proper async application startup
+    # Proper async application startup (on uvloop when it is installed)
+    try:
+        import uvloop
+        run = uvloop.run
+    except ImportError:
+        run = asyncio.run
+    
     try:
-        asyncio.run(main())
+        run(main())
     except KeyboardInterrupt:
         print("Application stopped by user")
     except Exception as e:
@@ -11,6 +11,8 @@ class MyConfig(BaseSettings):
     # Database Configuration
     #Field(...): The ... means this field is required - no default value
     database_url: str = Field(..., description="Database connection URL")
+    db_pool_size: int = 20
+    db_max_overflow: int = 10
     
     # Security
     secret_key: str = Field(..., description="Secret key for JWT tokens")
@@ -29,6 +31,7 @@ class MyConfig(BaseSettings):
         env_file = ".env"
         env_file_encoding = 'utf-8'
         case_sensitive = False
+        frozen = True  # Parsed once at import; settings are read-only afterwards
 
 # Create a singleton instance
 settings = MyConfig()
\ No newline at end of file
@@ -1,10 +1,26 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends, Response
+import msgspec
+from sqlalchemy.ext.asyncio import AsyncSession
+from database import get_db
+from repositories.db_user_repository import DbUserRepository
 from services.db_user_service import DbUserService
 router = APIRouter(prefix="/api/db_users",tags=["db_users"])
 
+def get_db_user_repository(db: AsyncSession = Depends(get_db)) -> DbUserRepository:
+    """Repository on the request-scoped session from get_db (closed after the response)"""
+    return DbUserRepository(db)
+
+def get_db_user_service(repository: DbUserRepository = Depends(get_db_user_repository)) -> DbUserService:
+    """The service only wraps the injected repository; it opens no session of its own"""
+    return DbUserService(repository)
+
+@router.get("/")
+async def get_users(db_user_service: DbUserService = Depends(get_db_user_service)):
+    # Encode the Struct tree in one native pass instead of jsonable_encoder + json.dumps
+    users = await db_user_service.get_all_users()
+    return Response(content=msgspec.json.encode(users), media_type="application/json")
+
 @router.get("/{id}")
-def get_user(id: int):
-    db_user_service = DbUserService()
-    
-    user = db_user_service.get_user_by_id(id)
-    return user
+async def get_user(id: int, db_user_service: DbUserService = Depends(get_db_user_service)):
+    user = await db_user_service.get_user_by_id(id)
+    return Response(content=msgspec.json.encode(user), media_type="application/json")
@@ -1,20 +1,23 @@
-from fastapi import APIRouter, Form, File, UploadFile
+from fastapi import APIRouter, Depends, Form, File, UploadFile
 from typing import List, Optional 
 from services.task_service import TaskService
 from models.task_model import GetTaskRequest, GetTaskResponse,GetTaskRequestV2, GetTaskResponseV2
 router = APIRouter(prefix="/api/tasks",tags=["tasks"])
 
+# TaskService holds no per-request state, so one instance serves every request
+_task_service = TaskService()
+
+def get_task_service() -> TaskService:
+    return _task_service
+
 @router.get("/{id}")
-def get_task(id: int):
-    task_service = TaskService()
-    request = GetTaskRequest()
-    request.id = id
+def get_task(id: int, task_service: TaskService = Depends(get_task_service)):
+    request = GetTaskRequest(id=id)
     response = task_service.get_task(request)
     return response
 
 @router.get("/{id}/v2")
-def get_task_v2(id: int):
-    task_service = TaskService()
+def get_task_v2(id: int, task_service: TaskService = Depends(get_task_service)):
     request = GetTaskRequestV2(id=id)
     response = task_service.get_task_v2(request)
     return response
@@ -40,6 +43,17 @@ async def test_pass_form_data(
         }
     }
 
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+async def get_upload_size(upload: UploadFile) -> int:
+    """Size of an uploaded file without buffering its whole content in memory"""
+    if upload.size is not None:
+        return upload.size
+    size = 0
+    while chunk := await upload.read(UPLOAD_CHUNK_SIZE):
+        size += len(chunk)
+    return size
+
 @router.post("/testPassFormDataWithFiles")
 async def test_pass_form_data_with_files(
     title: str = Form(...),
@@ -51,8 +65,8 @@ async def test_pass_form_data_with_files(
     Test endpoint for handling form data with file uploads
     Content-Type: multipart/form-data
     """
-    # Read file content (optional)
-    file_content = await file.read()
+    # Only the size is reported, so count it instead of reading the file into memory
+    file_size = await get_upload_size(file)
     
     # Process optional files
     uploaded_files = []
@@ -62,7 +76,7 @@ async def test_pass_form_data_with_files(
                 uploaded_files.append({
                     "filename": uploaded_file.filename,
                     "content_type": uploaded_file.content_type,
-                    "size": len(await uploaded_file.read())
+                    "size": await get_upload_size(uploaded_file)
                 })
     
     return {
@@ -74,7 +88,7 @@ async def test_pass_form_data_with_files(
         "main_file": {
             "filename": file.filename,
             "content_type": file.content_type,
-            "size": len(file_content)
+            "size": file_size
         },
         "additional_files": uploaded_files
     }
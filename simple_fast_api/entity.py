@@ -1,4 +1,4 @@
-from sqlalchemy import Boolean, Column, Integer, String, Text, DateTime, Enum, ForeignKey, BigInteger, JSON
+from sqlalchemy import Boolean, Column, Integer, String, Text, DateTime, ForeignKey, BigInteger, JSON, CheckConstraint
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from enum import Enum as PyEnum
@@ -28,8 +28,20 @@ class UserStatus(PyEnum):
     INACTIVE = "INACTIVE"
     SUSPENDED = "SUSPENDED"
 
+def enum_check(column: str, enum_cls: type) -> CheckConstraint:
+    """CHECK constraint limiting a String column to the values of a Python enum"""
+    values = ", ".join(f"'{member.value}'" for member in enum_cls)
+    return CheckConstraint(f"{column} IN ({values})", name=f"ck_{column}_{enum_cls.__name__.lower()}")
+
+# Enum-like columns are plain strings (no per-row Enum conversion); the enums above
+# document the allowed values and back the CHECK constraints
+
 class User(Base):
     __tablename__ = "users"
+    __table_args__ = (
+        enum_check("role", UserRole),
+        enum_check("status", UserStatus),
+    )
     
     # Match your existing columns exactly
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
@@ -37,24 +49,29 @@ class User(Base):
     email = Column(String(100), unique=True, nullable=False, index=True)
     full_name = Column(String(200), nullable=False)
     password_hash = Column(String(255), nullable=False)
-    role = Column(Enum(UserRole), nullable=False)
-    status = Column(Enum(UserStatus), nullable=False)
+    role = Column(String(20), nullable=False)
+    status = Column(String(20), nullable=False)
     created_at = Column(DateTime, nullable=False, server_default=func.now())
     updated_at = Column(DateTime, nullable=True)
     last_login = Column(DateTime, nullable=True)
     is_deleted = Column(Boolean, nullable=False)
     email_verified = Column(Boolean, nullable=False)
-    tasks = relationship("Task", back_populates="user", cascade="all, delete-orphan")
+    # Collections must be eager-loaded by the query (selectinload); an implicit per-row lazy load raises instead of causing N+1
+    tasks = relationship("Task", back_populates="user", cascade="all, delete-orphan", lazy="raise_on_sql")
 
 class Task(Base):
     __tablename__ = "tasks"
+    __table_args__ = (
+        enum_check("status", TaskStatus),
+        enum_check("priority", TaskPriority),
+    )
     
     # Match your existing columns exactly
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     title = Column(String(200), nullable=False, index=True)
     description = Column(Text, nullable=True)
-    status = Column(Enum(TaskStatus), nullable=False, index=True)
-    priority = Column(Enum(TaskPriority), nullable=False)
+    status = Column(String(20), nullable=False, index=True)
+    priority = Column(String(20), nullable=False)
     created_by = Column(String(100), nullable=False)
     assigned_to = Column(String(100), nullable=True)
     created_at = Column(DateTime, nullable=False, server_default=func.now())
@@ -65,7 +82,7 @@ class Task(Base):
     
         # ✅ Foreign key column (matches your database)
     user_id = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True, index=True)
-    task_details = relationship("TaskDetail", back_populates="task", cascade="all, delete-orphan")
+    task_details = relationship("TaskDetail", back_populates="task", cascade="all, delete-orphan", lazy="raise_on_sql")
     user = relationship("User", back_populates="tasks")
 
 class TaskDetailType( PyEnum):
@@ -77,11 +94,14 @@ class TaskDetailType( PyEnum):
 
 class TaskDetail(Base):
     __tablename__ = "task_details"
+    __table_args__ = (
+        enum_check("detail_type", TaskDetailType),
+    )
     
     # SQLAlchemy Column definitions (not type hints!)
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     task_id = Column(Integer, ForeignKey("tasks.id", ondelete="CASCADE"), nullable=False, index=True)
-    detail_type = Column(Enum(TaskDetailType), nullable=False, index=True)
+    detail_type = Column(String(20), nullable=False, index=True)
     title = Column(String(200), nullable=True)
     content = Column(Text, nullable=True)
     file_path = Column(String(500), nullable=True)
@@ -4,13 +4,15 @@ The most basic FastAPI application possible
 """
 
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from database import get_db
 from controllers.task_controller import router as task_router
 from controllers.user_controller import router as user_router
 from controllers.test_controller import router as test_router
 from controllers.db_user_controller import router as db_user_router
 
-app = FastAPI()
+# Serialize all responses with orjson (see requirements.txt) instead of the stdlib json module
+app = FastAPI(default_response_class=ORJSONResponse)
 app.include_router(task_router)
 app.include_router(user_router)
 app.include_router(test_router)
@@ -25,4 +27,5 @@ def read_root():
 # Run the app
 if __name__ == "__main__":
     import uvicorn
+    # loop/http default to "auto": uvloop and httptools when installed, asyncio/h11 otherwise
     uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
@@ -1,23 +1,35 @@
-from typing import List
-from entity import User, Task, TaskDetail
+from typing import List, Optional
+from entity import User, Task, TaskDetail, UserRole, UserStatus, TaskStatus, TaskPriority, TaskDetailType
 from models.db_user_model import (
     UserDto, UserWithTasksDto, TaskDto, TaskDetailDto, UserListDto,
     UserRoleDto, UserStatusDto, TaskStatusDto, TaskPriorityDto, TaskDetailTypeDto
 )
 
+# Column value -> DTO enum member, built once instead of calling the Enum constructor per row
+_ROLE_MAP = {r.value: UserRoleDto(r.value) for r in UserRole}
+_STATUS_MAP = {s.value: UserStatusDto(s.value) for s in UserStatus}
+_TASK_STATUS_MAP = {s.value: TaskStatusDto(s.value) for s in TaskStatus}
+_PRIORITY_MAP = {p.value: TaskPriorityDto(p.value) for p in TaskPriority}
+_DETAIL_TYPE_MAP = {t.value: TaskDetailTypeDto(t.value) for t in TaskDetailType}
+
 class UserMapper:
+    """
+    Builds response DTOs from ORM entities.
+
+    The DTOs are msgspec Structs, whose constructors do no validation, so only
+    entities loaded from the database may be passed in - never raw request dicts.
+    """
     
     @staticmethod
     def to_user_dto(user: User) -> UserDto:
-        """Convert User entity to UserDto"""
+        """Convert User entity (or a row with the same user columns) to UserDto"""
         return UserDto(
             id=user.id,
             username=user.username,
             full_name=user.full_name,
             email=user.email,
-            role=UserRoleDto(user.role.value),
-            status=UserStatusDto(user.status.value),
-            created_at=user.created_at,
+            role=_ROLE_MAP[user.role],
+            status=_STATUS_MAP[user.status],
             email_verified=user.email_verified
         )
     
@@ -26,13 +38,11 @@ class UserMapper:
         """Convert TaskDetail entity to TaskDetailDto"""
         return TaskDetailDto(
             id=detail.id,
-            detail_type=TaskDetailTypeDto(detail.detail_type.value),
+            detail_type=_DETAIL_TYPE_MAP[detail.detail_type],
             title=detail.title,
             content=detail.content,
             file_path=detail.file_path,
             file_name=detail.file_name,
-            created_by=detail.created_by,
-            created_at=detail.created_at,
             is_completed=detail.is_completed,
             order_index=detail.order_index
         )
@@ -44,17 +54,13 @@ class UserMapper:
             id=task.id,
             title=task.title,
             description=task.description,
-            status=TaskStatusDto(task.status.value),
-            priority=TaskPriorityDto(task.priority.value),
+            status=_TASK_STATUS_MAP[task.status],
+            priority=_PRIORITY_MAP[task.priority],
             created_by=task.created_by,
             assigned_to=task.assigned_to,
-            created_at=task.created_at,
             due_date=task.due_date,
             completed_at=task.completed_at,
-            task_details=[
-                UserMapper.to_task_detail_dto(detail) 
-                for detail in task.task_details
-            ]
+            task_details=list(map(UserMapper.to_task_detail_dto, task.task_details))
         )
     
     @staticmethod
@@ -62,20 +68,58 @@ class UserMapper:
         """Convert User entity with tasks to UserWithTasksDto"""
         return UserWithTasksDto(
             user=UserMapper.to_user_dto(user),
-            tasks=[
-                UserMapper.to_task_dto(task) 
-                for task in user.tasks
-            ],
+            tasks=list(map(UserMapper.to_task_dto, user.tasks)),
             total_tasks=len(user.tasks)
         )
     
+    @staticmethod
+    def rows_to_user_with_tasks_dto(rows) -> Optional[UserWithTasksDto]:
+        """
+        Build UserWithTasksDto from the flat rows of DbUserRepository.get_user_with_tasks_rows
+        in a single pass, grouping details under their task by task_id
+        """
+        if not rows:
+            return None
+        tasks = {}  # task_id -> TaskDto, in row order
+        for row in rows:
+            task_id = row.task_id
+            if task_id is None:  # User without tasks
+                continue
+            task = tasks.get(task_id)
+            if task is None:
+                task = tasks[task_id] = TaskDto(
+                    id=task_id,
+                    title=row.task_title,
+                    description=row.description,
+                    status=_TASK_STATUS_MAP[row.task_status],
+                    priority=_PRIORITY_MAP[row.priority],
+                    created_by=row.created_by,
+                    assigned_to=row.assigned_to,
+                    due_date=row.due_date,
+                    completed_at=row.completed_at,
+                    task_details=[]
+                )
+            if row.detail_id is not None:
+                task.task_details.append(TaskDetailDto(
+                    id=row.detail_id,
+                    detail_type=_DETAIL_TYPE_MAP[row.detail_type],
+                    title=row.detail_title,
+                    content=row.content,
+                    file_path=row.file_path,
+                    file_name=row.file_name,
+                    is_completed=row.is_completed,
+                    order_index=row.order_index
+                ))
+        return UserWithTasksDto(
+            user=UserMapper.to_user_dto(rows[0]),
+            tasks=list(tasks.values()),
+            total_tasks=len(tasks)
+        )
+    
     @staticmethod
     def to_user_list_dto(users: List[User]) -> UserListDto:
-        """Convert list of User entities to UserListDto"""
+        """Convert list of User entities (or rows with the same user columns) to UserListDto"""
         return UserListDto(
-            users=[
-                UserMapper.to_user_dto(user) 
-                for user in users
-            ],
+            users=list(map(UserMapper.to_user_dto, users)),
             total=len(users)
         )
\ No newline at end of file
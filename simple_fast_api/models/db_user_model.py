@@ -1,9 +1,11 @@
 # models/user_response_dto.py
-from pydantic import BaseModel
+import msgspec
 from typing import List, Optional
 from datetime import datetime
 from enum import Enum
 
+# Enum values are identifier-like literals, which CPython interns at compile time,
+# so no explicit sys.intern pass is needed for fast hashing/comparison.
 class UserRoleDto(str, Enum):
     ADMIN = "ADMIN"
     MANAGER = "MANAGER"
@@ -34,7 +36,10 @@ class TaskDetailTypeDto(str, Enum):
     NOTE = "NOTE"
     CHECKLIST_ITEM = "CHECKLIST_ITEM"
 
-class TaskDetailDto(BaseModel):
+# Response DTOs are msgspec Structs: built from trusted ORM rows and encoded with
+# msgspec.json.encode, so they skip pydantic's per-field validation entirely.
+# kw_only lets optional fields precede required ones, as in the pydantic versions.
+class TaskDetailDto(msgspec.Struct, kw_only=True):
     id: int
     detail_type: TaskDetailTypeDto
     title: Optional[str] = None
@@ -44,7 +49,7 @@ class TaskDetailDto(BaseModel):
     is_completed: Optional[bool] = None
     order_index: Optional[int] = None
 
-class TaskDto(BaseModel):
+class TaskDto(msgspec.Struct, kw_only=True):
     id: int
     title: str
     description: Optional[str] = None
@@ -56,7 +61,7 @@ class TaskDto(BaseModel):
     completed_at: Optional[datetime] = None
     task_details: List[TaskDetailDto] = []
 
-class UserDto(BaseModel):
+class UserDto(msgspec.Struct, kw_only=True):
     id: int
     username: str
     full_name: str
@@ -65,11 +70,11 @@ class UserDto(BaseModel):
     status: UserStatusDto
     email_verified: bool
 
-class UserWithTasksDto(BaseModel):
+class UserWithTasksDto(msgspec.Struct, kw_only=True):
     user: UserDto
     tasks: List[TaskDto] = []
     total_tasks: int
 
-class UserListDto(BaseModel):
+class UserListDto(msgspec.Struct, kw_only=True):
     users: List[UserDto]
     total: int
\ No newline at end of file
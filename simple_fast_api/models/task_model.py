@@ -1,8 +1,13 @@
+from dataclasses import dataclass
 from pydantic import BaseModel
+
+# Plain request/response holders: slotted so instances carry no per-object __dict__
+@dataclass(slots=True)
 class GetTaskRequest():
     id: int
 
 
+@dataclass(slots=True)
 class GetTaskResponse():
     id: int
     title: str
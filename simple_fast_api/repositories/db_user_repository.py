@@ -1,23 +1,46 @@
-from entity import User
-from sqlalchemy.orm import Session
-from database import SessionLocal
+from entity import User, Task, TaskDetail
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Columns UserDto needs; rows of these feed UserMapper.to_user_dto like a User entity would
+USER_COLUMNS = (
+    User.id, User.username, User.full_name, User.email, User.role, User.status, User.email_verified,
+)
+
+# Flat column set for the single-query user -> tasks -> details load. Plain columns skip ORM
+# hydration and the identity map; labels keep the three id/title/status columns apart.
+# User columns keep their attribute names so a row can feed UserMapper.to_user_dto directly.
+USER_TASK_DETAIL_COLUMNS = (
+    *USER_COLUMNS,
+    Task.id.label("task_id"), Task.title.label("task_title"), Task.description,
+    Task.status.label("task_status"), Task.priority, Task.created_by, Task.assigned_to,
+    Task.due_date, Task.completed_at,
+    TaskDetail.id.label("detail_id"), TaskDetail.detail_type, TaskDetail.title.label("detail_title"),
+    TaskDetail.content, TaskDetail.file_path, TaskDetail.file_name, TaskDetail.is_completed,
+    TaskDetail.order_index,
+)
 
 class DbUserRepository:     
-    def __init__(self):
-        self.db = SessionLocal()
+    def __init__(self, db: AsyncSession):
+        self.db = db
 
-    def get_user_by_id(self, user_id: int):
-#        return self.db.query(User).filter(User.id == user_id).first()
-        query = self.db.query(User).filter(User.id == user_id)
-       
-#        sql = str(query.statement.compile(compile_kwargs={"literal_binds": True}))
-#        print(f"SQL: {sql}")
-         
-        return query.first()
+    async def get_user_with_tasks_rows(self, user_id: int):
+        """
+        User, tasks and task details in one round trip: one row per (task, detail) pair,
+        task/detail columns NULL where the outer joins find nothing. Ordered so each
+        task's rows are contiguous.
+        """
+        query = (
+            select(*USER_TASK_DETAIL_COLUMNS)
+            .outerjoin(Task, Task.user_id == User.id)
+            .outerjoin(TaskDetail, TaskDetail.task_id == Task.id)
+            .where(User.id == user_id)
+            .order_by(Task.id, TaskDetail.id)
+        )
+        result = await self.db.execute(query)
+        return result.all()
 
-    def get_all_users(self):
-        return self.db.query(User).all()
-    
-    def close(self):
-        """Close the database session."""
-        self.db.close()
\ No newline at end of file
+    async def get_all_user_rows(self):
+        """Flat user projection as Core rows: no entity hydration, identity map or change tracking"""
+        result = await self.db.execute(select(*USER_COLUMNS))
+        return result.all()
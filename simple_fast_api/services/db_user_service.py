@@ -4,13 +4,16 @@ from models.db_user_model import UserDto, UserWithTasksDto, UserListDto
 from typing import Optional
 
 class DbUserService:    
-    def __init__(self):
-        self.repository = DbUserRepository()
+    def __init__(self, repository: DbUserRepository):
+        self.repository = repository
 
-    def get_user_by_id(self, user_id: int):
-        user = self.repository.get_user_by_id(user_id)
-        return UserMapper.to_user_with_tasks_dto(user)
+    async def get_user_by_id(self, user_id: int):
+        # One joined query; the mapper groups the flat rows into the nested DTO
+        rows = await self.repository.get_user_with_tasks_rows(user_id)
+        return UserMapper.rows_to_user_with_tasks_dto(rows)
 
-    def get_all_users(self):
-        return self.repository.get_all_users()
+    async def get_all_users(self) -> UserListDto:
+        # The list only needs user columns, so read rows rather than User entities
+        rows = await self.repository.get_all_user_rows()
+        return UserMapper.to_user_list_dto(rows)
     
\ No newline at end of file
@@ -1,7 +1,14 @@
 from models.task_model import GetTaskRequest, GetTaskResponse, GetTaskRequestV2, GetTaskResponseV2
+import functools
 import logging
 logger = logging.getLogger(__name__)
 
+@functools.lru_cache(maxsize=4096)
+def _build_task_response_v2(task_id: int) -> GetTaskResponseV2:
+    """Only the id varies, so each response is built once per id and reused"""
+    # Values are already typed (id validated on the request), so skip response validation
+    return GetTaskResponseV2.model_construct(id=task_id,title="Task Title",description="Task Description")
+
 class TaskService:  
     """
     Task Service implementing business logic
@@ -19,27 +26,16 @@ class TaskService:
         - Due date cannot be in the past
         - High/Urgent priority tasks must have due date
         """
-        try:
-            # Business validation
-           
-            
-            logger.info(f"Task: {request}")
-            ret = GetTaskResponse()
-            ret.id = request.id
-            ret.title = "Task Title"
-            ret.description = "Task Description"
-            return ret
-            
-        except Exception as e:
-            logger.error(f"Error creating task: {e}")
-            raise
+        # Business validation
+        
+        logger.info("Task: %s", request)
+        return GetTaskResponse(id=request.id, title="Task Title", description="Task Description")
     
     def get_task_v2(self, request:GetTaskRequestV2) -> GetTaskResponseV2:
         """
         Get task by ID with business validation
         """
        
-        logger.info(f"Task: {request}")
-        ret = GetTaskResponseV2(id=request.id,title="Task Title",description="Task Description")
-        return ret
+        logger.info("Task: %s", request)
+        return _build_task_response_v2(request.id)
     
\ No newline at end of file
@@ -0,0 +1,31 @@
+"""
+Optional Cython build for the DTO modules.
+
+Compiles the DTO modules in place (db_user_model's msgspec Structs, task_model's
+dataclasses and pydantic models) as C extensions:
+
+    python setup.py build_ext --inplace
+    python -c "import models.db_user_model as m; print(m.__file__)"   # models/db_user_model*.so
+
+Not part of the default image build (docker build --build-arg CYTHON_BUILD=1
+enables it): validation and encoding already run in the msgspec/pydantic C
+cores, so compiling the class bodies gains little. The plain .py sources are
+used when the extensions are not built.
+"""
+from setuptools import Extension, setup
+from Cython.Build import cythonize
+
+# Dotted names, so the built extensions land next to their sources as models.*
+# instead of as top-level modules in the project root
+extensions = [
+    Extension("models.db_user_model", ["models/db_user_model.py"]),
+    Extension("models.task_model", ["models/task_model.py"]),
+]
+
+setup(
+    name="simple_fast_api_models",
+    ext_modules=cythonize(
+        extensions,
+        compiler_directives={"language_level": 3},
+    ),
+)
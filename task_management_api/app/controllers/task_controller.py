@@ -3,67 +3,69 @@ Task Controller - API Layer for Task Management
 Handles HTTP requests/responses and delegates business logic to TaskService
 """
 
-from fastapi import APIRouter, HTTPException, status, Depends, Query
-from typing import Optional, List
+from fastapi import APIRouter, HTTPException, status, Depends, Query, Response
+from fastapi.responses import ORJSONResponse
+from typing import Optional, List, Union
 import logging
 
 from ..dto.task_dto import (
     CreateTaskRequest, UpdateTaskRequest, TaskQueryParams,
-    TaskResponse, TaskListResponse, TaskStatsResponse
+    TaskResponse, TaskListResponse, TaskSummaryListResponse, TaskStatsResponse, dump_tasks_json
 )
 from ..services.task_service import (
     TaskService, TaskNotFoundError, TaskValidationError, UnauthorizedOperationError
 )
+from ..dependencies import get_task_service, mock_current_user
 
 logger = logging.getLogger(__name__)
 
 # Create router for task endpoints
-router = APIRouter(prefix="/api/v1/tasks", tags=["tasks"])
+router = APIRouter(prefix="/api/v1/tasks", tags=["tasks"], default_response_class=ORJSONResponse)
 
-# Register Task Management Endpoints
-from sqlalchemy.orm import Session
-from app.database import get_db
-from app.repositories.task_repository import TaskRepository
-from app.services.task_service import TaskService
+# Endpoints serialize their DTOs straight to JSON bytes and return a Response,
+# so FastAPI skips jsonable_encoder and re-validating the already validated DTO.
+# They declare response_model=None and document the schema via `responses` instead.
+JSON_MEDIA_TYPE = "application/json"
 
-# Dependency to get task service
-def get_task_service(db: Session = Depends(get_db)) -> TaskService:
-    """Get task service with dependencies"""
-    repository = TaskRepository(db)
-    return TaskService(repository)
+# Mock current user for the task routes (see mock_current_user)
+get_current_user = mock_current_user("demo_user")
 
 # Task Management Endpoints
+# Routes are plain `def`: the service/repository calls are blocking SQLAlchemy, so FastAPI
+# runs them in its threadpool instead of on the event loop
 @router.post(
     "/",
-    response_model=TaskResponse,
+    response_model=None,
+    responses={201: {"model": TaskResponse}},
     status_code=status.HTTP_201_CREATED,
     summary="Create a new task",
     description="Create a new task with the provided details"
 )
-async def create_task(
+def create_task(
     request: CreateTaskRequest,
     task_service: TaskService = Depends(get_task_service),
-    current_user: str = Depends(lambda: "demo_user")  # Mock current user
+    current_user: str = Depends(get_current_user)  # Mock current user
 ):
     """Create a new task"""
     try:
         request.created_by = current_user
         task = task_service.create_task(request)
-        return task
+        return Response(content=task.model_dump_json(), media_type=JSON_MEDIA_TYPE, status_code=status.HTTP_201_CREATED)
     except TaskValidationError as e:
-        logger.warning(f"Task validation error: {e}")
+        logger.warning("Task validation error: %s", e)
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
-        logger.error(f"Error creating task: {e}")
+        logger.error("Error creating task: %s", e)
         raise HTTPException(status_code=500, detail="Internal server error")
 
 @router.get(
     "/",
-    response_model=TaskListResponse,
+    response_model=None,
+    responses={200: {"model": Union[TaskListResponse, TaskSummaryListResponse]}},
     summary="Get tasks with pagination",
     description="Get a paginated list of tasks with optional filtering"
 )
-async def get_tasks(
+def get_tasks(
     page: int = Query(1, ge=1, description="Page number"),
     size: int = Query(10, ge=1, le=100, description="Page size"),
     status_filter: Optional[str] = Query(None, alias="status", description="Filter by status"),
@@ -72,8 +74,11 @@ async def get_tasks(
     created_by: Optional[str] = Query(None, description="Filter by creator"),
     sort_by: str = Query("created_at", description="Sort field"),
     sort_order: str = Query("desc", pattern="^(asc|desc)$", description="Sort order"),
+    view: str = Query("full", pattern="^(full|summary)$", description="full, or summary without description/completed_at"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page (keyset pagination, ignores page)"),
+    include_total: bool = Query(True, description="Count all matching tasks; false omits total/total_pages"),
     task_service: TaskService = Depends(get_task_service),
-    current_user: str = Depends(lambda: "demo_user")
+    current_user: str = Depends(get_current_user)
 ):
     """Get paginated list of tasks"""
     try:
@@ -85,53 +90,60 @@ async def get_tasks(
             assigned_to=assigned_to,
             created_by=created_by,
             sort_by=sort_by,
-            sort_order=sort_order
+            sort_order=sort_order,
+            view=view,
+            cursor=cursor,
+            include_total=include_total
         )
         tasks = task_service.get_tasks_paginated(query_params, current_user)
-        return tasks
+        return Response(content=tasks.model_dump_json(), media_type=JSON_MEDIA_TYPE)
+    except TaskValidationError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
-        logger.error(f"Error getting tasks: {e}")
+        logger.error("Error getting tasks: %s", e)
         raise HTTPException(status_code=500, detail="Internal server error")
 
 @router.get(
     "/{task_id}",
-    response_model=TaskResponse,
+    response_model=None,
+    responses={200: {"model": TaskResponse}},
     summary="Get task by ID",
     description="Retrieve a specific task by its ID"
 )
-async def get_task(
+def get_task(
     task_id: int,
     task_service: TaskService = Depends(get_task_service),
-    current_user: str = Depends(lambda: "demo_user")
+    current_user: str = Depends(get_current_user)
 ):
     """Get a specific task by ID"""
     try:
         task = task_service.get_task_by_id(task_id, current_user)
-        return task
+        return Response(content=task.model_dump_json(), media_type=JSON_MEDIA_TYPE)
     except TaskNotFoundError:
         raise HTTPException(status_code=404, detail=f"Task with ID {task_id} not found")
     except UnauthorizedOperationError:
         raise HTTPException(status_code=403, detail="Not authorized to access this task")
     except Exception as e:
-        logger.error(f"Error getting task {task_id}: {e}")
+        logger.error("Error getting task %s: %s", task_id, e)
         raise HTTPException(status_code=500, detail="Internal server error")
 
 @router.put(
     "/{task_id}",
-    response_model=TaskResponse,
+    response_model=None,
+    responses={200: {"model": TaskResponse}},
     summary="Update task",
     description="Update an existing task"
 )
-async def update_task(
+def update_task(
     task_id: int,
     request: UpdateTaskRequest,
     task_service: TaskService = Depends(get_task_service),
-    current_user: str = Depends(lambda: "demo_user")
+    current_user: str = Depends(get_current_user)
 ):
     """Update an existing task"""
     try:
         task = task_service.update_task(task_id, request, current_user)
-        return task
+        return Response(content=task.model_dump_json(), media_type=JSON_MEDIA_TYPE)
     except TaskNotFoundError:
         raise HTTPException(status_code=404, detail=f"Task with ID {task_id} not found")
     except UnauthorizedOperationError:
@@ -139,7 +151,7 @@ async def update_task(
     except TaskValidationError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
-        logger.error(f"Error updating task {task_id}: {e}")
+        logger.error("Error updating task %s: %s", task_id, e)
         raise HTTPException(status_code=500, detail="Internal server error")
 
 @router.delete(
@@ -148,10 +160,10 @@ async def update_task(
     summary="Delete task",
     description="Delete a task (soft delete)"
 )
-async def delete_task(
+def delete_task(
     task_id: int,
     task_service: TaskService = Depends(get_task_service),
-    current_user: str = Depends(lambda: "demo_user")
+    current_user: str = Depends(get_current_user)
 ):
     """Delete a task"""
     try:
@@ -166,90 +178,95 @@ async def delete_task(
     except TaskValidationError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
-        logger.error(f"Error deleting task {task_id}: {e}")
+        logger.error("Error deleting task %s: %s", task_id, e)
         raise HTTPException(status_code=500, detail="Internal server error")
 
 @router.post(
     "/{task_id}/complete",
-    response_model=TaskResponse,
+    response_model=None,
+    responses={200: {"model": TaskResponse}},
     summary="Complete task",
     description="Mark a task as completed"
 )
-async def complete_task(
+def complete_task(
     task_id: int,
     task_service: TaskService = Depends(get_task_service),
-    current_user: str = Depends(lambda: "demo_user")
+    current_user: str = Depends(get_current_user)
 ):
     """Mark a task as completed"""
     try:
         task = task_service.complete_task(task_id, current_user)
-        return task
+        return Response(content=task.model_dump_json(), media_type=JSON_MEDIA_TYPE)
     except TaskNotFoundError:
         raise HTTPException(status_code=404, detail=f"Task with ID {task_id} not found")
     except UnauthorizedOperationError:
         raise HTTPException(status_code=403, detail="Not authorized to complete this task")
     except Exception as e:
-        logger.error(f"Error completing task {task_id}: {e}")
+        logger.error("Error completing task %s: %s", task_id, e)
         raise HTTPException(status_code=500, detail="Internal server error")
 
 @router.post(
     "/{task_id}/assign",
-    response_model=TaskResponse,
+    response_model=None,
+    responses={200: {"model": TaskResponse}},
     summary="Assign task",
     description="Assign a task to a user"
 )
-async def assign_task(
+def assign_task(
     task_id: int,
     assignee_id: str = Query(..., description="User ID to assign the task to"),
     task_service: TaskService = Depends(get_task_service),
-    current_user: str = Depends(lambda: "demo_user")
+    current_user: str = Depends(get_current_user)
 ):
     """Assign a task to a user"""
     try:
         task = task_service.assign_task(task_id, assignee_id, current_user)
-        return task
+        return Response(content=task.model_dump_json(), media_type=JSON_MEDIA_TYPE)
     except TaskNotFoundError:
         raise HTTPException(status_code=404, detail=f"Task with ID {task_id} not found")
     except UnauthorizedOperationError:
         raise HTTPException(status_code=403, detail="Not authorized to assign this task")
     except Exception as e:
-        logger.error(f"Error assigning task {task_id}: {e}")
+        logger.error("Error assigning task %s: %s", task_id, e)
         raise HTTPException(status_code=500, detail="Internal server error")
 
 @router.get(
     "/stats/overview",
-    response_model=TaskStatsResponse,
+    response_model=None,
+    responses={200: {"model": TaskStatsResponse}},
     summary="Get task statistics",
     description="Get task statistics overview"
 )
-async def get_task_statistics(
+def get_task_statistics(
     user_id: Optional[str] = Query(None, description="Get stats for specific user"),
     task_service: TaskService = Depends(get_task_service),
-    current_user: str = Depends(lambda: "demo_user")
+    current_user: str = Depends(get_current_user)
 ):
     """Get task statistics"""
     try:
+        # Statistics are cached for a few seconds in TaskRepository (see STATS_CACHE)
         stats = task_service.get_task_statistics(user_id or current_user)
-        return stats
+        return Response(content=stats.model_dump_json(), media_type=JSON_MEDIA_TYPE)
     except Exception as e:
-        logger.error(f"Error getting task statistics: {e}")
+        logger.error("Error getting task statistics: %s", e)
         raise HTTPException(status_code=500, detail="Internal server error")
 
 @router.get(
     "/overdue",
-    response_model=List[TaskResponse],
+    response_model=None,
+    responses={200: {"model": List[TaskResponse]}},
     summary="Get overdue tasks",
     description="Get all overdue tasks"
 )
-async def get_overdue_tasks(
+def get_overdue_tasks(
     user_id: Optional[str] = Query(None, description="Get overdue tasks for specific user"),
     task_service: TaskService = Depends(get_task_service),
-    current_user: str = Depends(lambda: "demo_user")
+    current_user: str = Depends(get_current_user)
 ):
     """Get overdue tasks"""
     try:
         tasks = task_service.get_overdue_tasks(user_id or current_user)
-        return tasks
+        return Response(content=dump_tasks_json(tasks), media_type=JSON_MEDIA_TYPE)
     except Exception as e:
-        logger.error(f"Error getting overdue tasks: {e}")
+        logger.error("Error getting overdue tasks: %s", e)
         raise HTTPException(status_code=500, detail="Internal server error")
\ No newline at end of file
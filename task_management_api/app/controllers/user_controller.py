@@ -3,7 +3,8 @@ User Controller - API Layer for User Management
 Handles HTTP requests/responses and delegates business logic to UserService
 """
 
-from fastapi import APIRouter, HTTPException, status, Depends, Query
+from fastapi import APIRouter, HTTPException, status, Depends, Query, Response
+from fastapi.responses import ORJSONResponse
 from typing import Optional, List
 import logging
 
@@ -14,11 +15,16 @@ from ..dto.user_dto import (
 from ..services.user_service import (
     UserService, UserNotFoundError, UserValidationError, UnauthorizedUserOperationError
 )
+from ..dependencies import get_user_service, mock_current_user
 
 logger = logging.getLogger(__name__)
 
 # Create router for user endpoints with specific name
-router = APIRouter(prefix="/api/v1/users", tags=["users"])
+router = APIRouter(prefix="/api/v1/users", tags=["users"], default_response_class=ORJSONResponse)
+
+# Endpoints return pre-serialized JSON with response_model=None, so the DTO the
+# service already validated is not validated and encoded a second time
+JSON_MEDIA_TYPE = "application/json"
 
 class UserController:
     """
@@ -38,52 +44,46 @@ class UserController:
         # TODO: Implement actual authentication
         return "admin_user"  # Mock admin user for demo
 
-# Register User Management Endpoints
-from sqlalchemy.orm import Session
-from app.database import get_db
-from app.repositories.user_repository import UserRepository
-from app.services.user_service import UserService
-
-# Dependency to get user service
-def get_user_service(db: Session = Depends(get_db)) -> UserService:
-    """Get user service with dependencies"""
-    repository = UserRepository(db)
-    return UserService(repository)
+# Mock current user for the user-management routes, an admin (see mock_current_user)
+get_current_user = mock_current_user("admin_user")
 
 # User Management Endpoints
+# Plain `def` routes run in FastAPI's threadpool, keeping blocking DB calls off the event loop
 @router.post(
     "/",
-    response_model=UserResponse,
+    response_model=None,
+    responses={201: {"model": UserResponse}},
     status_code=status.HTTP_201_CREATED,
     summary="Create a new user",
     description="Create a new user account"
 )
-async def create_user(
+def create_user(
     request: CreateUserRequest,
     user_service: UserService = Depends(get_user_service),
-    current_user: str = Depends(lambda: "admin_user")  # Mock current user
+    current_user: str = Depends(get_current_user)  # Mock current user
 ):
     """Create a new user"""
     try:
         user = user_service.create_user(request, current_user)
-        return user
+        return Response(content=user.model_dump_json(), media_type=JSON_MEDIA_TYPE, status_code=status.HTTP_201_CREATED)
     except UserValidationError as e:
-        logger.warning(f"User validation error: {e}")
+        logger.warning("User validation error: %s", e)
         raise HTTPException(status_code=400, detail=str(e))
     except UnauthorizedUserOperationError as e:
-        logger.warning(f"Unauthorized user operation: {e}")
+        logger.warning("Unauthorized user operation: %s", e)
         raise HTTPException(status_code=403, detail=str(e))
     except Exception as e:
-        logger.error(f"Error creating user: {e}")
+        logger.error("Error creating user: %s", e)
         raise HTTPException(status_code=500, detail="Internal server error")
 
 @router.get(
     "/",
-    response_model=UserListResponse,
+    response_model=None,
+    responses={200: {"model": UserListResponse}},
     summary="Get users with pagination",
     description="Get a paginated list of users with optional filtering"
 )
-async def get_users(
+def get_users(
     page: int = Query(1, ge=1, description="Page number"),
     size: int = Query(10, ge=1, le=100, description="Page size"),
     role: Optional[str] = Query(None, description="Filter by role"),
@@ -91,8 +91,10 @@ async def get_users(
     search: Optional[str] = Query(None, description="Search in username, name, email"),
     sort_by: str = Query("created_at", description="Sort field"),
     sort_order: str = Query("desc", pattern="^(asc|desc)$", description="Sort order"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page (keyset pagination, ignores page)"),
+    include_total: bool = Query(True, description="Count all matching users; false omits total/total_pages"),
     user_service: UserService = Depends(get_user_service),
-    current_user: str = Depends(lambda: "admin_user")
+    current_user: str = Depends(get_current_user)
 ):
     """Get paginated list of users"""
     try:
@@ -103,53 +105,59 @@ async def get_users(
             status=status,
             search=search,
             sort_by=sort_by,
-            sort_order=sort_order
+            sort_order=sort_order,
+            cursor=cursor,
+            include_total=include_total
         )
         users = user_service.get_users_paginated(query_params, current_user)
-        return users
+        return Response(content=users.model_dump_json(), media_type=JSON_MEDIA_TYPE)
+    except UserValidationError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
-        logger.error(f"Error getting users: {e}")
+        logger.error("Error getting users: %s", e)
         raise HTTPException(status_code=500, detail="Internal server error")
 
 @router.get(
     "/{user_id}",
-    response_model=UserResponse,
+    response_model=None,
+    responses={200: {"model": UserResponse}},
     summary="Get user by ID",
     description="Retrieve a specific user by their ID"
 )
-async def get_user(
+def get_user(
     user_id: int,
     user_service: UserService = Depends(get_user_service),
-    current_user: str = Depends(lambda: "admin_user")
+    current_user: str = Depends(get_current_user)
 ):
     """Get a specific user by ID"""
     try:
         user = user_service.get_user_by_id(user_id, current_user)
-        return user
+        return Response(content=user.model_dump_json(), media_type=JSON_MEDIA_TYPE)
     except UserNotFoundError:
         raise HTTPException(status_code=404, detail=f"User with ID {user_id} not found")
     except UnauthorizedUserOperationError:
         raise HTTPException(status_code=403, detail="Not authorized to access this user")
     except Exception as e:
-        logger.error(f"Error getting user {user_id}: {e}")
+        logger.error("Error getting user %s: %s", user_id, e)
         raise HTTPException(status_code=500, detail="Internal server error")
 
 @router.put(
     "/{user_id}",
-    response_model=UserResponse,
+    response_model=None,
+    responses={200: {"model": UserResponse}},
     summary="Update user",
     description="Update an existing user"
 )
-async def update_user(
+def update_user(
     user_id: int,
     request: UpdateUserRequest,
     user_service: UserService = Depends(get_user_service),
-    current_user: str = Depends(lambda: "admin_user")
+    current_user: str = Depends(get_current_user)
 ):
     """Update an existing user"""
     try:
         user = user_service.update_user(user_id, request, current_user)
-        return user
+        return Response(content=user.model_dump_json(), media_type=JSON_MEDIA_TYPE)
     except UserNotFoundError:
         raise HTTPException(status_code=404, detail=f"User with ID {user_id} not found")
     except UnauthorizedUserOperationError:
@@ -157,7 +165,7 @@ async def update_user(
     except UserValidationError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
-        logger.error(f"Error updating user {user_id}: {e}")
+        logger.error("Error updating user %s: %s", user_id, e)
         raise HTTPException(status_code=500, detail="Internal server error")
 
 @router.delete(
@@ -166,10 +174,10 @@ async def update_user(
     summary="Delete user",
     description="Delete a user (soft delete)"
 )
-async def delete_user(
+def delete_user(
     user_id: int,
     user_service: UserService = Depends(get_user_service),
-    current_user: str = Depends(lambda: "admin_user")
+    current_user: str = Depends(get_current_user)
 ):
     """Delete a user"""
     try:
@@ -184,36 +192,38 @@ async def delete_user(
     except UserValidationError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
-        logger.error(f"Error deleting user {user_id}: {e}")
+        logger.error("Error deleting user %s: %s", user_id, e)
         raise HTTPException(status_code=500, detail="Internal server error")
 
 @router.get(
     "/stats/overview",
-    response_model=UserStatsResponse,
+    response_model=None,
+    responses={200: {"model": UserStatsResponse}},
     summary="Get user statistics",
     description="Get user statistics overview (admin only)"
 )
-async def get_user_statistics(
+def get_user_statistics(
     user_service: UserService = Depends(get_user_service),
-    current_user: str = Depends(lambda: "admin_user")
+    current_user: str = Depends(get_current_user)
 ):
     """Get user statistics"""
     try:
         stats = user_service.get_user_statistics(current_user)
-        return stats
+        return Response(content=stats.model_dump_json(), media_type=JSON_MEDIA_TYPE)
     except UnauthorizedUserOperationError:
         raise HTTPException(status_code=403, detail="Only admins can view user statistics")
     except Exception as e:
-        logger.error(f"Error getting user statistics: {e}")
+        logger.error("Error getting user statistics: %s", e)
         raise HTTPException(status_code=500, detail="Internal server error")
 
 @router.post(
     "/authenticate",
-    response_model=UserResponse,
+    response_model=None,
+    responses={200: {"model": UserResponse}},
     summary="Authenticate user",
     description="Authenticate user with username and password"
 )
-async def authenticate_user(
+def authenticate_user(
     username: str = Query(..., description="Username"),
     password: str = Query(..., description="Password"),
     user_service: UserService = Depends(get_user_service)
@@ -223,9 +233,9 @@ async def authenticate_user(
         user = user_service.authenticate_user(username, password)
         if not user:
             raise HTTPException(status_code=401, detail="Invalid credentials")
-        return user
+        return Response(content=user.model_dump_json(), media_type=JSON_MEDIA_TYPE)
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error authenticating user: {e}")
+        logger.error("Error authenticating user: %s", e)
         raise HTTPException(status_code=500, detail="Internal server error")
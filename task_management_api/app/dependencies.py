@@ -0,0 +1,42 @@
+"""
+FastAPI dependency providers shared by the controllers
+Each request gets its own session (get_db) and a repository/service pair bound to it
+"""
+
+from typing import Awaitable, Callable
+
+from fastapi import Depends
+from sqlalchemy.orm import Session
+
+from .database import get_db
+from .repositories.task_repository import TaskRepository
+from .repositories.user_repository import UserRepository
+from .services.task_service import TaskService
+from .services.user_service import UserService
+
+
+# The providers do no I/O, so they are `async def`: FastAPI calls them on the event
+# loop instead of dispatching each one to the threadpool
+
+def mock_current_user(username: str) -> Callable[[], Awaitable[str]]:
+    """
+    Current-user dependency that always returns username (no real authentication yet)
+    
+    Bind the result to a module-level name and use that in every route, so the routes
+    share one dependency that FastAPI resolves once per request.
+    """
+    async def get_current_user() -> str:
+        """Get current authenticated user"""
+        return username
+    
+    return get_current_user
+
+
+async def get_task_service(db: Session = Depends(get_db)) -> TaskService:
+    """Get task service with dependencies"""
+    return TaskService(TaskRepository(db))
+
+
+async def get_user_service(db: Session = Depends(get_db)) -> UserService:
+    """Get user service with dependencies"""
+    return UserService(UserRepository(db))
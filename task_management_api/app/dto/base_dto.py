@@ -0,0 +1,34 @@
+"""
+Base DTO - Common configuration for all Data Transfer Objects
+"""
+
+from pydantic import BaseModel, ConfigDict
+
+
+class BaseDTO(BaseModel):
+    """
+    Base class for all DTOs
+    
+    defer_build postpones building each model's validator/serializer until it is
+    first used, so importing the DTO modules at startup does not compile every
+    schema up front. Subclass model_config values are merged with this one.
+    """
+    model_config = ConfigDict(defer_build=True)
+
+
+class ResponseDTO(BaseDTO):
+    """
+    Base class for response DTOs whose optional fields are usually null
+    
+    Serializes with exclude_none=True by default: null fields are left out of the
+    payload (callers can still pass exclude_none=False). Applies to nested DTOs too
+    when a list response is dumped.
+    """
+    
+    def model_dump(self, **kwargs):
+        kwargs.setdefault('exclude_none', True)
+        return super().model_dump(**kwargs)
+    
+    def model_dump_json(self, **kwargs):
+        kwargs.setdefault('exclude_none', True)
+        return super().model_dump_json(**kwargs)
@@ -3,11 +3,16 @@ Task DTOs - Data Transfer Objects
 Used for API request/response serialization and validation
 """
 
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import Field, ConfigDict, TypeAdapter
 from typing import Optional, List
 from datetime import datetime
+import functools
+import operator
 from enum import Enum
 
+from .base_dto import BaseDTO, ResponseDTO
+from ..models.task import TaskStatus, TaskPriority, utc_now
+
 # Re-export enums for DTOs
 class TaskStatusDTO(str, Enum):
     PENDING = "pending"
@@ -23,8 +28,23 @@ class TaskPriorityDTO(str, Enum):
     URGENT = "urgent"
 
 
+# Domain enum -> DTO enum, built once instead of calling the Enum constructor per row
+_STATUS_MAP = {s: TaskStatusDTO(s.value) for s in TaskStatus}
+_PRIORITY_MAP = {p: TaskPriorityDTO(p.value) for p in TaskPriority}
+
+# Task attributes read by TaskResponse.from_domain_model, fetched in one C-level call
+_TASK_RESPONSE_ATTRS = operator.attrgetter(
+    'id', 'title', 'description', 'status', 'priority', 'created_by', 'assigned_to',
+    'created_at', 'updated_at', 'due_date', 'completed_at'
+)
+
+# DTO enum -> domain enum for incoming requests (inverse of the maps above)
+STATUS_FROM_DTO = {dto: status for status, dto in _STATUS_MAP.items()}
+PRIORITY_FROM_DTO = {dto: priority for priority, dto in _PRIORITY_MAP.items()}
+
+
 # Request DTOs (Input)
-class CreateTaskRequest(BaseModel):
+class CreateTaskRequest(BaseDTO):
     """DTO for creating a new task"""
     model_config = ConfigDict(
         json_schema_extra={
@@ -46,7 +66,7 @@ class CreateTaskRequest(BaseModel):
     created_by: str = Field(..., max_length=100, description="User who created the task")
 
 
-class UpdateTaskRequest(BaseModel):
+class UpdateTaskRequest(BaseDTO):
     """DTO for updating an existing task"""
     model_config = ConfigDict(
         json_schema_extra={
@@ -68,7 +88,7 @@ class UpdateTaskRequest(BaseModel):
     due_date: Optional[datetime] = None
 
 
-class TaskQueryParams(BaseModel):
+class TaskQueryParams(BaseDTO):
     """DTO for task query parameters"""
     status: Optional[TaskStatusDTO] = None
     priority: Optional[TaskPriorityDTO] = None
@@ -78,10 +98,13 @@ class TaskQueryParams(BaseModel):
     size: int = Field(10, ge=1, le=100, description="Page size")
     sort_by: str = Field("created_at", description="Sort field")
     sort_order: str = Field("desc", pattern="^(asc|desc)$", description="Sort order")
+    view: str = Field("full", pattern="^(full|summary)$", description="full or summary (no description/completed_at)")
+    cursor: Optional[str] = Field(None, description="next_cursor of the previous page; switches to keyset pagination (sort_by=created_at only)")
+    include_total: bool = Field(True, description="Count all matching tasks (total/total_pages); false skips the count")
 
 
 # Response DTOs (Output)
-class TaskResponse(BaseModel):
+class TaskResponse(ResponseDTO):
     """DTO for task response"""
     model_config = ConfigDict(from_attributes=True)
     
@@ -99,36 +122,116 @@ class TaskResponse(BaseModel):
     is_overdue: bool = False
     
     @classmethod
-    def from_domain_model(cls, task) -> 'TaskResponse':
-        """Convert domain model to DTO"""
-        return cls(
+    def from_domain_model(cls, task, is_overdue: Optional[bool] = None, now: Optional[datetime] = None) -> 'TaskResponse':
+        """
+        Convert domain model to DTO
+        
+        is_overdue may be passed in when the query already computed it
+        (see TaskRepository.get_paginated); otherwise it is derived from the task,
+        against now when given (pass one timestamp when converting a list).
+        
+        Uses model_construct: the values come from the ORM entity, which the
+        database already typed, so pydantic validation is skipped. Request DTOs
+        (untrusted input) keep full validation.
+        """
+        (task_id, title, description, status, priority, created_by, assigned_to,
+         created_at, updated_at, due_date, completed_at) = _TASK_RESPONSE_ATTRS(task)
+        return cls.model_construct(
+            id=task_id,
+            title=title,
+            description=description,
+            status=_STATUS_MAP[status],
+            priority=_PRIORITY_MAP[priority],
+            created_by=created_by,
+            assigned_to=assigned_to,
+            created_at=created_at,
+            updated_at=updated_at,
+            due_date=due_date,
+            completed_at=completed_at,
+            is_overdue=task.is_overdue(now) if is_overdue is None else bool(is_overdue)
+        )
+    
+    @classmethod
+    def from_domain_models(cls, tasks, is_overdue: Optional[bool] = None) -> List['TaskResponse']:
+        """Convert a list of tasks; the overdue flag is derived against a single clock read"""
+        now = utc_now() if is_overdue is None else None
+        from_domain_model = cls.from_domain_model
+        return [from_domain_model(task, is_overdue, now) for task in tasks]
+
+
+class TaskSummaryResponse(ResponseDTO):
+    """DTO for task list cards - TaskResponse without description/completed_at"""
+    id: int
+    title: str
+    status: TaskStatusDTO
+    priority: TaskPriorityDTO
+    created_by: str
+    assigned_to: Optional[str]
+    created_at: datetime
+    updated_at: Optional[datetime]
+    due_date: Optional[datetime]
+    is_overdue: bool = False
+    
+    @classmethod
+    def from_domain_model(cls, task, is_overdue: Optional[bool] = None, now: Optional[datetime] = None) -> 'TaskSummaryResponse':
+        """Convert domain model to DTO (trusted ORM values, so no validation)"""
+        return cls.model_construct(
             id=task.id,
             title=task.title,
-            description=task.description,
-            status=TaskStatusDTO(task.status.value),
-            priority=TaskPriorityDTO(task.priority.value),
+            status=_STATUS_MAP[task.status],
+            priority=_PRIORITY_MAP[task.priority],
             created_by=task.created_by,
             assigned_to=task.assigned_to,
             created_at=task.created_at,
             updated_at=task.updated_at,
             due_date=task.due_date,
-            completed_at=task.completed_at,
-            is_overdue=task.is_overdue()
+            is_overdue=task.is_overdue(now) if is_overdue is None else bool(is_overdue)
         )
 
 
-class TaskListResponse(BaseModel):
+# Task columns the summary view loads (is_overdue is computed, not a column)
+TASK_SUMMARY_COLUMNS = tuple(name for name in TaskSummaryResponse.model_fields if name != 'is_overdue')
+
+
+# Built once, on first use: constructing a TypeAdapter compiles a schema (and would
+# force TaskResponse's deferred build at import), so create it lazily and reuse it
+@functools.lru_cache(maxsize=None)
+def _task_list_adapter() -> TypeAdapter:
+    return TypeAdapter(List[TaskResponse])
+
+
+def dump_tasks_json(tasks: List[TaskResponse]) -> bytes:
+    """Serialize a list of TaskResponse to JSON bytes in a single call (nulls omitted, as in ResponseDTO)"""
+    return _task_list_adapter().dump_json(tasks, exclude_none=True)
+
+
+class TaskListResponse(ResponseDTO):
     """DTO for paginated task list response"""
     tasks: List[TaskResponse]
-    total: int
-    page: int
+    # total/total_pages are None (omitted) for cursor pages and include_total=false; page for cursor pages
+    total: Optional[int]
+    page: Optional[int]
+    size: int
+    total_pages: Optional[int]
+    has_next: bool
+    has_previous: bool
+    next_cursor: Optional[str] = None
+
+
+class TaskSummaryListResponse(ResponseDTO):
+    """DTO for paginated task list response in the summary view"""
+    tasks: List[TaskSummaryResponse]
+    # total/total_pages are None (omitted) for cursor pages and include_total=false; page for cursor pages
+    total: Optional[int]
+    page: Optional[int]
     size: int
-    total_pages: int
+    total_pages: Optional[int]
     has_next: bool
     has_previous: bool
+    next_cursor: Optional[str] = None
 
 
-class TaskStatsResponse(BaseModel):
+class TaskStatsResponse(BaseDTO):
     """DTO for task statistics"""
     total_tasks: int
     pending_tasks: int
@@ -140,14 +243,14 @@ class TaskStatsResponse(BaseModel):
 
 
 # Error DTOs
-class ErrorResponse(BaseModel):
+class ErrorResponse(BaseDTO):
     """Standard error response"""
     error: str
     message: str
     details: Optional[dict] = None
 
 
-class ValidationErrorResponse(BaseModel):
+class ValidationErrorResponse(BaseDTO):
     """Validation error response"""
     error: str = "validation_error"
     message: str
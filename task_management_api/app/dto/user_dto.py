@@ -2,10 +2,14 @@
 User DTOs - Data Transfer Objects for User API
 """
 
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import Field, ConfigDict, field_validator
 from typing import Optional, List
 from datetime import datetime
 from enum import Enum
+import operator
+
+from .base_dto import BaseDTO, ResponseDTO
+from ..models.user import UserRole, UserStatus
 
 # Re-export enums for DTOs
 class UserRoleDTO(str, Enum):
@@ -19,8 +23,25 @@ class UserStatusDTO(str, Enum):
     INACTIVE = "inactive"
     SUSPENDED = "suspended"
 
+# Domain enum -> DTO enum, built once instead of calling the Enum constructor per row
+_ROLE_MAP = {r: UserRoleDTO(r.value) for r in UserRole}
+_STATUS_MAP = {s: UserStatusDTO(s.value) for s in UserStatus}
+
+# User attributes read by UserResponse.from_domain_model, fetched in one C-level call
+_USER_RESPONSE_ATTRS = operator.attrgetter(
+    'id', 'username', 'email', 'full_name', 'role', 'status',
+    'created_at', 'updated_at', 'last_login', 'email_verified'
+)
+
+# DTO enum -> domain enum for incoming requests (inverse of the maps above)
+ROLE_FROM_DTO = {dto: role for role, dto in _ROLE_MAP.items()}
+STATUS_FROM_DTO = {dto: status for status, dto in _STATUS_MAP.items()}
+
+# bcrypt only hashes the first 72 bytes of a password (bcrypt>=5 raises beyond that)
+PASSWORD_MAX_BYTES = 72
+
 # Request DTOs (Input)
-class CreateUserRequest(BaseModel):
+class CreateUserRequest(BaseDTO):
     """DTO for creating a new user"""
     model_config = ConfigDict(
         json_schema_extra={
@@ -39,15 +60,23 @@ class CreateUserRequest(BaseModel):
     full_name: str = Field(..., min_length=1, max_length=200, description="User's full name")
     password: str = Field(..., min_length=6, description="User password")
     role: UserRoleDTO = Field(UserRoleDTO.USER, description="User role")
+    
+    @field_validator("password")
+    @classmethod
+    def password_fits_bcrypt(cls, value: str) -> str:
+        """Limit the password to PASSWORD_MAX_BYTES, measured as UTF-8 bytes"""
+        if len(value.encode()) > PASSWORD_MAX_BYTES:
+            raise ValueError(f"password must be at most {PASSWORD_MAX_BYTES} bytes (UTF-8)")
+        return value
 
-class UpdateUserRequest(BaseModel):
+class UpdateUserRequest(BaseDTO):
     """DTO for updating an existing user"""
     full_name: Optional[str] = Field(None, min_length=1, max_length=200)
     email: Optional[str] = None
     role: Optional[UserRoleDTO] = None
     status: Optional[UserStatusDTO] = None
 
-class UserQueryParams(BaseModel):
+class UserQueryParams(BaseDTO):
     """DTO for user query parameters"""
     role: Optional[UserRoleDTO] = None
     status: Optional[UserStatusDTO] = None
@@ -56,9 +85,11 @@ class UserQueryParams(BaseModel):
     size: int = Field(10, ge=1, le=100, description="Page size")
     sort_by: str = Field("created_at", description="Sort field")
     sort_order: str = Field("desc", pattern="^(asc|desc)$", description="Sort order")
+    cursor: Optional[str] = Field(None, description="next_cursor of the previous page; switches to keyset pagination (sort_by=created_at only)")
+    include_total: bool = Field(True, description="Count all matching users (total/total_pages); false skips the count")
 
 # Response DTOs (Output)
-class UserResponse(BaseModel):
+class UserResponse(ResponseDTO):
     """DTO for user response"""
     model_config = ConfigDict(from_attributes=True)
     
@@ -75,31 +106,46 @@ class UserResponse(BaseModel):
     
     @classmethod
     def from_domain_model(cls, user) -> 'UserResponse':
-        """Convert domain model to DTO"""
-        return cls(
-            id=user.id,
-            username=user.username,
-            email=user.email,
-            full_name=user.full_name,
-            role=UserRoleDTO(user.role.value),
-            status=UserStatusDTO(user.status.value),
-            created_at=user.created_at,
-            updated_at=user.updated_at,
-            last_login=user.last_login,
-            email_verified=user.email_verified
+        """
+        Convert domain model to DTO
+        
+        Uses model_construct: the values come from the ORM entity, which the
+        database already typed, so pydantic validation is skipped. Request DTOs
+        (untrusted input) keep full validation.
+        """
+        (user_id, username, email, full_name, role, status,
+         created_at, updated_at, last_login, email_verified) = _USER_RESPONSE_ATTRS(user)
+        return cls.model_construct(
+            id=user_id,
+            username=username,
+            email=email,
+            full_name=full_name,
+            role=_ROLE_MAP[role],
+            status=_STATUS_MAP[status],
+            created_at=created_at,
+            updated_at=updated_at,
+            last_login=last_login,
+            email_verified=email_verified
         )
+    
+    @classmethod
+    def from_domain_models(cls, users) -> List['UserResponse']:
+        """Convert a list of users (see from_domain_model)"""
+        return list(map(cls.from_domain_model, users))
 
-class UserListResponse(BaseModel):
+class UserListResponse(ResponseDTO):
     """DTO for paginated user list response"""
     users: List[UserResponse]
-    total: int
-    page: int
+    # total/total_pages are None (omitted) for cursor pages and include_total=false; page for cursor pages
+    total: Optional[int]
+    page: Optional[int]
     size: int
-    total_pages: int
+    total_pages: Optional[int]
     has_next: bool
     has_previous: bool
+    next_cursor: Optional[str] = None
 
-class UserStatsResponse(BaseModel):
+class UserStatsResponse(BaseDTO):
     """DTO for user statistics"""
     total_users: int
     active_users: int
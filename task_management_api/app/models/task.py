@@ -3,14 +3,21 @@ Task Model - Domain Entity
 Represents the core business entity in our domain
 """
 
-from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, Enum
-from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy import String, Text, DateTime, Enum, Index
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 from sqlalchemy.sql import func
 from enum import Enum as PyEnum
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional
 
-Base = declarative_base()
+
+class Base(DeclarativeBase):
+    """
+    Declarative base for all domain entities (SQLAlchemy 2.0 typed mapping)
+    
+    Entities keep an instance __dict__: SQLAlchemy's attribute instrumentation
+    stores loaded state there, so mapped classes cannot use __slots__.
+    """
 
 
 class TaskStatus(PyEnum):
@@ -29,6 +36,29 @@ class TaskPriority(PyEnum):
     URGENT = "urgent"
 
 
+# Statuses after which a task can no longer be edited or become overdue
+CLOSED_STATUSES = frozenset((TaskStatus.COMPLETED, TaskStatus.CANCELLED))
+
+
+def utc_now() -> datetime:
+    """
+    Current UTC time as a naive datetime, the form the DATETIME columns hold
+    (replaces datetime.utcnow(), deprecated since Python 3.12)
+    """
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def string_enum(enum_class: type) -> Enum:
+    """
+    Enum column type stored as VARCHAR(20) instead of a database-native ENUM
+    
+    Values (the member names, as before) are plain strings to the database, so
+    adding a member needs no ALTER of an ENUM type; the name <-> member mapping
+    happens in Python. No CHECK constraint is emitted.
+    """
+    return Enum(enum_class, native_enum=False, create_constraint=False, length=20, validate_strings=False)
+
+
 class Task(Base):
     """
     Task Entity - Core domain model
@@ -37,42 +67,57 @@ class Task(Base):
     Following Domain-Driven Design principles.
     """
     __tablename__ = "tasks"
+    __table_args__ = (
+        # Every repository query filters on is_deleted, then status/priority/due_date
+        Index("ix_task_active_filters", "is_deleted", "status", "priority", "due_date"),
+        Index("ix_task_assigned_active", "assigned_to", "is_deleted"),
+        Index("ix_task_created_by_active", "created_by", "is_deleted"),
+        # Duplicate-title check on create (TaskRepository.title_exists_for_user)
+        Index("ix_task_creator_title", "created_by", "title"),
+        # Overdue scans: status IN (open statuses) plus a due_date range; the filters
+        # index above cannot range on due_date because priority sits in between
+        Index("ix_task_active_status_due", "is_deleted", "status", "due_date"),
+        # Keyset pagination order (TaskRepository.get_page_after)
+        Index("ix_task_active_created", "is_deleted", "created_at", "id"),
+        # Substring search over title/description (MySQL InnoDB FULLTEXT, ngram parser;
+        # fulltext_indexes.sql adds it to existing tables). Created on MySQL only: elsewhere
+        # it would be a plain B-tree over the TEXT column
+        Index("ix_task_title_description_fulltext", "title", "description",
+              mysql_prefix="FULLTEXT", mysql_with_parser="ngram").ddl_if(dialect="mysql"),
+    )
     
     # Primary key
-    id = Column(Integer, primary_key=True, index=True)
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
     
     # Basic task information
-    title = Column(String(200), nullable=False, index=True)
-    description = Column(Text, nullable=True)
+    title: Mapped[str] = mapped_column(String(200), index=True)
+    description: Mapped[Optional[str]] = mapped_column(Text)
     
     # Task metadata
-    status = Column(Enum(TaskStatus), default=TaskStatus.PENDING, nullable=False, index=True)
-    priority = Column(Enum(TaskPriority), default=TaskPriority.MEDIUM, nullable=False)
+    status: Mapped[TaskStatus] = mapped_column(string_enum(TaskStatus), default=TaskStatus.PENDING, index=True)
+    priority: Mapped[TaskPriority] = mapped_column(string_enum(TaskPriority), default=TaskPriority.MEDIUM)
     
     # Ownership and assignment
-    created_by = Column(String(100), nullable=False)
-    assigned_to = Column(String(100), nullable=True)
+    created_by: Mapped[str] = mapped_column(String(100))
+    assigned_to: Mapped[Optional[str]] = mapped_column(String(100))
     
     # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now(), nullable=True)
-    due_date = Column(DateTime(timezone=True), nullable=True)
-    completed_at = Column(DateTime(timezone=True), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), onupdate=func.now())
+    due_date: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
+    completed_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
     
     # Flags
-    is_deleted = Column(Boolean, default=False, nullable=False)
+    is_deleted: Mapped[bool] = mapped_column(default=False)
     
     def __repr__(self) -> str:
-        return f"<Task(id={self.id}, title='{self.title}', status='{self.status.value}')>"
-    
-    def __str__(self) -> str:
-        return f"Task: {self.title} ({self.status.value})"
+        return f"<Task id={self.id}>"
     
     # Domain methods (business logic at entity level)
-    def mark_as_completed(self) -> None:
-        """Mark task as completed with timestamp"""
+    def mark_as_completed(self, now: Optional[datetime] = None) -> None:
+        """Mark task as completed with timestamp (now defaults to utc_now())"""
         self.status = TaskStatus.COMPLETED
-        self.completed_at = datetime.utcnow()
+        self.completed_at = now or utc_now()
     
     def assign_to_user(self, user_id: str) -> None:
         """Assign task to a user"""
@@ -84,15 +129,18 @@ class Task(Base):
         """Cancel the task"""
         self.status = TaskStatus.CANCELLED
     
-    def is_overdue(self) -> bool:
-        """Check if task is overdue"""
+    def is_overdue(self, now: Optional[datetime] = None) -> bool:
+        """
+        Check if task is overdue
+        Callers checking many tasks should read the clock once and pass it as now
+        """
         if not self.due_date:
             return False
         return (
-            self.due_date < datetime.utcnow() and 
-            self.status not in [TaskStatus.COMPLETED, TaskStatus.CANCELLED]
+            self.due_date < (now or utc_now()) and 
+            self.status not in CLOSED_STATUSES
         )
     
     def can_be_edited(self) -> bool:
         """Check if task can be edited"""
-        return self.status not in [TaskStatus.COMPLETED, TaskStatus.CANCELLED]
+        return self.status not in CLOSED_STATUSES
@@ -3,11 +3,13 @@ User Model - Domain Entity
 Represents a user in our system
 """
 
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Enum
+from sqlalchemy import String, DateTime, Index
+from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql import func
 from enum import Enum as PyEnum
 from datetime import datetime
-from .task import Base  # Use the same Base as Task
+from typing import Optional
+from .task import Base, string_enum, utc_now  # Use the same Base as Task
 
 class UserRole(PyEnum):
     """User role enumeration"""
@@ -27,36 +29,44 @@ class User(Base):
     User Entity - Core domain model for users
     """
     __tablename__ = "users"
+    __table_args__ = (
+        # Keyset pagination order (UserRepository.get_page_after)
+        Index("ix_user_active_created", "is_deleted", "created_at", "id"),
+        # Role/status filtered list pages, newest first (UserRepository._apply_page_filters)
+        Index("ix_user_active_status_role_created", "is_deleted", "status", "role", "created_at"),
+        # Substring search over username/full_name/email (MySQL InnoDB FULLTEXT, ngram parser;
+        # fulltext_indexes.sql adds it to existing tables). Created on MySQL only: elsewhere
+        # it would be a redundant B-tree over the three columns
+        Index("ix_user_search_fulltext", "username", "full_name", "email",
+              mysql_prefix="FULLTEXT", mysql_with_parser="ngram").ddl_if(dialect="mysql"),
+    )
     
     # Primary key
-    id = Column(Integer, primary_key=True, index=True)
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
     
     # Basic user information
-    username = Column(String(50), unique=True, nullable=False, index=True)
-    email = Column(String(100), unique=True, nullable=False, index=True)
-    full_name = Column(String(200), nullable=False)
+    username: Mapped[str] = mapped_column(String(50), unique=True, index=True)
+    email: Mapped[str] = mapped_column(String(100), unique=True, index=True)
+    full_name: Mapped[str] = mapped_column(String(200))
     
-    # Authentication (simplified - in real app, hash passwords!)
-    password_hash = Column(String(255), nullable=False)
+    # Authentication (bcrypt hash, see UserService._hash_password)
+    password_hash: Mapped[str] = mapped_column(String(255))
     
     # User metadata
-    role = Column(Enum(UserRole), default=UserRole.USER, nullable=False)
-    status = Column(Enum(UserStatus), default=UserStatus.ACTIVE, nullable=False)
+    role: Mapped[UserRole] = mapped_column(string_enum(UserRole), default=UserRole.USER)
+    status: Mapped[UserStatus] = mapped_column(string_enum(UserStatus), default=UserStatus.ACTIVE)
     
     # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now(), nullable=True)
-    last_login = Column(DateTime(timezone=True), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), onupdate=func.now())
+    last_login: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
     
     # Flags
-    is_deleted = Column(Boolean, default=False, nullable=False)
-    email_verified = Column(Boolean, default=False, nullable=False)
+    is_deleted: Mapped[bool] = mapped_column(default=False)
+    email_verified: Mapped[bool] = mapped_column(default=False)
     
     def __repr__(self) -> str:
-        return f"<User(id={self.id}, username='{self.username}', role='{self.role.value}')>"
-    
-    def __str__(self) -> str:
-        return f"User: {self.username} ({self.full_name})"
+        return f"<User id={self.id}>"
     
     # Domain methods
     def is_admin(self) -> bool:
@@ -71,6 +81,6 @@ class User(Base):
         """Check if user is active"""
         return self.status == UserStatus.ACTIVE and not self.is_deleted
     
-    def update_last_login(self) -> None:
-        """Update last login timestamp"""
-        self.last_login = datetime.utcnow()
+    def update_last_login(self, now: Optional[datetime] = None) -> None:
+        """Update last login timestamp (now defaults to utc_now())"""
+        self.last_login = now or utc_now()
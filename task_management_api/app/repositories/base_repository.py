@@ -5,14 +5,39 @@ Implements common database operations using Repository pattern
 
 from abc import ABC, abstractmethod
 from typing import Generic, TypeVar, List, Optional, Dict, Any
+from sqlalchemy import inspect, false, update, delete as sa_delete, exists as sa_exists
+from sqlalchemy.dialects.mysql import match as mysql_match
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
+import functools
 import logging
+import os
 
 T = TypeVar('T')
 
 logger = logging.getLogger(__name__)
 
+# Search through the MySQL FULLTEXT (ngram) indexes. Off by default: create_all does not
+# add indexes to existing tables, so enable it only once fulltext_indexes.sql has run
+FULLTEXT_SEARCH = os.getenv("FULLTEXT_SEARCH", "false").lower() == "true"
+
+# MySQL ngram_token_size default; shorter terms produce no tokens and match nothing
+NGRAM_TOKEN_SIZE = 2
+
+
+@functools.lru_cache(maxsize=None)
+def _column_map(model_class: type) -> Dict[str, Any]:
+    """Mapped column attributes of a model by name, built once per model class"""
+    return {prop.key: getattr(model_class, prop.key) for prop in inspect(model_class).column_attrs}
+
+
+@functools.lru_cache(maxsize=None)
+def _not_deleted_clause(model_class: type):
+    """Soft-delete filter (is_deleted = false) for models that have the flag, else None"""
+    if hasattr(model_class, 'is_deleted'):
+        return model_class.is_deleted == false()
+    return None
+
 
 class BaseRepository(Generic[T], ABC):
     """
@@ -25,6 +50,9 @@ class BaseRepository(Generic[T], ABC):
     def __init__(self, db_session: Session, model_class: type):
         self.db = db_session
         self.model_class = model_class
+        # Per-model lookups computed once and shared by every repository instance
+        self._columns = _column_map(model_class)
+        self._not_deleted = _not_deleted_clause(model_class)
     
     def create(self, entity: T) -> T:
         """Create a new entity"""
@@ -32,23 +60,25 @@ class BaseRepository(Generic[T], ABC):
             self.db.add(entity)
             self.db.commit()
             self.db.refresh(entity)
-            logger.info(f"Created {self.model_class.__name__} with id: {entity.id}")
+            logger.info("Created %s with id: %s", self.model_class.__name__, entity.id)
             return entity
         except SQLAlchemyError as e:
             self.db.rollback()
-            logger.error(f"Error creating {self.model_class.__name__}: {e}")
+            logger.error("Error creating %s: %s", self.model_class.__name__, e)
             raise
     
     def get_by_id(self, entity_id: int) -> Optional[T]:
         """Get entity by ID"""
         try:
-            entity = self.db.query(self.model_class).filter(
-                self.model_class.id == entity_id,
-                getattr(self.model_class, 'is_deleted', True) != True  # Soft delete check
-            ).first()
-            return entity
+            query = self.db.query(self.model_class).filter(self.model_class.id == entity_id)
+            
+            # Soft delete check
+            if self._not_deleted is not None:
+                query = query.filter(self._not_deleted)
+            
+            return query.first()
         except SQLAlchemyError as e:
-            logger.error(f"Error fetching {self.model_class.__name__} by id {entity_id}: {e}")
+            logger.error("Error fetching %s by id %s: %s", self.model_class.__name__, entity_id, e)
             raise
     
     def get_all(self, skip: int = 0, limit: int = 100) -> List[T]:
@@ -57,13 +87,13 @@ class BaseRepository(Generic[T], ABC):
             query = self.db.query(self.model_class)
             
             # Apply soft delete filter if model supports it
-            if hasattr(self.model_class, 'is_deleted'):
-                query = query.filter(self.model_class.is_deleted != True)
+            if self._not_deleted is not None:
+                query = query.filter(self._not_deleted)
             
             entities = query.offset(skip).limit(limit).all()
             return entities
         except SQLAlchemyError as e:
-            logger.error(f"Error fetching {self.model_class.__name__} list: {e}")
+            logger.error("Error fetching %s list: %s", self.model_class.__name__, e)
             raise
     
     def update(self, entity: T) -> T:
@@ -71,35 +101,44 @@ class BaseRepository(Generic[T], ABC):
         try:
             self.db.commit()
             self.db.refresh(entity)
-            logger.info(f"Updated {self.model_class.__name__} with id: {entity.id}")
+            logger.info("Updated %s with id: %s", self.model_class.__name__, entity.id)
             return entity
         except SQLAlchemyError as e:
             self.db.rollback()
-            logger.error(f"Error updating {self.model_class.__name__}: {e}")
+            logger.error("Error updating %s: %s", self.model_class.__name__, e)
             raise
     
     def delete(self, entity_id: int) -> bool:
-        """Delete entity (soft delete if supported, otherwise hard delete)"""
+        """
+        Delete entity (soft delete if supported, otherwise hard delete)
+        One UPDATE/DELETE statement; the affected row count tells whether it existed
+        """
         try:
-            entity = self.get_by_id(entity_id)
-            if not entity:
-                return False
-            
-            # Soft delete if supported
-            if hasattr(entity, 'is_deleted'):
-                entity.is_deleted = True
-                self.db.commit()
-                logger.info(f"Soft deleted {self.model_class.__name__} with id: {entity_id}")
+            if self._not_deleted is not None:
+                # Soft delete - rows already deleted do not match, as with get_by_id
+                result = self.db.execute(
+                    update(self.model_class)
+                    .where(self.model_class.id == entity_id, self._not_deleted)
+                    .values(is_deleted=True)
+                )
+                action = "Soft deleted"
             else:
                 # Hard delete
-                self.db.delete(entity)
-                self.db.commit()
-                logger.info(f"Hard deleted {self.model_class.__name__} with id: {entity_id}")
+                result = self.db.execute(
+                    sa_delete(self.model_class).where(self.model_class.id == entity_id)
+                )
+                action = "Hard deleted"
             
+            if result.rowcount == 0:
+                self.db.rollback()
+                return False
+            
+            self.db.commit()
+            logger.info("%s %s with id: %s", action, self.model_class.__name__, entity_id)
             return True
         except SQLAlchemyError as e:
             self.db.rollback()
-            logger.error(f"Error deleting {self.model_class.__name__} with id {entity_id}: {e}")
+            logger.error("Error deleting %s with id %s: %s", self.model_class.__name__, entity_id, e)
             raise
     
     def count(self, filters: Dict[str, Any] = None) -> int:
@@ -108,30 +147,45 @@ class BaseRepository(Generic[T], ABC):
             query = self.db.query(self.model_class)
             
             # Apply soft delete filter
-            if hasattr(self.model_class, 'is_deleted'):
-                query = query.filter(self.model_class.is_deleted != True)
+            if self._not_deleted is not None:
+                query = query.filter(self._not_deleted)
             
-            # Apply additional filters
+            # Apply additional filters (unknown fields are ignored)
             if filters:
                 for field, value in filters.items():
-                    if hasattr(self.model_class, field):
-                        query = query.filter(getattr(self.model_class, field) == value)
+                    column = self._columns.get(field)
+                    if column is not None:
+                        query = query.filter(column == value)
             
             return query.count()
         except SQLAlchemyError as e:
-            logger.error(f"Error counting {self.model_class.__name__}: {e}")
+            logger.error("Error counting %s: %s", self.model_class.__name__, e)
             raise
     
     def exists(self, entity_id: int) -> bool:
         """Check if entity exists"""
         try:
-            return self.db.query(self.model_class).filter(
-                self.model_class.id == entity_id
-            ).first() is not None
+            # SELECT EXISTS(...): a scalar bool, no row fetched or entity hydrated
+            return self.db.query(
+                sa_exists().where(self.model_class.id == entity_id)
+            ).scalar()
         except SQLAlchemyError as e:
-            logger.error(f"Error checking existence of {self.model_class.__name__} with id {entity_id}: {e}")
+            logger.error("Error checking existence of %s with id %s: %s", self.model_class.__name__, entity_id, e)
             raise
     
+    def _fulltext_condition(self, columns, search_term: str):
+        """
+        MATCH ... AGAINST filter over a FULLTEXT index, or None when not enabled
+        
+        The term is searched as a phrase in boolean mode; with the ngram parser that
+        matches it as a substring, like the ILIKE fallback the callers use on None.
+        """
+        if (not FULLTEXT_SEARCH or len(search_term) < NGRAM_TOKEN_SIZE
+                or self.db.get_bind().dialect.name != 'mysql'):
+            return None
+        phrase = search_term.replace('"', ' ')
+        return mysql_match(*columns, against=f'"{phrase}"').in_boolean_mode()
+    
     @abstractmethod
     def find_by_criteria(self, criteria: Dict[str, Any]) -> List[T]:
         """Find entities by specific criteria - to be implemented by subclasses"""
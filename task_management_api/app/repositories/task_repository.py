@@ -3,18 +3,75 @@ Task Repository - Data Access Layer for Tasks
 Implements specific data access operations for Task entities
 """
 
-from typing import List, Optional, Dict, Any, Tuple
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, desc, asc, func
+from typing import List, Optional, Dict, Any, Tuple, Iterable, Iterator
+from sqlalchemy.orm import Session, load_only, raiseload
+from sqlalchemy import and_, or_, desc, asc, func, case, false, literal, select, update, exists
 from datetime import datetime
 
-from ..models.task import Task, TaskStatus, TaskPriority
+from ..models.task import Task, TaskStatus, TaskPriority, utc_now
 from .base_repository import BaseRepository
+from ..cache import TTLCache
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+# Soft-delete filter as a plain equality (is_deleted = false) so it can lead the
+# composite indexes on Task; a negated "!= true" predicate often bypasses them
+NOT_DELETED = Task.is_deleted == false()
+
+# Dashboard statistics (global and per user), reused for a few seconds so polling
+# widgets hit memory instead of the aggregate query; task writes invalidate it
+STATS_CACHE = TTLCache(ttl_seconds=5.0, max_entries=256)
+GLOBAL_STATS_KEY = "global"
+
+# Max ids per statement in bulk_update_status
+BULK_UPDATE_BATCH_SIZE = 1000
+
+# Rows fetched per batch by the *_iter streaming finders
+STREAM_BATCH_SIZE = 1000
+
+# Loader options for list queries: Task has no relationships today, and any added
+# later must be eager-loaded explicitly (selectinload) rather than lazily per row
+LIST_LOADER_OPTIONS = (raiseload("*"),)
+
+# find_by_criteria keys -> columns; other keys are ignored
+CRITERIA_COLUMNS = {
+    'status': Task.status,
+    'priority': Task.priority,
+    'assigned_to': Task.assigned_to,
+    'created_by': Task.created_by,
+}
+
+# Columns the list endpoints may sort by; anything else is rejected
+SORT_COLUMNS = {
+    'id': Task.id,
+    'title': Task.title,
+    'status': Task.status,
+    'priority': Task.priority,
+    'created_by': Task.created_by,
+    'assigned_to': Task.assigned_to,
+    'created_at': Task.created_at,
+    'updated_at': Task.updated_at,
+    'due_date': Task.due_date,
+    'completed_at': Task.completed_at,
+}
+
+# Statuses for which a past due date means the task is overdue (see Task.is_overdue)
+OPEN_STATUSES = (TaskStatus.PENDING, TaskStatus.IN_PROGRESS)
+
+# Priorities counted as high priority (find_high_priority_tasks, statistics)
+HIGH_PRIORITIES = (TaskPriority.HIGH, TaskPriority.URGENT)
+
+
+def overdue_expression(current_time: datetime):
+    """SQL counterpart of Task.is_overdue(), evaluated against one timestamp for all rows"""
+    return case(
+        (and_(Task.due_date < current_time, Task.status.in_(OPEN_STATUSES)), True),
+        else_=False
+    ).label("is_overdue")
+
+
 class TaskRepository(BaseRepository[Task]):
     """
     Task Repository implementing specific data access operations
@@ -26,37 +83,64 @@ class TaskRepository(BaseRepository[Task]):
     def __init__(self, db_session: Session):
         super().__init__(db_session, Task)
     
+    def _search_condition(self, search_term: str):
+        """
+        Substring search filter on title/description: the ix_task_title_description_fulltext
+        index when FULLTEXT_SEARCH is enabled on MySQL, an ILIKE scan otherwise
+        """
+        fulltext = self._fulltext_condition((Task.title, Task.description), search_term)
+        if fulltext is not None:
+            return fulltext
+        search_pattern = f"%{search_term}%"
+        return or_(
+            Task.title.ilike(search_pattern),
+            Task.description.ilike(search_pattern)
+        )
+    
     def find_by_criteria(self, criteria: Dict[str, Any]) -> List[Task]:
         """Find tasks by multiple criteria"""
         try:
-            query = self.db.query(Task).filter(Task.is_deleted != True)
+            query = self.db.query(Task).filter(NOT_DELETED)
             
             # Apply filters based on criteria
-            if 'status' in criteria and criteria['status']:
-                query = query.filter(Task.status == criteria['status'])
-            
-            if 'priority' in criteria and criteria['priority']:
-                query = query.filter(Task.priority == criteria['priority'])
-            
-            if 'assigned_to' in criteria and criteria['assigned_to']:
-                query = query.filter(Task.assigned_to == criteria['assigned_to'])
-            
-            if 'created_by' in criteria and criteria['created_by']:
-                query = query.filter(Task.created_by == criteria['created_by'])
+            for key, value in criteria.items():
+                column = CRITERIA_COLUMNS.get(key)
+                if column is not None and value:
+                    query = query.filter(column == value)
             
             return query.all()
         except Exception as e:
-            logger.error(f"Error finding tasks by criteria {criteria}: {e}")
+            logger.error("Error finding tasks by criteria %s: %s", criteria, e)
+            raise
+    
+    def title_exists_for_user(self, created_by: str, title: str) -> bool:
+        """
+        Whether the user already has a (non-deleted) task with this title, ignoring case
+        
+        One SELECT EXISTS served by ix_task_creator_title. MySQL's default collation
+        already compares case-insensitively, so the column is compared as-is there and
+        the index stays usable; other dialects compare lower() values.
+        """
+        try:
+            if self.db.get_bind().dialect.name == 'mysql':
+                title_matches = Task.title == title
+            else:
+                title_matches = func.lower(Task.title) == title.lower()
+            return self.db.query(
+                exists().where(Task.created_by == created_by, title_matches, NOT_DELETED)
+            ).scalar()
+        except Exception as e:
+            logger.error("Error checking title '%s' for user %s: %s", title, created_by, e)
             raise
     
     def find_by_status(self, status: TaskStatus) -> List[Task]:
         """Find all tasks with specific status"""
         try:
             return self.db.query(Task).filter(
-                and_(Task.status == status, Task.is_deleted != True)
+                and_(Task.status == status, NOT_DELETED)
             ).all()
         except Exception as e:
-            logger.error(f"Error finding tasks by status {status}: {e}")
+            logger.error("Error finding tasks by status %s: %s", status, e)
             raise
     
     def find_by_user(self, user_id: str, include_created: bool = True, include_assigned: bool = True) -> List[Task]:
@@ -73,170 +157,384 @@ class TaskRepository(BaseRepository[Task]):
             if not conditions:
                 return []
             
-            query = self.db.query(Task).filter(
-                and_(or_(*conditions), Task.is_deleted != True)
+            query = self.db.query(Task).options(*LIST_LOADER_OPTIONS).filter(
+                and_(or_(*conditions), NOT_DELETED)
             )
             
             return query.all()
         except Exception as e:
-            logger.error(f"Error finding tasks for user {user_id}: {e}")
+            logger.error("Error finding tasks for user %s: %s", user_id, e)
             raise
     
-    def find_overdue_tasks(self) -> List[Task]:
-        """Find all overdue tasks"""
+    def _overdue_query(self, user_id: Optional[str] = None):
+        current_time = utc_now()
+        query = self.db.query(Task).filter(
+            and_(
+                Task.due_date < current_time,
+                Task.status.in_(OPEN_STATUSES),
+                NOT_DELETED
+            )
+        )
+        if user_id:
+            query = query.filter(or_(Task.created_by == user_id, Task.assigned_to == user_id))
+        return query
+    
+    def _high_priority_query(self):
+        return self.db.query(Task).filter(
+            and_(
+                Task.priority.in_(HIGH_PRIORITIES),
+                Task.status != TaskStatus.COMPLETED,
+                NOT_DELETED
+            )
+        )
+    
+    def find_overdue_tasks(self, user_id: Optional[str] = None) -> List[Task]:
+        """Find all overdue tasks, optionally only those a user created or is assigned to"""
         try:
-            current_time = datetime.utcnow()
-            return self.db.query(Task).filter(
-                and_(
-                    Task.due_date < current_time,
-                    Task.status.in_([TaskStatus.PENDING, TaskStatus.IN_PROGRESS]),
-                    Task.is_deleted != True
-                )
-            ).all()
+            return self._overdue_query(user_id).all()
         except Exception as e:
-            logger.error(f"Error finding overdue tasks: {e}")
+            logger.error("Error finding overdue tasks: %s", e)
             raise
     
+    def find_overdue_tasks_iter(self) -> Iterator[Task]:
+        """
+        Stream overdue tasks in batches from a server-side cursor
+        Memory stays flat regardless of result size; consume before the session closes
+        """
+        return iter(self._overdue_query().yield_per(STREAM_BATCH_SIZE))
+    
     def find_high_priority_tasks(self) -> List[Task]:
         """Find all high priority and urgent tasks"""
         try:
-            return self.db.query(Task).filter(
-                and_(
-                    Task.priority.in_([TaskPriority.HIGH, TaskPriority.URGENT]),
-                    Task.status != TaskStatus.COMPLETED,
-                    Task.is_deleted != True
-                )
-            ).all()
+            return self._high_priority_query().all()
         except Exception as e:
-            logger.error(f"Error finding high priority tasks: {e}")
+            logger.error("Error finding high priority tasks: %s", e)
             raise
     
+    def find_high_priority_tasks_iter(self) -> Iterator[Task]:
+        """Stream high priority and urgent tasks in batches (see find_overdue_tasks_iter)"""
+        return iter(self._high_priority_query().yield_per(STREAM_BATCH_SIZE))
+    
+    def _apply_page_filters(self, query, filters: Optional[Dict[str, Any]]):
+        """Apply the list-endpoint filters shared by get_paginated and get_page_after"""
+        if filters:
+            if filters.get('status'):
+                query = query.filter(Task.status == filters['status'])
+            
+            if filters.get('priority'):
+                query = query.filter(Task.priority == filters['priority'])
+            
+            if filters.get('assigned_to'):
+                query = query.filter(Task.assigned_to == filters['assigned_to'])
+            
+            if filters.get('created_by'):
+                query = query.filter(Task.created_by == filters['created_by'])
+            
+            if filters.get('search'):
+                query = query.filter(self._search_condition(filters['search']))
+        
+        return query
+    
+    def _page_query(
+        self,
+        extra_columns: tuple,
+        filters: Optional[Dict[str, Any]],
+        sort_by: str,
+        sort_order: str,
+        fields: Optional[Iterable[str]]
+    ):
+        """Filtered, sorted (Task, is_overdue, *extra_columns) query behind the offset paginators"""
+        query = self.db.query(
+            Task,
+            overdue_expression(utc_now()),
+            *extra_columns
+        ).options(*LIST_LOADER_OPTIONS).filter(NOT_DELETED)
+        
+        if fields:
+            query = query.options(load_only(*(getattr(Task, field) for field in fields)))
+        
+        # Apply filters
+        query = self._apply_page_filters(query, filters)
+        
+        # Apply sorting
+        sort_column = SORT_COLUMNS.get(sort_by)
+        if sort_column is None:
+            raise ValueError(f"Unsupported sort field: {sort_by}")
+        if sort_order.lower() == 'desc':
+            query = query.order_by(desc(sort_column))
+        else:
+            query = query.order_by(asc(sort_column))
+        
+        return query
+    
     def get_paginated(
         self, 
         page: int = 1, 
         size: int = 10, 
         filters: Dict[str, Any] = None,
         sort_by: str = 'created_at',
-        sort_order: str = 'desc'
-    ) -> Tuple[List[Task], int]:
+        sort_order: str = 'desc',
+        fields: Optional[Iterable[str]] = None
+    ) -> Tuple[List[Tuple[Task, bool]], int]:
         """
         Get paginated tasks with filtering and sorting
-        Returns (tasks, total_count)
+        Returns ([(task, is_overdue), ...], total_count) - is_overdue and the total
+        are computed by the database in the same query as the page itself
+        
+        fields limits the Task columns loaded (e.g. to skip the TEXT description
+        for list views); other columns are then loaded on first access.
         """
         try:
-            # Base query
-            query = self.db.query(Task).filter(Task.is_deleted != True)
+            query = self._page_query(
+                (func.count().over().label("total_count"),),  # Filtered total, before LIMIT/OFFSET
+                filters, sort_by, sort_order, fields
+            )
             
-            # Apply filters
-            if filters:
-                if filters.get('status'):
-                    query = query.filter(Task.status == filters['status'])
-                
-                if filters.get('priority'):
-                    query = query.filter(Task.priority == filters['priority'])
-                
-                if filters.get('assigned_to'):
-                    query = query.filter(Task.assigned_to == filters['assigned_to'])
-                
-                if filters.get('created_by'):
-                    query = query.filter(Task.created_by == filters['created_by'])
-                
-                if filters.get('search'):
-                    search_term = f"%{filters['search']}%"
-                    query = query.filter(
-                        or_(
-                            Task.title.ilike(search_term),
-                            Task.description.ilike(search_term)
-                        )
-                    )
+            # Apply pagination
+            offset = (page - 1) * size
+            rows = query.offset(offset).limit(size).all()
             
-            # Get total count before pagination
-            total_count = query.count()
+            if rows:
+                total_count = rows[0].total_count
+            elif page > 1:
+                # Page past the end carries no window value; count separately
+                total_count = query.order_by(None).count()
+            else:
+                total_count = 0
             
-            # Apply sorting
-            if hasattr(Task, sort_by):
-                sort_column = getattr(Task, sort_by)
-                if sort_order.lower() == 'desc':
-                    query = query.order_by(desc(sort_column))
-                else:
-                    query = query.order_by(asc(sort_column))
+            return [(task, is_overdue) for task, is_overdue, _ in rows], total_count
+            
+        except Exception as e:
+            logger.error("Error getting paginated tasks: %s", e)
+            raise
+    
+    def get_page(
+        self,
+        page: int = 1,
+        size: int = 10,
+        filters: Dict[str, Any] = None,
+        sort_by: str = 'created_at',
+        sort_order: str = 'desc',
+        fields: Optional[Iterable[str]] = None
+    ) -> Tuple[List[Tuple[Task, bool]], bool]:
+        """
+        get_paginated without the total: returns ([(task, is_overdue), ...], has_next)
+        
+        Counting every matching row is the expensive part of a page on large
+        filtered sets; one extra row is enough to tell whether a next page exists.
+        """
+        try:
+            query = self._page_query((), filters, sort_by, sort_order, fields)
             
-            # Apply pagination
             offset = (page - 1) * size
-            tasks = query.offset(offset).limit(size).all()
+            rows = query.offset(offset).limit(size + 1).all()
             
-            return tasks, total_count
+            has_next = len(rows) > size
+            return [(task, is_overdue) for task, is_overdue in rows[:size]], has_next
             
         except Exception as e:
-            logger.error(f"Error getting paginated tasks: {e}")
+            logger.error("Error getting tasks page %s: %s", page, e)
             raise
     
-    def get_task_statistics(self) -> Dict[str, int]:
-        """Get task statistics for dashboard"""
+    def get_page_after(
+        self,
+        after: Optional[Tuple[datetime, int]] = None,
+        size: int = 10,
+        filters: Dict[str, Any] = None,
+        sort_order: str = 'desc',
+        fields: Optional[Iterable[str]] = None
+    ) -> Tuple[List[Tuple[Task, bool]], bool]:
+        """
+        Keyset (cursor) pagination on (created_at, id)
+        Returns ([(task, is_overdue), ...], has_next)
+        
+        after is the (created_at, id) of the last row of the previous page (None for
+        the first page). The query seeks past it on ix_task_active_created instead of
+        scanning and discarding OFFSET rows, so deep pages cost the same as the first.
+        No total is computed; use get_paginated when one is needed.
+        """
         try:
-            base_query = self.db.query(Task).filter(Task.is_deleted != True)
-            
-            stats = {
-                'total_tasks': base_query.count(),
-                'pending_tasks': base_query.filter(Task.status == TaskStatus.PENDING).count(),
-                'in_progress_tasks': base_query.filter(Task.status == TaskStatus.IN_PROGRESS).count(),
-                'completed_tasks': base_query.filter(Task.status == TaskStatus.COMPLETED).count(),
-                'cancelled_tasks': base_query.filter(Task.status == TaskStatus.CANCELLED).count(),
-                'high_priority_tasks': base_query.filter(
-                    Task.priority.in_([TaskPriority.HIGH, TaskPriority.URGENT])
-                ).count()
-            }
-            
-            # Calculate overdue tasks
-            current_time = datetime.utcnow()
-            stats['overdue_tasks'] = base_query.filter(
-                and_(
-                    Task.due_date < current_time,
-                    Task.status.in_([TaskStatus.PENDING, TaskStatus.IN_PROGRESS])
-                )
-            ).count()
+            query = self.db.query(Task, overdue_expression(utc_now())).options(*LIST_LOADER_OPTIONS).filter(NOT_DELETED)
+            
+            if fields:
+                query = query.options(load_only(*(getattr(Task, field) for field in fields)))
+            
+            query = self._apply_page_filters(query, filters)
+            
+            descending = sort_order.lower() == 'desc'
+            if after is not None:
+                created_at, task_id = after
+                if descending:
+                    query = query.filter(or_(
+                        Task.created_at < created_at,
+                        and_(Task.created_at == created_at, Task.id < task_id)
+                    ))
+                else:
+                    query = query.filter(or_(
+                        Task.created_at > created_at,
+                        and_(Task.created_at == created_at, Task.id > task_id)
+                    ))
+            
+            direction = desc if descending else asc
+            # One extra row tells whether another page follows
+            rows = query.order_by(direction(Task.created_at), direction(Task.id)).limit(size + 1).all()
             
-            return stats
+            has_next = len(rows) > size
+            return [(task, is_overdue) for task, is_overdue in rows[:size]], has_next
             
         except Exception as e:
-            logger.error(f"Error getting task statistics: {e}")
+            logger.error("Error getting tasks after cursor %s: %s", after, e)
+            raise
+    
+    def _aggregate_statistics(self, *conditions) -> Dict[str, int]:
+        """Dashboard counts over the non-deleted tasks matching conditions, in one aggregate query"""
+        current_time = utc_now()
+        
+        def count_where(condition):
+            return func.sum(case((condition, 1), else_=0))
+        
+        row = self.db.query(
+            func.count(Task.id),
+            count_where(Task.status == TaskStatus.PENDING),
+            count_where(Task.status == TaskStatus.IN_PROGRESS),
+            count_where(Task.status == TaskStatus.COMPLETED),
+            count_where(Task.status == TaskStatus.CANCELLED),
+            count_where(Task.priority.in_(HIGH_PRIORITIES)),
+            count_where(and_(Task.due_date < current_time, Task.status.in_(OPEN_STATUSES)))
+        ).filter(NOT_DELETED, *conditions).one()
+        
+        # SUM over no rows is NULL, and MySQL returns SUM as DECIMAL
+        (total, pending, in_progress, completed, cancelled, high_priority, overdue) = (
+            int(value or 0) for value in row
+        )
+        
+        return {
+            'total_tasks': total,
+            'pending_tasks': pending,
+            'in_progress_tasks': in_progress,
+            'completed_tasks': completed,
+            'cancelled_tasks': cancelled,
+            'high_priority_tasks': high_priority,
+            'overdue_tasks': overdue
+        }
+    
+    def get_task_statistics(self) -> Dict[str, int]:
+        """Get task statistics for dashboard in a single aggregate query"""
+        try:
+            stats = STATS_CACHE.get(GLOBAL_STATS_KEY)
+            if stats is None:
+                stats = self._aggregate_statistics()
+                STATS_CACHE.set(GLOBAL_STATS_KEY, stats)
+            return dict(stats)
+        except Exception as e:
+            logger.error("Error getting task statistics: %s", e)
             raise
     
+    def get_user_task_statistics(self, user_id: str) -> Dict[str, int]:
+        """Task statistics for the tasks a user created or is assigned to (see find_by_user)"""
+        try:
+            stats = STATS_CACHE.get(('user', user_id))
+            if stats is None:
+                stats = self._aggregate_statistics(
+                    or_(Task.created_by == user_id, Task.assigned_to == user_id)
+                )
+                STATS_CACHE.set(('user', user_id), stats)
+            return dict(stats)
+        except Exception as e:
+            logger.error("Error getting task statistics for user %s: %s", user_id, e)
+            raise
+    
+    def invalidate_statistics(self) -> None:
+        """Drop cached statistics after a task write (any write can move several users' counts)"""
+        STATS_CACHE.invalidate()
+    
     def search_tasks(self, search_term: str, limit: int = 50) -> List[Task]:
         """Search tasks by title and description"""
         try:
-            search_pattern = f"%{search_term}%"
             return self.db.query(Task).filter(
-                and_(
-                    or_(
-                        Task.title.ilike(search_pattern),
-                        Task.description.ilike(search_pattern)
-                    ),
-                    Task.is_deleted != True
-                )
+                and_(self._search_condition(search_term), NOT_DELETED)
             ).limit(limit).all()
         except Exception as e:
-            logger.error(f"Error searching tasks with term '{search_term}': {e}")
+            logger.error("Error searching tasks with term '%s': %s", search_term, e)
             raise
     
-    def bulk_update_status(self, task_ids: List[int], new_status: TaskStatus) -> int:
-        """Bulk update status for multiple tasks"""
+    def _conditional_update(self, task_id: int, condition, **values) -> bool:
+        """
+        UPDATE one non-deleted task only if condition holds, in a single statement
+        Returns False when no row matched (missing, deleted or condition false)
+        """
         try:
-            updated_count = self.db.query(Task).filter(
-                and_(
-                    Task.id.in_(task_ids),
-                    Task.is_deleted != True
-                )
-            ).update(
-                {Task.status: new_status},
-                synchronize_session=False
+            result = self.db.execute(
+                update(Task).where(Task.id == task_id, NOT_DELETED, condition).values(**values),
+                execution_options={"synchronize_session": False}
+            )
+            self.db.commit()
+            # MySQL dialects report matched (not changed) rows, so a no-op update still counts
+            return result.rowcount == 1
+        except Exception as e:
+            self.db.rollback()
+            logger.error("Error updating task %s: %s", task_id, e)
+            raise
+    
+    def complete_if_authorized(self, task_id: int, user_id: str, completed_at: datetime) -> bool:
+        """Mark the task completed if user_id created it or is assigned to it (see Task.mark_as_completed)"""
+        return self._conditional_update(
+            task_id,
+            or_(Task.created_by == user_id, Task.assigned_to == user_id),
+            status=TaskStatus.COMPLETED,
+            completed_at=completed_at
+        )
+    
+    def assign_if_creator(self, task_id: int, assignee_id: str, user_id: str) -> bool:
+        """Assign the task if user_id created it; pending tasks move to in progress (see Task.assign_to_user)"""
+        return self._conditional_update(
+            task_id,
+            Task.created_by == user_id,
+            assigned_to=assignee_id,
+            status=case(
+                (Task.status == TaskStatus.PENDING, literal(TaskStatus.IN_PROGRESS, Task.status.type)),
+                else_=Task.status
             )
+        )
+    
+    def bulk_update_status(self, task_ids: List[int], new_status: TaskStatus) -> List[int]:
+        """
+        Bulk update status for multiple tasks
+        Returns the ids that were actually updated (missing/deleted ids are skipped)
+        """
+        try:
+            updated_ids = []
+            use_returning = self.db.get_bind().dialect.update_returning
+            
+            # Batched to keep each IN list under driver/database parameter limits
+            for start in range(0, len(task_ids), BULK_UPDATE_BATCH_SIZE):
+                condition = and_(Task.id.in_(task_ids[start:start + BULK_UPDATE_BATCH_SIZE]), NOT_DELETED)
+                
+                if use_returning:
+                    # UPDATE ... RETURNING id: changed ids in the same round trip
+                    result = self.db.execute(
+                        update(Task).where(condition).values(status=new_status).returning(Task.id),
+                        execution_options={"synchronize_session": False}
+                    )
+                    updated_ids.extend(result.scalars())
+                else:
+                    # No UPDATE ... RETURNING (MySQL): lock the matching rows, then update exactly those
+                    batch_ids = self.db.execute(
+                        select(Task.id).where(condition).with_for_update()
+                    ).scalars().all()
+                    if batch_ids:
+                        self.db.execute(
+                            update(Task).where(Task.id.in_(batch_ids)).values(status=new_status),
+                            execution_options={"synchronize_session": False}
+                        )
+                    updated_ids.extend(batch_ids)
             
             self.db.commit()
-            logger.info(f"Bulk updated {updated_count} tasks to status {new_status}")
-            return updated_count
+            self.invalidate_statistics()
+            logger.info("Bulk updated %s tasks to status %s", len(updated_ids), new_status)
+            return updated_ids
             
         except Exception as e:
             self.db.rollback()
-            logger.error(f"Error bulk updating tasks: {e}")
+            logger.error("Error bulk updating tasks: %s", e)
             raise
@@ -4,24 +4,59 @@ User Repository - Data Access Layer for Users
 
 from typing import List, Optional, Dict, Any, Tuple
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, desc, asc, func
+from sqlalchemy import and_, or_, desc, asc, func, case, false
+from datetime import datetime
 
 from ..models.user import User, UserRole, UserStatus
 from .base_repository import BaseRepository
+from ..cache import TTLCache
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Soft-delete filter as a plain equality, as in task_repository.NOT_DELETED
+NOT_DELETED = User.is_deleted == false()
+
+# User statistics for the admin dashboard; user writes invalidate it
+STATS_CACHE = TTLCache(ttl_seconds=30.0, max_entries=1)
+STATS_KEY = "user_stats"
+
+# username -> role for authorization checks. The cache is per worker process and an
+# update/delete only invalidates the entry in the worker that handled it, so only
+# non-admin roles are cached: a stale entry can then deny admin rights for up to the
+# TTL, never grant them. Admin roles are read from the database on every request.
+ROLE_CACHE = TTLCache(ttl_seconds=60.0, max_entries=1024)
+
+# Columns the list endpoint may sort by; anything else is rejected
+SORT_COLUMNS = {
+    'id': User.id,
+    'username': User.username,
+    'email': User.email,
+    'full_name': User.full_name,
+    'role': User.role,
+    'status': User.status,
+    'created_at': User.created_at,
+    'updated_at': User.updated_at,
+    'last_login': User.last_login,
+}
+
+# Shorter search terms are prefix matches served by the username/email B-tree indexes
+MIN_FULLTEXT_TERM_LENGTH = 3
+
 class UserRepository(BaseRepository[User]):
     """User Repository implementing specific data access operations"""
     
     def __init__(self, db_session: Session):
         super().__init__(db_session, User)
     
+    def _active(self):
+        """Query over non-deleted users - the starting point of every lookup here"""
+        return self.db.query(User).filter(NOT_DELETED)
+    
     def find_by_criteria(self, criteria: Dict[str, Any]) -> List[User]:
         """Find users by multiple criteria"""
         try:
-            query = self.db.query(User).filter(User.is_deleted != True)
+            query = self._active()
             
             if 'role' in criteria and criteria['role']:
                 query = query.filter(User.role == criteria['role'])
@@ -30,40 +65,126 @@ class UserRepository(BaseRepository[User]):
                 query = query.filter(User.status == criteria['status'])
             
             if 'search' in criteria and criteria['search']:
-                search_term = f"%{criteria['search']}%"
-                query = query.filter(
-                    or_(
-                        User.username.ilike(search_term),
-                        User.full_name.ilike(search_term),
-                        User.email.ilike(search_term)
-                    )
-                )
+                query = query.filter(self._search_condition(criteria['search']))
             
             return query.all()
         except Exception as e:
-            logger.error(f"Error finding users by criteria {criteria}: {e}")
+            logger.error("Error finding users by criteria %s: %s", criteria, e)
             raise
     
     def find_by_username(self, username: str) -> Optional[User]:
         """Find user by username"""
         try:
-            return self.db.query(User).filter(
-                and_(User.username == username, User.is_deleted != True)
-            ).first()
+            return self._active().filter(User.username == username).first()
         except Exception as e:
-            logger.error(f"Error finding user by username {username}: {e}")
+            logger.error("Error finding user by username %s: %s", username, e)
             raise
     
     def find_by_email(self, email: str) -> Optional[User]:
         """Find user by email"""
         try:
-            return self.db.query(User).filter(
-                and_(User.email == email, User.is_deleted != True)
-            ).first()
+            return self._active().filter(User.email == email).first()
+        except Exception as e:
+            logger.error("Error finding user by email %s: %s", email, e)
+            raise
+    
+    def get_role(self, username: str) -> Optional[UserRole]:
+        """Role of an active user, or None if there is none (non-admin roles cached, see ROLE_CACHE)"""
+        try:
+            role = ROLE_CACHE.get(username)
+            if role is None:
+                role = self.db.query(User.role).filter(NOT_DELETED, User.username == username).scalar()
+                if role is not None and role != UserRole.ADMIN:
+                    ROLE_CACHE.set(username, role)
+            return role
+        except Exception as e:
+            logger.error("Error getting role for user %s: %s", username, e)
+            raise
+    
+    def find_conflicts(
+        self,
+        username: Optional[str] = None,
+        email: Optional[str] = None,
+        exclude_id: Optional[int] = None
+    ) -> List[Tuple[str, str]]:
+        """
+        (username, email) of active users holding this username or this email, in one
+        column-only query (at most two rows; no User entities are loaded)
+        
+        exclude_id skips the user being updated.
+        """
+        try:
+            conditions = []
+            if username is not None:
+                conditions.append(User.username == username)
+            if email is not None:
+                conditions.append(User.email == email)
+            if not conditions:
+                return []
+            
+            query = self.db.query(User.username, User.email).filter(NOT_DELETED, or_(*conditions))
+            if exclude_id is not None:
+                query = query.filter(User.id != exclude_id)
+            
+            return [tuple(row) for row in query.limit(2).all()]
         except Exception as e:
-            logger.error(f"Error finding user by email {email}: {e}")
+            logger.error("Error finding conflicts for username %s / email %s: %s", username, email, e)
             raise
     
+    def _search_condition(self, search_term: str):
+        """
+        Substring search filter on username/full name/email
+        
+        Terms shorter than MIN_FULLTEXT_TERM_LENGTH are prefix matches on username
+        or email, which the unique B-tree indexes serve. Longer terms use the
+        ix_user_search_fulltext index when FULLTEXT_SEARCH is enabled on MySQL, and an
+        ILIKE scan otherwise.
+        """
+        if len(search_term) < MIN_FULLTEXT_TERM_LENGTH:
+            prefix_pattern = f"{search_term}%"
+            return or_(User.username.like(prefix_pattern), User.email.like(prefix_pattern))
+        fulltext = self._fulltext_condition((User.username, User.full_name, User.email), search_term)
+        if fulltext is not None:
+            return fulltext
+        search_pattern = f"%{search_term}%"
+        return or_(
+            User.username.ilike(search_pattern),
+            User.full_name.ilike(search_pattern),
+            User.email.ilike(search_pattern)
+        )
+    
+    def _apply_page_filters(self, query, filters: Optional[Dict[str, Any]]):
+        """Apply the list-endpoint filters shared by get_paginated and get_page_after"""
+        if filters:
+            if filters.get('role'):
+                query = query.filter(User.role == filters['role'])
+            
+            if filters.get('status'):
+                query = query.filter(User.status == filters['status'])
+            
+            if filters.get('search'):
+                query = query.filter(self._search_condition(filters['search']))
+        
+        return query
+    
+    def _page_query(self, filters: Optional[Dict[str, Any]], sort_by: str, sort_order: str):
+        """Filtered, sorted user query behind the offset paginators"""
+        query = self._active()
+        
+        # Apply filters
+        query = self._apply_page_filters(query, filters)
+        
+        # Apply sorting
+        sort_column = SORT_COLUMNS.get(sort_by)
+        if sort_column is None:
+            raise ValueError(f"Unsupported sort field: {sort_by}")
+        if sort_order.lower() == 'desc':
+            query = query.order_by(desc(sort_column))
+        else:
+            query = query.order_by(asc(sort_column))
+        
+        return query
+    
     def get_paginated(
         self, 
         page: int = 1, 
@@ -74,35 +195,9 @@ class UserRepository(BaseRepository[User]):
     ) -> Tuple[List[User], int]:
         """Get paginated users with filtering and sorting"""
         try:
-            query = self.db.query(User).filter(User.is_deleted != True)
-            
-            # Apply filters
-            if filters:
-                if filters.get('role'):
-                    query = query.filter(User.role == filters['role'])
-                
-                if filters.get('status'):
-                    query = query.filter(User.status == filters['status'])
-                
-                if filters.get('search'):
-                    search_term = f"%{filters['search']}%"
-                    query = query.filter(
-                        or_(
-                            User.username.ilike(search_term),
-                            User.full_name.ilike(search_term),
-                            User.email.ilike(search_term)
-                        )
-                    )
-            
-            total_count = query.count()
-            
-            # Apply sorting
-            if hasattr(User, sort_by):
-                sort_column = getattr(User, sort_by)
-                if sort_order.lower() == 'desc':
-                    query = query.order_by(desc(sort_column))
-                else:
-                    query = query.order_by(asc(sort_column))
+            query = self._page_query(filters, sort_by, sort_order)
+            
+            total_count = query.order_by(None).count()
             
             # Apply pagination
             offset = (page - 1) * size
@@ -111,25 +206,110 @@ class UserRepository(BaseRepository[User]):
             return users, total_count
             
         except Exception as e:
-            logger.error(f"Error getting paginated users: {e}")
+            logger.error("Error getting paginated users: %s", e)
+            raise
+    
+    def get_page(
+        self,
+        page: int = 1,
+        size: int = 10,
+        filters: Dict[str, Any] = None,
+        sort_by: str = 'created_at',
+        sort_order: str = 'desc'
+    ) -> Tuple[List[User], bool]:
+        """get_paginated without the COUNT query: returns (users, has_next)"""
+        try:
+            query = self._page_query(filters, sort_by, sort_order)
+            
+            # One extra row tells whether another page follows
+            offset = (page - 1) * size
+            users = query.offset(offset).limit(size + 1).all()
+            
+            return users[:size], len(users) > size
+            
+        except Exception as e:
+            logger.error("Error getting users page %s: %s", page, e)
+            raise
+    
+    def get_page_after(
+        self,
+        after: Optional[Tuple[datetime, int]] = None,
+        size: int = 10,
+        filters: Dict[str, Any] = None,
+        sort_order: str = 'desc'
+    ) -> Tuple[List[User], bool]:
+        """
+        Keyset (cursor) pagination on (created_at, id), as TaskRepository.get_page_after
+        Returns (users, has_next); no total is computed
+        """
+        try:
+            query = self._apply_page_filters(self._active(), filters)
+            
+            descending = sort_order.lower() == 'desc'
+            if after is not None:
+                created_at, user_id = after
+                if descending:
+                    query = query.filter(or_(
+                        User.created_at < created_at,
+                        and_(User.created_at == created_at, User.id < user_id)
+                    ))
+                else:
+                    query = query.filter(or_(
+                        User.created_at > created_at,
+                        and_(User.created_at == created_at, User.id > user_id)
+                    ))
+            
+            direction = desc if descending else asc
+            # One extra row tells whether another page follows
+            users = query.order_by(direction(User.created_at), direction(User.id)).limit(size + 1).all()
+            
+            return users[:size], len(users) > size
+            
+        except Exception as e:
+            logger.error("Error getting users after cursor %s: %s", after, e)
             raise
     
     def get_user_statistics(self) -> Dict[str, int]:
-        """Get user statistics"""
+        """Get user statistics in a single aggregate query (cached, see STATS_CACHE)"""
         try:
-            base_query = self.db.query(User).filter(User.is_deleted != True)
+            cached = STATS_CACHE.get(STATS_KEY)
+            if cached is not None:
+                return dict(cached)
+            
+            def count_where(condition):
+                return func.sum(case((condition, 1), else_=0))
+            
+            row = self.db.query(
+                func.count(User.id),
+                count_where(User.status == UserStatus.ACTIVE),
+                count_where(User.status == UserStatus.INACTIVE),
+                count_where(User.role == UserRole.ADMIN),
+                count_where(User.role == UserRole.MANAGER),
+                count_where(User.role == UserRole.USER)
+            ).filter(NOT_DELETED).one()
+            
+            # SUM over no rows is NULL, and MySQL returns SUM as DECIMAL
+            (total, active, inactive, admins, managers, regular) = (int(value or 0) for value in row)
             
             stats = {
-                'total_users': base_query.count(),
-                'active_users': base_query.filter(User.status == UserStatus.ACTIVE).count(),
-                'inactive_users': base_query.filter(User.status == UserStatus.INACTIVE).count(),
-                'admin_users': base_query.filter(User.role == UserRole.ADMIN).count(),
-                'manager_users': base_query.filter(User.role == UserRole.MANAGER).count(),
-                'regular_users': base_query.filter(User.role == UserRole.USER).count(),
+                'total_users': total,
+                'active_users': active,
+                'inactive_users': inactive,
+                'admin_users': admins,
+                'manager_users': managers,
+                'regular_users': regular,
             }
-            
-            return stats
+            STATS_CACHE.set(STATS_KEY, stats)
+            return dict(stats)
             
         except Exception as e:
-            logger.error(f"Error getting user statistics: {e}")
+            logger.error("Error getting user statistics: %s", e)
             raise
+    
+    def invalidate_statistics(self) -> None:
+        """Drop cached statistics after a user write"""
+        STATS_CACHE.invalidate()
+    
+    def invalidate_role(self, username: str) -> None:
+        """Drop a user's cached role after the user is updated or deleted"""
+        ROLE_CACHE.invalidate(username)
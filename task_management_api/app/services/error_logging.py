@@ -0,0 +1,42 @@
+"""
+Error logging shared by the services
+One decorator replaces the per-method try/except/log/raise blocks
+"""
+
+from typing import Callable, Tuple, Type
+import functools
+import inspect
+import logging
+
+
+def log_errors(operation: str, expected: Tuple[Type[Exception], ...] = ()) -> Callable:
+    """
+    Log unexpected exceptions raised by a service method, then re-raise them
+    
+    operation may name the method's parameters, e.g. "getting task {task_id}", so the
+    log says which entity failed; they are filled in only when an error is logged.
+    Exceptions listed in expected (business errors the controllers map to HTTP
+    responses) propagate without being logged.
+    """
+    def decorator(fn: Callable) -> Callable:
+        logger = logging.getLogger(fn.__module__)
+        signature = inspect.signature(fn)
+        
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            try:
+                return fn(*args, **kwargs)
+            except expected:
+                raise
+            except Exception:
+                try:
+                    message = operation.format_map(signature.bind(*args, **kwargs).arguments)
+                except (TypeError, KeyError):
+                    # The call itself did not match the signature
+                    message = operation
+                logger.exception("Error %s", message)
+                raise
+        
+        return wrapper
+    
+    return decorator
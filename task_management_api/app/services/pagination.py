@@ -0,0 +1,20 @@
+"""
+Keyset pagination cursors shared by the list services
+A cursor is the opaque (created_at, id) of the last row of a page
+"""
+
+from typing import Tuple
+from datetime import datetime
+import base64
+
+
+def encode_cursor(entity) -> str:
+    """Opaque keyset cursor for the row after which the next page starts"""
+    raw = f"{entity.created_at.isoformat()}|{entity.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """Inverse of encode_cursor; raises ValueError for malformed cursors"""
+    created_at, entity_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+    return datetime.fromisoformat(created_at), int(entity_id)
@@ -3,20 +3,36 @@ Task Service - Business Logic Layer
 Contains all business rules and orchestrates operations between controllers and repositories
 """
 
-from typing import List, Optional, Tuple, Dict, Any
-from datetime import datetime, timedelta
+from typing import List, Optional, Tuple, Dict, Any, Union
+from datetime import timedelta
 import logging
 
-from ..models.task import Task, TaskStatus, TaskPriority
-from ..repositories.task_repository import TaskRepository
+from ..models.task import Task, TaskStatus, utc_now
+from ..repositories.task_repository import TaskRepository, SORT_COLUMNS, HIGH_PRIORITIES
+from .pagination import encode_cursor, decode_cursor
+from .error_logging import log_errors
 from ..dto.task_dto import (
     CreateTaskRequest, UpdateTaskRequest, TaskQueryParams,
-    TaskResponse, TaskListResponse, TaskStatsResponse
+    TaskResponse, TaskListResponse, TaskStatsResponse,
+    TaskSummaryResponse, TaskSummaryListResponse, TASK_SUMMARY_COLUMNS,
+    STATUS_FROM_DTO, PRIORITY_FROM_DTO
 )
 
 logger = logging.getLogger(__name__)
 
 
+# Allowed (from, to) status changes, built once; membership is a single hash probe
+VALID_STATUS_TRANSITIONS = frozenset([
+    (TaskStatus.PENDING, TaskStatus.IN_PROGRESS),
+    (TaskStatus.PENDING, TaskStatus.CANCELLED),
+    (TaskStatus.IN_PROGRESS, TaskStatus.COMPLETED),
+    (TaskStatus.IN_PROGRESS, TaskStatus.PENDING),
+    (TaskStatus.IN_PROGRESS, TaskStatus.CANCELLED),
+    # Nothing leaves COMPLETED
+    (TaskStatus.CANCELLED, TaskStatus.PENDING),  # Can reopen cancelled tasks
+])
+
+
 class TaskNotFoundError(Exception):
     """Raised when a task is not found"""
     pass
@@ -32,17 +48,27 @@ class UnauthorizedOperationError(Exception):
     pass
 
 
+# Business errors the controllers turn into HTTP responses; log_errors does not log them
+TASK_ERRORS = (TaskNotFoundError, TaskValidationError, UnauthorizedOperationError)
+
+
 class TaskService:
     """
     Task Service implementing business logic
     
     This layer contains all business rules, validation, and orchestration logic.
     It acts as the intermediary between controllers and repositories.
+    
+    Transactions: the request's session autobegins on the first statement and each
+    write path ends in exactly one repository commit (or rollback), so a method's
+    reads and writes run in a single transaction. Keep it that way - do not add a
+    second commit to a write path.
     """
     
     def __init__(self, task_repository: TaskRepository):
         self.task_repository = task_repository
     
+    @log_errors("creating task", TASK_ERRORS)
     def create_task(self, request: CreateTaskRequest) -> TaskResponse:
         """
         Create a new task with business validation
@@ -52,55 +78,46 @@ class TaskService:
         - Due date cannot be in the past
         - High/Urgent priority tasks must have due date
         """
-        try:
-            # Business validation
-            self._validate_create_request(request)
-            
-            # Create domain entity
-            task = Task(
-                title=request.title,
-                description=request.description,
-                priority=TaskPriority(request.priority.value),
-                created_by=request.created_by,
-                assigned_to=request.assigned_to,
-                due_date=request.due_date,
-                status=TaskStatus.PENDING
-            )
-            
-            # Auto-assign if assigned to someone
-            if request.assigned_to:
-                task.assign_to_user(request.assigned_to)
-            
-            # Save to repository
-            created_task = self.task_repository.create(task)
-            
-            logger.info(f"Task created successfully: {created_task.id}")
-            return TaskResponse.from_domain_model(created_task)
-            
-        except Exception as e:
-            logger.error(f"Error creating task: {e}")
-            raise
+        # Business validation
+        self._validate_create_request(request)
+        
+        # Create domain entity
+        task = Task(
+            title=request.title,
+            description=request.description,
+            priority=PRIORITY_FROM_DTO[request.priority],
+            created_by=request.created_by,
+            assigned_to=request.assigned_to,
+            due_date=request.due_date,
+            status=TaskStatus.PENDING
+        )
+        
+        # Auto-assign if assigned to someone
+        if request.assigned_to:
+            task.assign_to_user(request.assigned_to)
+        
+        # Save to repository
+        created_task = self.task_repository.create(task)
+        self.task_repository.invalidate_statistics()
+        
+        logger.info("Task created successfully: %s", created_task.id)
+        return TaskResponse.from_domain_model(created_task)
     
+    @log_errors("getting task {task_id}", TASK_ERRORS)
     def get_task_by_id(self, task_id: int, requesting_user: str) -> TaskResponse:
         """Get task by ID with authorization check"""
-        try:
-            task = self.task_repository.get_by_id(task_id)
-            
-            if not task:
-                raise TaskNotFoundError(f"Task with ID {task_id} not found")
-            
-            # Authorization check
-            if not self._can_user_access_task(task, requesting_user):
-                raise UnauthorizedOperationError("User not authorized to access this task")
-            
-            return TaskResponse.from_domain_model(task)
-            
-        except (TaskNotFoundError, UnauthorizedOperationError):
-            raise
-        except Exception as e:
-            logger.error(f"Error getting task {task_id}: {e}")
-            raise
+        task = self.task_repository.get_by_id(task_id)
+        
+        if not task:
+            raise TaskNotFoundError(f"Task with ID {task_id} not found")
+        
+        # Authorization check
+        if not self._can_user_access_task(task, requesting_user):
+            raise UnauthorizedOperationError("User not authorized to access this task")
+        
+        return TaskResponse.from_domain_model(task)
     
+    @log_errors("updating task {task_id}", TASK_ERRORS)
     def update_task(self, task_id: int, request: UpdateTaskRequest, requesting_user: str) -> TaskResponse:
         """
         Update task with business validation
@@ -110,35 +127,30 @@ class TaskService:
         - Completed/Cancelled tasks cannot be edited
         - Status transitions must be valid
         """
-        try:
-            task = self.task_repository.get_by_id(task_id)
-            
-            if not task:
-                raise TaskNotFoundError(f"Task with ID {task_id} not found")
-            
-            # Authorization check
-            if not self._can_user_modify_task(task, requesting_user):
-                raise UnauthorizedOperationError("User not authorized to modify this task")
-            
-            # Business validation
-            if not task.can_be_edited():
-                raise TaskValidationError("Cannot edit completed or cancelled tasks")
-            
-            # Apply updates with validation
-            self._apply_task_updates(task, request)
-            
-            # Save changes
-            updated_task = self.task_repository.update(task)
-            
-            logger.info(f"Task updated successfully: {task_id}")
-            return TaskResponse.from_domain_model(updated_task)
-            
-        except (TaskNotFoundError, UnauthorizedOperationError, TaskValidationError):
-            raise
-        except Exception as e:
-            logger.error(f"Error updating task {task_id}: {e}")
-            raise
+        task = self.task_repository.get_by_id(task_id)
+        
+        if not task:
+            raise TaskNotFoundError(f"Task with ID {task_id} not found")
+        
+        # Authorization check
+        if not self._can_user_modify_task(task, requesting_user):
+            raise UnauthorizedOperationError("User not authorized to modify this task")
+        
+        # Business validation
+        if not task.can_be_edited():
+            raise TaskValidationError("Cannot edit completed or cancelled tasks")
+        
+        # Apply updates with validation
+        self._apply_task_updates(task, request)
+        
+        # Save changes
+        updated_task = self.task_repository.update(task)
+        self.task_repository.invalidate_statistics()
+        
+        logger.info("Task updated successfully: %s", task_id)
+        return TaskResponse.from_domain_model(updated_task)
     
+    @log_errors("deleting task {task_id}", TASK_ERRORS)
     def delete_task(self, task_id: int, requesting_user: str) -> bool:
         """
         Soft delete task
@@ -147,180 +159,190 @@ class TaskService:
         - Only task creator can delete
         - Cannot delete completed tasks (for audit purposes)
         """
-        try:
-            task = self.task_repository.get_by_id(task_id)
-            
-            if not task:
-                raise TaskNotFoundError(f"Task with ID {task_id} not found")
-            
-            # Authorization check - only creator can delete
-            if task.created_by != requesting_user:
-                raise UnauthorizedOperationError("Only task creator can delete tasks")
-            
-            # Business rule - cannot delete completed tasks
-            if task.status == TaskStatus.COMPLETED:
-                raise TaskValidationError("Cannot delete completed tasks")
-            
-            success = self.task_repository.delete(task_id)
-            
-            if success:
-                logger.info(f"Task deleted successfully: {task_id}")
-            
-            return success
-            
-        except (TaskNotFoundError, UnauthorizedOperationError, TaskValidationError):
-            raise
-        except Exception as e:
-            logger.error(f"Error deleting task {task_id}: {e}")
-            raise
+        task = self.task_repository.get_by_id(task_id)
+        
+        if not task:
+            raise TaskNotFoundError(f"Task with ID {task_id} not found")
+        
+        # Authorization check - only creator can delete
+        if task.created_by != requesting_user:
+            raise UnauthorizedOperationError("Only task creator can delete tasks")
+        
+        # Business rule - cannot delete completed tasks
+        if task.status == TaskStatus.COMPLETED:
+            raise TaskValidationError("Cannot delete completed tasks")
+        
+        success = self.task_repository.delete(task_id)
+        self.task_repository.invalidate_statistics()
+        
+        if success:
+            logger.info("Task deleted successfully: %s", task_id)
+        
+        return success
     
-    def get_tasks_paginated(self, query_params: TaskQueryParams, requesting_user: str) -> TaskListResponse:
-        """Get paginated list of tasks with filtering"""
-        try:
-            # Build filters
-            filters = self._build_filters_from_query(query_params, requesting_user)
+    @log_errors("getting paginated tasks", TASK_ERRORS)
+    def get_tasks_paginated(self, query_params: TaskQueryParams, requesting_user: str) -> Union[TaskListResponse, TaskSummaryListResponse]:
+        """
+        Get paginated list of tasks with filtering (summary view loads fewer columns)
+        
+        With query_params.cursor the page is fetched by keyset on (created_at, id)
+        and carries no total; pages sorted by created_at include next_cursor.
+        include_total=False skips counting for offset pages as well.
+        """
+        # Build filters
+        filters = self._build_filters_from_query(query_params, requesting_user)
+        
+        if query_params.sort_by not in SORT_COLUMNS:
+            raise TaskValidationError(f"Cannot sort tasks by '{query_params.sort_by}'")
+        
+        summary = query_params.view == "summary"
+        fields = TASK_SUMMARY_COLUMNS if summary else None
+        keyset_order = query_params.sort_by == 'created_at'
+        
+        if query_params.cursor:
+            if not keyset_order:
+                raise TaskValidationError("cursor pagination requires sort_by=created_at")
+            
+            try:
+                after = decode_cursor(query_params.cursor)
+            except ValueError as e:
+                raise TaskValidationError("Invalid pagination cursor") from e
             
+            rows, has_next = self.task_repository.get_page_after(
+                after=after,
+                size=query_params.size,
+                filters=filters,
+                sort_order=query_params.sort_order,
+                fields=fields
+            )
+            total_count = page = total_pages = None
+            has_previous = True
+        elif query_params.include_total:
             # Get paginated results
-            tasks, total_count = self.task_repository.get_paginated(
+            rows, total_count = self.task_repository.get_paginated(
                 page=query_params.page,
                 size=query_params.size,
                 filters=filters,
                 sort_by=query_params.sort_by,
-                sort_order=query_params.sort_order
+                sort_order=query_params.sort_order,
+                fields=fields
             )
             
-            # Convert to DTOs
-            task_responses = [TaskResponse.from_domain_model(task) for task in tasks]
-            
             # Calculate pagination metadata
+            page = query_params.page
             total_pages = (total_count + query_params.size - 1) // query_params.size
-            
-            return TaskListResponse(
-                tasks=task_responses,
-                total=total_count,
+            has_next = page < total_pages
+            has_previous = page > 1
+        else:
+            # Same page without counting every matching row
+            rows, has_next = self.task_repository.get_page(
                 page=query_params.page,
                 size=query_params.size,
-                total_pages=total_pages,
-                has_next=query_params.page < total_pages,
-                has_previous=query_params.page > 1
+                filters=filters,
+                sort_by=query_params.sort_by,
+                sort_order=query_params.sort_order,
+                fields=fields
             )
-            
-        except Exception as e:
-            logger.error(f"Error getting paginated tasks: {e}")
-            raise
+            page = query_params.page
+            total_count = total_pages = None
+            has_previous = page > 1
+        
+        # Convert to DTOs (overdue flag already computed by the query)
+        item_dto = TaskSummaryResponse if summary else TaskResponse
+        task_responses = [
+            item_dto.from_domain_model(task, is_overdue) for task, is_overdue in rows
+        ]
+        
+        next_cursor = encode_cursor(rows[-1][0]) if has_next and keyset_order and rows else None
+        
+        list_dto = TaskSummaryListResponse if summary else TaskListResponse
+        return list_dto(
+            tasks=task_responses,
+            total=total_count,
+            page=page,
+            size=query_params.size,
+            total_pages=total_pages,
+            has_next=has_next,
+            has_previous=has_previous,
+            next_cursor=next_cursor
+        )
     
+    @log_errors("getting tasks for user {user_id}", TASK_ERRORS)
     def get_user_tasks(self, user_id: str, include_created: bool = True, include_assigned: bool = True) -> List[TaskResponse]:
         """Get all tasks for a specific user"""
-        try:
-            tasks = self.task_repository.find_by_user(user_id, include_created, include_assigned)
-            return [TaskResponse.from_domain_model(task) for task in tasks]
-        except Exception as e:
-            logger.error(f"Error getting tasks for user {user_id}: {e}")
-            raise
+        tasks = self.task_repository.find_by_user(user_id, include_created, include_assigned)
+        return TaskResponse.from_domain_models(tasks)
     
+    @log_errors("getting task statistics", TASK_ERRORS)
     def get_task_statistics(self, user_id: Optional[str] = None) -> TaskStatsResponse:
         """Get task statistics (global or for specific user)"""
-        try:
-            if user_id:
-                # Get user-specific stats
-                user_tasks = self.task_repository.find_by_user(user_id)
-                stats = self._calculate_user_stats(user_tasks)
-            else:
-                # Get global stats
-                stats = self.task_repository.get_task_statistics()
-            
-            return TaskStatsResponse(**stats)
-            
-        except Exception as e:
-            logger.error(f"Error getting task statistics: {e}")
-            raise
+        if user_id:
+            # Get user-specific stats (aggregated by the database)
+            stats = self.task_repository.get_user_task_statistics(user_id)
+        else:
+            # Get global stats
+            stats = self.task_repository.get_task_statistics()
+        
+        return TaskStatsResponse(**stats)
     
+    @log_errors("completing task {task_id}", TASK_ERRORS)
     def complete_task(self, task_id: int, requesting_user: str) -> TaskResponse:
         """Mark task as completed"""
-        try:
-            task = self.task_repository.get_by_id(task_id)
-            
-            if not task:
-                raise TaskNotFoundError(f"Task with ID {task_id} not found")
-            
-            # Authorization check
-            if not self._can_user_modify_task(task, requesting_user):
-                raise UnauthorizedOperationError("User not authorized to complete this task")
-            
-            # Business logic
-            task.mark_as_completed()
-            
-            updated_task = self.task_repository.update(task)
-            logger.info(f"Task completed: {task_id}")
-            
-            return TaskResponse.from_domain_model(updated_task)
-            
-        except (TaskNotFoundError, UnauthorizedOperationError):
-            raise
-        except Exception as e:
-            logger.error(f"Error completing task {task_id}: {e}")
-            raise
+        # Authorization is part of the UPDATE's WHERE clause (creator or assignee)
+        if not self.task_repository.complete_if_authorized(task_id, requesting_user, utc_now()):
+            self._raise_update_failure(task_id, "User not authorized to complete this task")
+        self.task_repository.invalidate_statistics()
+        
+        logger.info("Task completed: %s", task_id)
+        return self._get_task_response(task_id)
     
+    @log_errors("assigning task {task_id} to {assignee_id}", TASK_ERRORS)
     def assign_task(self, task_id: int, assignee_id: str, requesting_user: str) -> TaskResponse:
         """Assign task to a user"""
-        try:
-            task = self.task_repository.get_by_id(task_id)
-            
-            if not task:
-                raise TaskNotFoundError(f"Task with ID {task_id} not found")
-            
-            # Authorization check - only creator can assign
-            if task.created_by != requesting_user:
-                raise UnauthorizedOperationError("Only task creator can assign tasks")
-            
-            # Business logic
-            task.assign_to_user(assignee_id)
-            
-            updated_task = self.task_repository.update(task)
-            logger.info(f"Task {task_id} assigned to {assignee_id}")
-            
-            return TaskResponse.from_domain_model(updated_task)
-            
-        except (TaskNotFoundError, UnauthorizedOperationError):
-            raise
-        except Exception as e:
-            logger.error(f"Error assigning task {task_id}: {e}")
-            raise
+        # Authorization is part of the UPDATE's WHERE clause - only creator can assign
+        if not self.task_repository.assign_if_creator(task_id, assignee_id, requesting_user):
+            self._raise_update_failure(task_id, "Only task creator can assign tasks")
+        self.task_repository.invalidate_statistics()
+        
+        logger.info("Task %s assigned to %s", task_id, assignee_id)
+        return self._get_task_response(task_id)
     
+    @log_errors("getting overdue tasks", TASK_ERRORS)
     def get_overdue_tasks(self, user_id: Optional[str] = None) -> List[TaskResponse]:
         """Get overdue tasks (global or for specific user)"""
-        try:
-            if user_id:
-                user_tasks = self.task_repository.find_by_user(user_id)
-                overdue_tasks = [task for task in user_tasks if task.is_overdue()]
-            else:
-                overdue_tasks = self.task_repository.find_overdue_tasks()
-            
-            return [TaskResponse.from_domain_model(task) for task in overdue_tasks]
-            
-        except Exception as e:
-            logger.error(f"Error getting overdue tasks: {e}")
-            raise
+        overdue_tasks = self.task_repository.find_overdue_tasks(user_id)
+        
+        # Every task here is overdue by construction
+        return TaskResponse.from_domain_models(overdue_tasks, is_overdue=True)
     
     # Private helper methods
     def _validate_create_request(self, request: CreateTaskRequest) -> None:
         """Validate task creation request"""
         # Check due date is not in the past
-        if request.due_date and request.due_date < datetime.utcnow():
+        if request.due_date and request.due_date < utc_now():
             raise TaskValidationError("Due date cannot be in the past")
         
         # High/Urgent priority tasks must have due date
-        if request.priority in [TaskPriority.HIGH, TaskPriority.URGENT] and not request.due_date:
+        if PRIORITY_FROM_DTO[request.priority] in HIGH_PRIORITIES and not request.due_date:
             raise TaskValidationError("High and urgent priority tasks must have a due date")
         
         # Check for duplicate titles for the same user (business rule)
-        existing_tasks = self.task_repository.find_by_criteria({
-            'created_by': request.created_by
-        })
-        
-        if any(task.title.lower() == request.title.lower() for task in existing_tasks):
+        if self.task_repository.title_exists_for_user(request.created_by, request.title):
             raise TaskValidationError(f"Task with title '{request.title}' already exists for this user")
     
+    def _get_task_response(self, task_id: int) -> TaskResponse:
+        """Reload a task after a conditional update and convert it"""
+        task = self.task_repository.get_by_id(task_id)
+        if not task:
+            raise TaskNotFoundError(f"Task with ID {task_id} not found")
+        return TaskResponse.from_domain_model(task)
+    
+    def _raise_update_failure(self, task_id: int, unauthorized_message: str) -> None:
+        """A conditional update matched no row: tell a missing task from a refused one"""
+        if not self.task_repository.get_by_id(task_id):
+            raise TaskNotFoundError(f"Task with ID {task_id} not found")
+        raise UnauthorizedOperationError(unauthorized_message)
+    
     def _can_user_access_task(self, task: Task, user_id: str) -> bool:
         """Check if user can access task"""
         return task.created_by == user_id or task.assigned_to == user_id
@@ -338,34 +360,28 @@ class TaskService:
             task.description = request.description
         
         if request.priority is not None:
-            task.priority = TaskPriority(request.priority.value)
+            task.priority = PRIORITY_FROM_DTO[request.priority]
         
         if request.assigned_to is not None:
             task.assign_to_user(request.assigned_to)
         
         if request.due_date is not None:
-            if request.due_date < datetime.utcnow():
+            if request.due_date < utc_now():
                 raise TaskValidationError("Due date cannot be in the past")
             task.due_date = request.due_date
         
         if request.status is not None:
             # Validate status transition
-            self._validate_status_transition(task.status, TaskStatus(request.status.value))
-            task.status = TaskStatus(request.status.value)
+            new_status = STATUS_FROM_DTO[request.status]
+            self._validate_status_transition(task.status, new_status)
+            task.status = new_status
             
-            if request.status.value == TaskStatus.COMPLETED.value:
+            if new_status == TaskStatus.COMPLETED:
                 task.mark_as_completed()
     
     def _validate_status_transition(self, current_status: TaskStatus, new_status: TaskStatus) -> None:
-        """Validate status transitions according to business rules"""
-        valid_transitions = {
-            TaskStatus.PENDING: [TaskStatus.IN_PROGRESS, TaskStatus.CANCELLED],
-            TaskStatus.IN_PROGRESS: [TaskStatus.COMPLETED, TaskStatus.PENDING, TaskStatus.CANCELLED],
-            TaskStatus.COMPLETED: [],  # Cannot transition from completed
-            TaskStatus.CANCELLED: [TaskStatus.PENDING]  # Can reopen cancelled tasks
-        }
-        
-        if new_status not in valid_transitions[current_status]:
+        """Validate status transitions according to business rules (see VALID_STATUS_TRANSITIONS)"""
+        if (current_status, new_status) not in VALID_STATUS_TRANSITIONS:
             raise TaskValidationError(
                 f"Invalid status transition from {current_status.value} to {new_status.value}"
             )
@@ -375,10 +391,10 @@ class TaskService:
         filters = {}
         
         if query_params.status:
-            filters['status'] = TaskStatus(query_params.status.value)
+            filters['status'] = STATUS_FROM_DTO[query_params.status]
         
         if query_params.priority:
-            filters['priority'] = TaskPriority(query_params.priority.value)
+            filters['priority'] = PRIORITY_FROM_DTO[query_params.priority]
         
         if query_params.assigned_to:
             filters['assigned_to'] = query_params.assigned_to
@@ -390,17 +406,3 @@ class TaskService:
             filters['user_access'] = requesting_user
         
         return filters
-    
-    def _calculate_user_stats(self, tasks: List[Task]) -> Dict[str, int]:
-        """Calculate statistics for a list of tasks"""
-        stats = {
-            'total_tasks': len(tasks),
-            'pending_tasks': sum(1 for t in tasks if t.status == TaskStatus.PENDING),
-            'in_progress_tasks': sum(1 for t in tasks if t.status == TaskStatus.IN_PROGRESS),
-            'completed_tasks': sum(1 for t in tasks if t.status == TaskStatus.COMPLETED),
-            'cancelled_tasks': sum(1 for t in tasks if t.status == TaskStatus.CANCELLED),
-            'overdue_tasks': sum(1 for t in tasks if t.is_overdue()),
-            'high_priority_tasks': sum(1 for t in tasks if t.priority in [TaskPriority.HIGH, TaskPriority.URGENT])
-        }
-        
-        return stats
@@ -4,18 +4,32 @@ Contains all user-related business rules and operations
 """
 
 from typing import List, Optional, Dict, Any
+from datetime import timedelta, timezone
 import hashlib
+import hmac
 import logging
 
+import bcrypt
+
 from ..models.user import User, UserRole, UserStatus
-from ..repositories.user_repository import UserRepository
+from ..models.task import utc_now
+from ..repositories.user_repository import UserRepository, SORT_COLUMNS
+from .pagination import encode_cursor, decode_cursor
+from .error_logging import log_errors
 from ..dto.user_dto import (
     CreateUserRequest, UpdateUserRequest, UserQueryParams,
-    UserResponse, UserListResponse, UserStatsResponse
+    UserResponse, UserListResponse, UserStatsResponse,
+    ROLE_FROM_DTO, STATUS_FROM_DTO, PASSWORD_MAX_BYTES
 )
 
 logger = logging.getLogger(__name__)
 
+# bcrypt work factor (2^12 rounds)
+BCRYPT_ROUNDS = 12
+
+# last_login is only rewritten once it is this old, so repeated logins skip the UPDATE
+LAST_LOGIN_RESOLUTION = timedelta(minutes=1)
+
 class UserNotFoundError(Exception):
     """Raised when a user is not found"""
     pass
@@ -28,6 +42,9 @@ class UnauthorizedUserOperationError(Exception):
     """Raised when user operation is not authorized"""
     pass
 
+# Business errors the controllers turn into HTTP responses; log_errors does not log them
+USER_ERRORS = (UserNotFoundError, UserValidationError, UnauthorizedUserOperationError)
+
 class UserService:
     """
     User Service implementing business logic for user management
@@ -37,7 +54,10 @@ class UserService:
     
     def __init__(self, user_repository: UserRepository):
         self.user_repository = user_repository
+        # Admin checks resolved once per service instance (one instance per request)
+        self._admin_checks: Dict[str, bool] = {}
     
+    @log_errors("creating user", USER_ERRORS)
     def create_user(self, request: CreateUserRequest, requesting_user: str = None) -> UserResponse:
         """
         Create a new user with business validation
@@ -48,53 +68,44 @@ class UserService:
         - Password must be hashed
         - Only admins can create admin users
         """
-        try:
-            # Business validation
-            self._validate_create_request(request, requesting_user)
-            
-            # Hash password (simplified - use proper hashing in production!)
-            password_hash = self._hash_password(request.password)
-            
-            # Create domain entity
-            user = User(
-                username=request.username,
-                email=request.email,
-                full_name=request.full_name,
-                password_hash=password_hash,
-                role=UserRole(request.role.value),
-                status=UserStatus.ACTIVE
-            )
-            
-            # Save to repository
-            created_user = self.user_repository.create(user)
-            
-            logger.info(f"User created successfully: {created_user.username}")
-            return UserResponse.from_domain_model(created_user)
-            
-        except Exception as e:
-            logger.error(f"Error creating user: {e}")
-            raise
+        # Business validation
+        self._validate_create_request(request, requesting_user)
+        
+        # Hash password
+        password_hash = self._hash_password(request.password)
+        
+        # Create domain entity
+        user = User(
+            username=request.username,
+            email=request.email,
+            full_name=request.full_name,
+            password_hash=password_hash,
+            role=ROLE_FROM_DTO[request.role],
+            status=UserStatus.ACTIVE
+        )
+        
+        # Save to repository
+        created_user = self.user_repository.create(user)
+        self.user_repository.invalidate_statistics()
+        
+        logger.info("User created successfully: %s", created_user.username)
+        return UserResponse.from_domain_model(created_user)
     
+    @log_errors("getting user {user_id}", USER_ERRORS)
     def get_user_by_id(self, user_id: int, requesting_user: str) -> UserResponse:
         """Get user by ID with authorization check"""
-        try:
-            user = self.user_repository.get_by_id(user_id)
-            
-            if not user:
-                raise UserNotFoundError(f"User with ID {user_id} not found")
-            
-            # Authorization check (users can see their own profile, admins can see all)
-            if not self._can_user_access_profile(user, requesting_user):
-                raise UnauthorizedUserOperationError("Not authorized to access this user profile")
-            
-            return UserResponse.from_domain_model(user)
-            
-        except (UserNotFoundError, UnauthorizedUserOperationError):
-            raise
-        except Exception as e:
-            logger.error(f"Error getting user {user_id}: {e}")
-            raise
+        user = self.user_repository.get_by_id(user_id)
+        
+        if not user:
+            raise UserNotFoundError(f"User with ID {user_id} not found")
+        
+        # Authorization check (users can see their own profile, admins can see all)
+        if not self._can_user_access_profile(user, requesting_user):
+            raise UnauthorizedUserOperationError("Not authorized to access this user profile")
+        
+        return UserResponse.from_domain_model(user)
     
+    @log_errors("updating user {user_id}", USER_ERRORS)
     def update_user(self, user_id: int, request: UpdateUserRequest, requesting_user: str) -> UserResponse:
         """
         Update user with business validation
@@ -104,31 +115,27 @@ class UserService:
         - Admins can update any user
         - Role changes require admin privileges
         """
-        try:
-            user = self.user_repository.get_by_id(user_id)
-            
-            if not user:
-                raise UserNotFoundError(f"User with ID {user_id} not found")
-            
-            # Authorization check
-            if not self._can_user_modify_profile(user, requesting_user, request):
-                raise UnauthorizedUserOperationError("Not authorized to modify this user")
-            
-            # Apply updates with validation
-            self._apply_user_updates(user, request, requesting_user)
-            
-            # Save changes
-            updated_user = self.user_repository.update(user)
-            
-            logger.info(f"User updated successfully: {user_id}")
-            return UserResponse.from_domain_model(updated_user)
-            
-        except (UserNotFoundError, UnauthorizedUserOperationError, UserValidationError):
-            raise
-        except Exception as e:
-            logger.error(f"Error updating user {user_id}: {e}")
-            raise
+        user = self.user_repository.get_by_id(user_id)
+        
+        if not user:
+            raise UserNotFoundError(f"User with ID {user_id} not found")
+        
+        # Authorization check
+        if not self._can_user_modify_profile(user, requesting_user, request):
+            raise UnauthorizedUserOperationError("Not authorized to modify this user")
+        
+        # Apply updates with validation
+        self._apply_user_updates(user, request, requesting_user)
+        
+        # Save changes
+        updated_user = self.user_repository.update(user)
+        self.user_repository.invalidate_statistics()
+        self.user_repository.invalidate_role(updated_user.username)
+        
+        logger.info("User updated successfully: %s", user_id)
+        return UserResponse.from_domain_model(updated_user)
     
+    @log_errors("deleting user {user_id}", USER_ERRORS)
     def delete_user(self, user_id: int, requesting_user: str) -> bool:
         """
         Soft delete user
@@ -138,44 +145,66 @@ class UserService:
         - Cannot delete yourself
         - Cannot delete other admins unless super admin
         """
-        try:
-            user = self.user_repository.get_by_id(user_id)
-            
-            if not user:
-                raise UserNotFoundError(f"User with ID {user_id} not found")
-            
-            # Authorization check - only admins can delete
-            requesting_user_obj = self.user_repository.find_by_username(requesting_user)
-            if not requesting_user_obj or not requesting_user_obj.is_admin():
-                raise UnauthorizedUserOperationError("Only admins can delete users")
-            
-            # Business rule - cannot delete yourself
-            if user.username == requesting_user:
-                raise UserValidationError("Cannot delete your own account")
-            
-            # Business rule - cannot delete other admins
-            if user.is_admin():
-                raise UserValidationError("Cannot delete admin users")
-            
-            success = self.user_repository.delete(user_id)
-            
-            if success:
-                logger.info(f"User deleted successfully: {user_id}")
-            
-            return success
-            
-        except (UserNotFoundError, UnauthorizedUserOperationError, UserValidationError):
-            raise
-        except Exception as e:
-            logger.error(f"Error deleting user {user_id}: {e}")
-            raise
+        user = self.user_repository.get_by_id(user_id)
+        
+        if not user:
+            raise UserNotFoundError(f"User with ID {user_id} not found")
+        
+        # Authorization check - only admins can delete
+        if not self._is_admin(requesting_user):
+            raise UnauthorizedUserOperationError("Only admins can delete users")
+        
+        # Business rule - cannot delete yourself
+        if user.username == requesting_user:
+            raise UserValidationError("Cannot delete your own account")
+        
+        # Business rule - cannot delete other admins
+        if user.is_admin():
+            raise UserValidationError("Cannot delete admin users")
+        
+        success = self.user_repository.delete(user_id)
+        self.user_repository.invalidate_statistics()
+        self.user_repository.invalidate_role(user.username)
+        
+        if success:
+            logger.info("User deleted successfully: %s", user_id)
+        
+        return success
     
+    @log_errors("getting paginated users", USER_ERRORS)
     def get_users_paginated(self, query_params: UserQueryParams, requesting_user: str) -> UserListResponse:
-        """Get paginated list of users with filtering"""
-        try:
-            # Build filters
-            filters = self._build_filters_from_query(query_params)
+        """
+        Get paginated list of users with filtering
+        
+        With query_params.cursor the page is fetched by keyset on (created_at, id)
+        and carries no total; pages sorted by created_at include next_cursor.
+        include_total=False skips the COUNT query for offset pages as well.
+        """
+        # Build filters
+        if query_params.sort_by not in SORT_COLUMNS:
+            raise UserValidationError(f"Cannot sort users by '{query_params.sort_by}'")
+        
+        filters = self._build_filters_from_query(query_params)
+        keyset_order = query_params.sort_by == 'created_at'
+        
+        if query_params.cursor:
+            if not keyset_order:
+                raise UserValidationError("cursor pagination requires sort_by=created_at")
             
+            try:
+                after = decode_cursor(query_params.cursor)
+            except ValueError as e:
+                raise UserValidationError("Invalid pagination cursor") from e
+            
+            users, has_next = self.user_repository.get_page_after(
+                after=after,
+                size=query_params.size,
+                filters=filters,
+                sort_order=query_params.sort_order
+            )
+            total_count = page = total_pages = None
+            has_previous = True
+        elif query_params.include_total:
             # Get paginated results
             users, total_count = self.user_repository.get_paginated(
                 page=query_params.page,
@@ -185,78 +214,102 @@ class UserService:
                 sort_order=query_params.sort_order
             )
             
-            # Convert to DTOs
-            user_responses = [UserResponse.from_domain_model(user) for user in users]
-            
             # Calculate pagination metadata
+            page = query_params.page
             total_pages = (total_count + query_params.size - 1) // query_params.size
-            
-            return UserListResponse(
-                users=user_responses,
-                total=total_count,
+            has_next = page < total_pages
+            has_previous = page > 1
+        else:
+            # Same page without the COUNT query
+            users, has_next = self.user_repository.get_page(
                 page=query_params.page,
                 size=query_params.size,
-                total_pages=total_pages,
-                has_next=query_params.page < total_pages,
-                has_previous=query_params.page > 1
+                filters=filters,
+                sort_by=query_params.sort_by,
+                sort_order=query_params.sort_order
             )
-            
-        except Exception as e:
-            logger.error(f"Error getting paginated users: {e}")
-            raise
+            page = query_params.page
+            total_count = total_pages = None
+            has_previous = page > 1
+        
+        # Convert to DTOs
+        user_responses = UserResponse.from_domain_models(users)
+        
+        next_cursor = encode_cursor(users[-1]) if has_next and keyset_order and users else None
+        
+        return UserListResponse(
+            users=user_responses,
+            total=total_count,
+            page=page,
+            size=query_params.size,
+            total_pages=total_pages,
+            has_next=has_next,
+            has_previous=has_previous,
+            next_cursor=next_cursor
+        )
     
+    @log_errors("getting user statistics", USER_ERRORS)
     def get_user_statistics(self, requesting_user: str) -> UserStatsResponse:
         """Get user statistics (admin only)"""
-        try:
-            # Authorization check - only admins can view stats
-            requesting_user_obj = self.user_repository.find_by_username(requesting_user)
-            if not requesting_user_obj or not requesting_user_obj.is_admin():
-                raise UnauthorizedUserOperationError("Only admins can view user statistics")
-            
-            stats = self.user_repository.get_user_statistics()
-            return UserStatsResponse(**stats)
-            
-        except UnauthorizedUserOperationError:
-            raise
-        except Exception as e:
-            logger.error(f"Error getting user statistics: {e}")
-            raise
+        # Authorization check - only admins can view stats
+        if not self._is_admin(requesting_user):
+            raise UnauthorizedUserOperationError("Only admins can view user statistics")
+        
+        stats = self.user_repository.get_user_statistics()
+        return UserStatsResponse(**stats)
     
+    @log_errors("authenticating user {username}", USER_ERRORS)
     def authenticate_user(self, username: str, password: str) -> Optional[UserResponse]:
         """Authenticate user credentials"""
-        try:
-            user = self.user_repository.find_by_username(username)
-            
-            if not user or not user.is_active_user():
-                return None
-            
-            # Verify password (simplified)
-            if self._verify_password(password, user.password_hash):
-                user.update_last_login()
-                self.user_repository.update(user)
-                return UserResponse.from_domain_model(user)
-            
+        user = self.user_repository.find_by_username(username)
+        
+        if not user or not user.is_active_user():
             return None
-            
-        except Exception as e:
-            logger.error(f"Error authenticating user {username}: {e}")
-            raise
+        
+        # Verify password
+        if self._verify_password(password, user.password_hash):
+            needs_write = False
+            if self._is_legacy_hash(user.password_hash) and len(password.encode()) <= PASSWORD_MAX_BYTES:
+                # Upgrade the unsalted SHA-256 hash while the plain password is at hand
+                user.password_hash = self._hash_password(password)
+                needs_write = True
+            
+            now = utc_now()
+            last_login = user.last_login
+            if last_login is not None and last_login.tzinfo is not None:
+                # DateTime(timezone=True) loads back aware on PostgreSQL; compare as naive UTC
+                last_login = last_login.astimezone(timezone.utc).replace(tzinfo=None)
+            if last_login is None or now - last_login >= LAST_LOGIN_RESOLUTION:
+                user.update_last_login(now)
+                needs_write = True
+            
+            if needs_write:
+                self.user_repository.update(user)
+            return UserResponse.from_domain_model(user)
+        
+        return None
     
     # Private helper methods
+    def _is_admin(self, username: str) -> bool:
+        """Whether the (requesting) user is an active admin, resolved once per request"""
+        if username not in self._admin_checks:
+            self._admin_checks[username] = self.user_repository.get_role(username) == UserRole.ADMIN
+        return self._admin_checks[username]
+    
     def _validate_create_request(self, request: CreateUserRequest, requesting_user: str = None) -> None:
         """Validate user creation request"""
-        # Check username uniqueness
-        if self.user_repository.find_by_username(request.username):
+        # Check username and email uniqueness with one query; the username
+        # conflict is reported first. Compared caseless like the column collation.
+        conflicts = self.user_repository.find_conflicts(username=request.username, email=request.email)
+        username = request.username.casefold()
+        if any(existing_username.casefold() == username for existing_username, _ in conflicts):
             raise UserValidationError(f"Username '{request.username}' already exists")
-        
-        # Check email uniqueness
-        if self.user_repository.find_by_email(request.email):
+        if conflicts:
             raise UserValidationError(f"Email '{request.email}' already exists")
         
         # Only admins can create admin users
-        if request.role == UserRole.ADMIN and requesting_user:
-            requesting_user_obj = self.user_repository.find_by_username(requesting_user)
-            if not requesting_user_obj or not requesting_user_obj.is_admin():
+        if ROLE_FROM_DTO[request.role] == UserRole.ADMIN and requesting_user:
+            if not self._is_admin(requesting_user):
                 raise UnauthorizedUserOperationError("Only admins can create admin users")
     
     def _can_user_access_profile(self, user: User, requesting_user: str) -> bool:
@@ -266,21 +319,18 @@ class UserService:
             return True
         
         # Admins can see all profiles
-        requesting_user_obj = self.user_repository.find_by_username(requesting_user)
-        return requesting_user_obj and requesting_user_obj.is_admin()
+        return self._is_admin(requesting_user)
     
     def _can_user_modify_profile(self, user: User, requesting_user: str, request: UpdateUserRequest) -> bool:
         """Check if user can modify profile"""
-        requesting_user_obj = self.user_repository.find_by_username(requesting_user)
-        
         # Users can modify their own profile (except role)
         if user.username == requesting_user:
             if request.role is not None:  # Role change requires admin
-                return requesting_user_obj and requesting_user_obj.is_admin()
+                return self._is_admin(requesting_user)
             return True
         
         # Admins can modify any profile
-        return requesting_user_obj and requesting_user_obj.is_admin()
+        return self._is_admin(requesting_user)
     
     def _apply_user_updates(self, user: User, request: UpdateUserRequest, requesting_user: str) -> None:
         """Apply updates to user with validation"""
@@ -289,26 +339,25 @@ class UserService:
         
         if request.email is not None:
             # Check email uniqueness
-            existing_user = self.user_repository.find_by_email(request.email)
-            if existing_user and existing_user.id != user.id:
+            if self.user_repository.find_conflicts(email=request.email, exclude_id=user.id):
                 raise UserValidationError(f"Email '{request.email}' already exists")
             user.email = request.email
         
         if request.role is not None:
-            user.role = UserRole(request.role.value)
+            user.role = ROLE_FROM_DTO[request.role]
         
         if request.status is not None:
-            user.status = UserStatus(request.status.value)
+            user.status = STATUS_FROM_DTO[request.status]
     
     def _build_filters_from_query(self, query_params: UserQueryParams) -> Dict[str, Any]:
         """Build filters dictionary from query parameters"""
         filters = {}
         
         if query_params.role:
-            filters['role'] = UserRole(query_params.role.value)
+            filters['role'] = ROLE_FROM_DTO[query_params.role]
         
         if query_params.status:
-            filters['status'] = UserStatus(query_params.status.value)
+            filters['status'] = STATUS_FROM_DTO[query_params.status]
         
         if query_params.search:
             filters['search'] = query_params.search
@@ -316,9 +365,19 @@ class UserService:
         return filters
     
     def _hash_password(self, password: str) -> str:
-        """Hash password (simplified - use bcrypt in production!)"""
-        return hashlib.sha256(password.encode()).hexdigest()
+        """Hash password with bcrypt (salted, BCRYPT_ROUNDS work factor)"""
+        return bcrypt.hashpw(password.encode(), bcrypt.gensalt(BCRYPT_ROUNDS)).decode()
     
     def _verify_password(self, password: str, password_hash: str) -> bool:
-        """Verify password against hash"""
-        return self._hash_password(password) == password_hash
+        """Verify password against a bcrypt hash, or a legacy unsalted SHA-256 hex digest"""
+        if self._is_legacy_hash(password_hash):
+            legacy_hash = hashlib.sha256(password.encode()).hexdigest()
+            return hmac.compare_digest(legacy_hash, password_hash)
+        if len(password.encode()) > PASSWORD_MAX_BYTES:
+            # No password that long was ever accepted for a bcrypt hash
+            return False
+        return bcrypt.checkpw(password.encode(), password_hash.encode())
+    
+    def _is_legacy_hash(self, password_hash: str) -> bool:
+        """Hashes stored before bcrypt are SHA-256 hex digests (bcrypt hashes start with '$2')"""
+        return not password_hash.startswith("$2")
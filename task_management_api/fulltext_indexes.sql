@@ -0,0 +1,9 @@
+-- FULLTEXT indexes behind FULLTEXT_SEARCH=true (MySQL 5.7.6+ InnoDB, ngram parser).
+-- create_all() only creates them for new tables; run this once on an existing database
+-- before enabling FULLTEXT_SEARCH, otherwise searches fail with error 1191.
+
+ALTER TABLE users
+    ADD FULLTEXT INDEX ix_user_search_fulltext (username, full_name, email) WITH PARSER ngram;
+
+ALTER TABLE tasks
+    ADD FULLTEXT INDEX ix_task_title_description_fulltext (title, description) WITH PARSER ngram;
@@ -5,16 +5,17 @@ Demonstrates Controller-Service-Repository pattern with dependency injection
 # Load environment variables from .env file
 from dotenv import load_dotenv
 load_dotenv()
-from fastapi import FastAPI, Depends
+from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy.orm import Session
+from fastapi.middleware.gzip import GZipMiddleware
+from concurrent.futures import ThreadPoolExecutor
+import anyio.to_thread
 import logging
+import os
 import uvicorn
 
 # Import application components
-from app.database import get_db, create_tables
-from app.repositories.task_repository import TaskRepository
-from app.services.task_service import TaskService
+from app.database import create_tables
 from app.controllers.task_controller import router as task_router
 from app.controllers.user_controller import router as user_router
 
@@ -42,42 +43,45 @@ class TaskManagementAPI:
             redoc_url="/redoc"
         )
         
-        self._setup_middleware()
-        self._setup_database()
-        self._setup_dependencies()
-        self._setup_routes()
+        # create_tables() waits on DDL round-trips; the rest of the setup is in-process
+        # and independent of it, so it runs meanwhile. Errors surface from result().
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            database_ready = executor.submit(self._setup_database)
+            self._setup_middleware()
+            self._setup_threadpool()
+            self._setup_routes()
+            database_ready.result()
     
     def _setup_middleware(self):
         """Setup FastAPI middleware"""
+        # Comma-separated CORS_ORIGINS; an explicit list is matched by membership instead
+        # of echoing back whatever Origin the request sends
+        origins = [origin.strip() for origin in os.getenv("CORS_ORIGINS", "*").split(",") if origin.strip()]
         self.app.add_middleware(
             CORSMiddleware,
-            allow_origins=["*"],  # Configure appropriately for production
+            allow_origins=origins,
             allow_credentials=True,
             allow_methods=["*"],
             allow_headers=["*"],
         )
+        
+        # Compress list responses (repeated keys/enum values compress well);
+        # small bodies such as a single task are sent as-is
+        self.app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+    
+    def _setup_threadpool(self):
+        """Size the threadpool that runs the sync (DB-bound) route handlers"""
+        
+        @self.app.on_event("startup")
+        async def configure_threadpool():
+            limiter = anyio.to_thread.current_default_thread_limiter()
+            limiter.total_tokens = int(os.getenv("THREADPOOL_SIZE", "200"))
     
     def _setup_database(self):
         """Initialize database"""
         create_tables()
         logger.info("Database tables created successfully")
     
-    def _setup_dependencies(self):
-        """Setup dependency injection"""
-        
-        def get_task_repository(db: Session = Depends(get_db)) -> TaskRepository:
-            """Factory function for TaskRepository"""
-            return TaskRepository(db)
-        
-        def get_task_service(
-            task_repository: TaskRepository = Depends(get_task_repository)
-        ) -> TaskService:
-            """Factory function for TaskService"""
-            return TaskService(task_repository)
-        
-        # Store dependency factories for use in routes
-        self.get_task_service = get_task_service
-    
     def _setup_routes(self):
         """Setup application routes"""
         
@@ -126,6 +130,7 @@ if __name__ == "__main__":
     
     For development: python main.py
     For production: gunicorn main:app -w 4 -k uvicorn.workers.UvicornWorker
+                    or uvicorn main:app --workers $(nproc)
     """
     
     logger.info("Starting Task Management API...")
@@ -134,6 +139,6 @@ if __name__ == "__main__":
         "main:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,  # Enable auto-reload for development
-        log_level="info"
+        reload=os.getenv("RELOAD", "false").lower() == "true",  # File watcher for development only
+        log_level="info"  # loop/http stay "auto": uvloop/httptools when installed
     )
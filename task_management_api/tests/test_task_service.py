@@ -7,11 +7,16 @@ import pytest
 from datetime import datetime, timedelta
 from unittest.mock import Mock, MagicMock
 
-from app.services.task_service import TaskService, TaskNotFoundError, TaskValidationError
+from app.services.task_service import (
+    TaskService, TaskNotFoundError, TaskValidationError, UnauthorizedOperationError, encode_cursor
+)
 from app.repositories.task_repository import TaskRepository
 from app.models.task import Task, TaskStatus, TaskPriority
-from app.dto.task_dto import CreateTaskRequest, UpdateTaskRequest, TaskPriorityDTO, TaskStatusDTO
+from app.dto.task_dto import CreateTaskRequest, UpdateTaskRequest, TaskQueryParams, TaskPriorityDTO, TaskStatusDTO
 
+# Attribute names of TaskRepository, listed once: a name-list spec restricts the mocks
+# the same way without introspecting the class again for every test
+TASK_REPOSITORY_SPEC = dir(TaskRepository)
 
 class TestTaskService:
     """Test suite for TaskService"""
@@ -19,7 +24,7 @@ class TestTaskService:
     @pytest.fixture
     def mock_repository(self):
         """Create mock repository"""
-        return Mock(spec=TaskRepository)
+        return Mock(spec=TASK_REPOSITORY_SPEC)
     
     @pytest.fixture
     def task_service(self, mock_repository):
@@ -60,7 +65,7 @@ class TestTaskService:
             status=TaskStatus.PENDING
         )
         
-        mock_repository.find_by_criteria.return_value = []  # No existing tasks
+        mock_repository.title_exists_for_user.return_value = False  # No existing task with this title
         mock_repository.create.return_value = mock_task
         
         # Act
@@ -144,16 +149,27 @@ class TestTaskService:
     def test_complete_task_success(self, task_service, mock_repository, sample_task):
         """Test successful task completion"""
         # Arrange
+        sample_task.mark_as_completed()  # State after the conditional UPDATE
+        mock_repository.complete_if_authorized.return_value = True
         mock_repository.get_by_id.return_value = sample_task
-        mock_repository.update.return_value = sample_task
         
         # Act
         result = task_service.complete_task(1, "user1")
         
         # Assert
-        assert sample_task.status == TaskStatus.COMPLETED
-        assert sample_task.completed_at is not None
-        mock_repository.update.assert_called_once()
+        assert result.status == TaskStatusDTO.COMPLETED
+        assert mock_repository.complete_if_authorized.call_args.args[:2] == (1, "user1")
+        mock_repository.update.assert_not_called()
+    
+    def test_complete_task_unauthorized(self, task_service, mock_repository, sample_task):
+        """Test completion refused by the update predicate for an existing task"""
+        # Arrange
+        mock_repository.complete_if_authorized.return_value = False
+        mock_repository.get_by_id.return_value = sample_task
+        
+        # Act & Assert
+        with pytest.raises(UnauthorizedOperationError):
+            task_service.complete_task(1, "someone_else")
     
     def test_delete_task_success(self, task_service, mock_repository, sample_task):
         """Test successful task deletion"""
@@ -189,3 +205,91 @@ class TestTaskService:
         assert result.total_tasks == 10
         assert result.pending_tasks == 3
         assert result.completed_tasks == 2
+    
+    def test_get_task_statistics_for_user_uses_aggregate(self, task_service, mock_repository):
+        """Test user-scoped statistics come from the repository aggregate, not loaded tasks"""
+        # Arrange
+        mock_repository.get_user_task_statistics.return_value = {
+            'total_tasks': 4,
+            'pending_tasks': 1,
+            'in_progress_tasks': 1,
+            'completed_tasks': 1,
+            'cancelled_tasks': 1,
+            'overdue_tasks': 1,
+            'high_priority_tasks': 2
+        }
+        
+        # Act
+        result = task_service.get_task_statistics("user1")
+        
+        # Assert
+        mock_repository.get_user_task_statistics.assert_called_once_with("user1")
+        mock_repository.find_by_user.assert_not_called()
+        assert result.total_tasks == 4
+        assert result.high_priority_tasks == 2
+    
+    def test_get_tasks_paginated_uses_query_overdue_flag(self, task_service, mock_repository, sample_task):
+        """Test paginated tasks take is_overdue from the repository rows"""
+        # Arrange
+        mock_repository.get_paginated.return_value = ([(sample_task, True)], 1)
+        
+        # Act
+        result = task_service.get_tasks_paginated(TaskQueryParams(page=1, size=10), "user1")
+        
+        # Assert
+        assert result.total == 1
+        assert result.tasks[0].id == sample_task.id
+        assert result.tasks[0].is_overdue is True
+        assert result.has_next is False
+    
+    def test_get_tasks_paginated_without_total_skips_count(self, task_service, mock_repository, sample_task):
+        """Test include_total=False fetches the page without a total"""
+        # Arrange
+        mock_repository.get_page.return_value = ([(sample_task, False)], True)
+        
+        # Act
+        result = task_service.get_tasks_paginated(TaskQueryParams(page=1, size=1, include_total=False), "user1")
+        
+        # Assert
+        mock_repository.get_paginated.assert_not_called()
+        assert result.total is None
+        assert result.total_pages is None
+        assert result.has_next is True
+        assert result.has_previous is False
+    
+    def test_get_tasks_paginated_with_cursor_uses_keyset(self, task_service, mock_repository, sample_task):
+        """Test a cursor page is fetched by keyset and links to the next page"""
+        # Arrange
+        mock_repository.get_page_after.return_value = ([(sample_task, False)], True)
+        cursor = encode_cursor(sample_task)
+        
+        # Act
+        result = task_service.get_tasks_paginated(TaskQueryParams(size=1, cursor=cursor), "user1")
+        
+        # Assert
+        after = mock_repository.get_page_after.call_args.kwargs["after"]
+        assert after == (sample_task.created_at, sample_task.id)
+        mock_repository.get_paginated.assert_not_called()
+        assert result.total is None
+        assert result.has_next is True
+        assert result.next_cursor == cursor
+    
+    def test_get_tasks_paginated_rejects_unknown_sort_field(self, task_service, mock_repository):
+        """Test sorting is limited to whitelisted task columns"""
+        with pytest.raises(TaskValidationError):
+            task_service.get_tasks_paginated(TaskQueryParams(sort_by="is_overdue"), "user1")
+        mock_repository.get_paginated.assert_not_called()
+    
+    def test_get_tasks_paginated_invalid_cursor(self, task_service, mock_repository):
+        """Test a malformed cursor is rejected as a validation error"""
+        with pytest.raises(TaskValidationError):
+            task_service.get_tasks_paginated(TaskQueryParams(cursor="not-a-cursor"), "user1")
+    
+    def test_unexpected_error_is_logged_with_task_id(self, task_service, mock_repository, caplog):
+        """Unexpected errors are re-raised and logged with the id of the task involved"""
+        mock_repository.get_by_id.side_effect = RuntimeError("connection lost")
+        
+        with pytest.raises(RuntimeError):
+            task_service.get_task_by_id(42, "user1")
+        
+        assert "Error getting task 42" in caplog.text
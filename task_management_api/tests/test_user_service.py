@@ -0,0 +1,102 @@
+"""
+Tests for UserService - Business Logic Layer
+"""
+
+import hashlib
+import pytest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock
+from pydantic import ValidationError
+
+from app.services.user_service import UserService
+from app.repositories.user_repository import UserRepository
+from app.models.user import User, UserRole, UserStatus
+from app.dto.user_dto import CreateUserRequest
+
+
+# Attribute names of UserRepository, listed once (see TASK_REPOSITORY_SPEC)
+USER_REPOSITORY_SPEC = dir(UserRepository)
+
+
+class TestUserService:
+    """Test suite for UserService"""
+    
+    @pytest.fixture
+    def mock_repository(self):
+        """Create mock repository"""
+        return Mock(spec=USER_REPOSITORY_SPEC)
+    
+    @pytest.fixture
+    def user_service(self, mock_repository):
+        """Create UserService with mock repository"""
+        return UserService(mock_repository)
+    
+    def _active_user(self, user_service, last_login):
+        """Active user with a bcrypt hash of 'secret'"""
+        return User(
+            id=1,
+            username="user1",
+            email="user1@example.com",
+            full_name="User One",
+            password_hash=user_service._hash_password("secret"),
+            role=UserRole.USER,
+            status=UserStatus.ACTIVE,
+            is_deleted=False,
+            last_login=last_login
+        )
+    
+    def test_authenticate_user_recent_aware_last_login_skips_write(self, user_service, mock_repository):
+        """A timezone-aware last_login (as PostgreSQL loads it) within the resolution is not rewritten"""
+        last_login = datetime.now(timezone.utc) - timedelta(seconds=10)
+        mock_repository.find_by_username.return_value = self._active_user(user_service, last_login)
+        
+        result = user_service.authenticate_user("user1", "secret")
+        
+        assert result is not None
+        mock_repository.update.assert_not_called()
+    
+    def test_authenticate_user_stale_aware_last_login_is_updated(self, user_service, mock_repository):
+        """A timezone-aware last_login older than the resolution is rewritten"""
+        last_login = datetime.now(timezone.utc) - timedelta(hours=1)
+        user = self._active_user(user_service, last_login)
+        mock_repository.find_by_username.return_value = user
+        mock_repository.update.return_value = user
+        
+        result = user_service.authenticate_user("user1", "secret")
+        
+        assert result is not None
+        mock_repository.update.assert_called_once_with(user)
+        assert user.last_login > last_login.replace(tzinfo=None)
+    
+    def test_authenticate_user_upgrades_legacy_sha256_hash(self, user_service, mock_repository):
+        """A legacy unsalted SHA-256 hash is verified, then replaced with a bcrypt hash"""
+        user = self._active_user(user_service, datetime.now(timezone.utc))
+        user.password_hash = hashlib.sha256(b"secret").hexdigest()
+        mock_repository.find_by_username.return_value = user
+        mock_repository.update.return_value = user
+        
+        result = user_service.authenticate_user("user1", "secret")
+        
+        assert result is not None
+        mock_repository.update.assert_called_once_with(user)
+        assert user.password_hash.startswith("$2")
+        assert user_service._verify_password("secret", user.password_hash)
+    
+    def test_authenticate_user_rejects_password_longer_than_bcrypt_limit(self, user_service, mock_repository):
+        """A password over 72 bytes fails authentication instead of raising"""
+        mock_repository.find_by_username.return_value = self._active_user(user_service, None)
+        
+        result = user_service.authenticate_user("user1", "x" * 80)
+        
+        assert result is None
+        mock_repository.update.assert_not_called()
+    
+    def test_create_user_request_rejects_password_longer_than_72_bytes(self):
+        """The 72-byte limit counts UTF-8 bytes, not characters"""
+        fields = dict(username="user1", email="user1@example.com", full_name="User One")
+        
+        CreateUserRequest(password="x" * 72, **fields)
+        with pytest.raises(ValidationError):
+            CreateUserRequest(password="x" * 80, **fields)
+        with pytest.raises(ValidationError):
+            CreateUserRequest(password="é" * 37, **fields)